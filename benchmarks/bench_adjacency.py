@@ -0,0 +1,50 @@
+"""
+Замер стоимости добавления, проверки наличия и удаления рёбер
+у вершины с большой степенью.
+
+Запуск: python -m benchmarks.bench_adjacency [степень]
+"""
+import sys
+from timeit import default_timer
+
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+
+
+def bench(graph_class, degree: int):
+    gr = graph_class("HubGraph")
+    gr.add_node("hub")
+    leaves = ["leaf%d" % i for i in range(degree)]
+    for leaf in leaves:
+        gr.add_node(leaf)
+
+    started = default_timer()
+    for leaf in leaves:
+        gr.add_edge(("hub", leaf))
+    add_time = default_timer() - started
+
+    started = default_timer()
+    for leaf in leaves:
+        gr.has_edge(("hub", leaf))
+    has_time = default_timer() - started
+
+    started = default_timer()
+    for leaf in leaves:
+        gr.del_edge(("hub", leaf))
+    del_time = default_timer() - started
+
+    return add_time, has_time, del_time
+
+
+def main():
+    degree = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("Степень вершины: %d, время на операцию в микросекундах" % degree)
+    print("%-10s %10s %10s %10s" % ("класс", "add_edge", "has_edge", "del_edge"))
+    for graph_class in (Graph, DiGraph):
+        times = bench(graph_class, degree)
+        print("%-10s %10.2f %10.2f %10.2f" % ((graph_class.__name__,) +
+                                              tuple(t / degree * 1e6 for t in times)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Сравнение памяти, занимаемой графом при словарном и колоночном
+хранении атрибутов.
+
+Запуск: python -m benchmarks.bench_attributes_memory [вершин] [рёбер]
+"""
+import sys
+import tracemalloc
+from random import Random
+
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+
+
+def measure(graph_class, columnar: bool, nodes: list, edges: list) -> int:
+    tracemalloc.start()
+    gr = graph_class("MemoryGraph", weighted=True, columnar=columnar)
+    gr.add_nodes_from(nodes)
+    gr.add_edges_from(edges)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    nodes_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    edges_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    rnd = Random(0)
+    names = ["node%d" % i for i in range(nodes_count)]
+    labels = ["road", "rail", "air"]
+    nodes = [(name, rnd.randint(1, 100), "", {"x": rnd.random()}) for name in names]
+    pairs = set()
+    while len(pairs) < edges_count:
+        u, v = rnd.sample(names, 2)
+        if (v, u) not in pairs:
+            pairs.add((u, v))
+    edges = [(u, v, rnd.randint(1, 1000), rnd.choice(labels)) for u, v in sorted(pairs)]
+
+    print("Вершин: %d, рёбер: %d, байт на ребро" % (nodes_count, edges_count))
+    print("%-10s %10s %10s %8s" % ("класс", "словари", "колонки", "выигрыш"))
+    for graph_class in (Graph, DiGraph):
+        dict_size = measure(graph_class, False, nodes, edges)
+        columnar_size = measure(graph_class, True, nodes, edges)
+        print("%-10s %10.0f %10.0f %7.1fx" % (graph_class.__name__,
+                                              dict_size / edges_count,
+                                              columnar_size / edges_count,
+                                              dict_size / columnar_size))
+
+
+if __name__ == "__main__":
+    main()
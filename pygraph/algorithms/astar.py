@@ -0,0 +1,71 @@
+from heapq import heappush, heappop
+from math import hypot
+from pygraph.exceptions import NodeNotFoundError, AlgorithmError
+from pygraph.algorithms.bfs import _restore_path
+
+
+def astar(graph, start_node, goal_node, heuristic=None) -> list:
+    """
+    Поиск кратчайшего по сумме весов рёбер пути от стартовой вершины до целевой алгоритмом A*.
+    Возвращает список пройденных вершин или None если вершина недостижима.
+
+    heuristic(attrs, goal_attrs) получает атрибуты очередной вершины и целевой вершины
+    и возвращает нижнюю оценку оставшегося расстояния. Оценка должна быть допустимой
+    и согласованной (не больше веса ребра плюс оценки для соседа), иначе найденный путь
+    может оказаться не кратчайшим. Без эвристики поиск сводится к алгоритму Дейкстры.
+    Веса рёбер должны быть неотрицательными.
+    """
+    if not graph.has_node(start_node):
+        raise NodeNotFoundError(start_node)
+    if not graph.has_node(goal_node):
+        raise NodeNotFoundError(goal_node)
+
+    if heuristic is None:
+        def estimate(node):
+            return 0
+    else:
+        goal_attrs = graph.get_node_attributes(goal_node)
+
+        def estimate(node):
+            return heuristic(graph.get_node_attributes(node), goal_attrs)
+
+    # Открытое множество - куча (оценка полного пути, счётчик, вершина) с ленивым удалением,
+    # закрытое - вершины, расстояние до которых уже окончательно установлено
+    closed = set()
+    distances = {start_node: 0}
+    parents = {start_node: None}
+    heap = [(estimate(start_node), 0, start_node)]
+    counter = 1
+    while heap:
+        _, _, node = heappop(heap)
+        if node in closed:
+            continue
+        if node == goal_node:
+            return _restore_path(parents, goal_node)
+        closed.add(node)
+        distance = distances[node]
+        for neighbour, weight in graph._weighted_neighbors(node):
+            if weight < 0:
+                raise AlgorithmError("Ребро (%s, %s) имеет отрицательный вес %s" % (node, neighbour, weight))
+            if neighbour in closed:
+                continue
+            candidate = distance + weight
+            if neighbour not in distances or candidate < distances[neighbour]:
+                distances[neighbour] = candidate
+                parents[neighbour] = node
+                heappush(heap, (candidate + estimate(neighbour), counter, neighbour))
+                counter += 1
+
+    return None
+
+
+def euclidean_heuristic(x_key: str = "x", y_key: str = "y"):
+    """
+    Возвращает эвристику для astar(), оценивающую расстояние по прямой
+    между вершинами по их координатам из указанных атрибутов.
+    Допустима, если вес ребра не меньше расстояния между его концами.
+    """
+    def heuristic(attrs, goal_attrs):
+        return hypot(attrs[x_key] - goal_attrs[x_key], attrs[y_key] - goal_attrs[y_key])
+
+    return heuristic
@@ -1,27 +1,44 @@
+from collections import deque
 from pygraph.exceptions import NodeNotFoundError
+from pygraph.algorithms.paths import iter_paths
 
 
-def breadth_first_bypass(graph, start_node) -> list:
+def iter_breadth_first_bypass(graph, start_node):
     """
-    Обход графа в ширину.
-    Возвращает список пройденных вершин в порядке их обхода.
+    Ленивый обход графа в ширину.
+    Генератор выдаёт вершины в порядке обхода, поэтому обход можно прервать,
+    не посещая оставшуюся часть графа. Граф нельзя изменять во время обхода.
     """
     if not graph.has_node(start_node):
         raise NodeNotFoundError(start_node)
+    return _breadth_first_bypass(graph, start_node)
+
 
-    visited, queue = [], [start_node]
+def _breadth_first_bypass(graph, start_node):
+    # Вершина помечается посещённой при постановке в очередь,
+    # поэтому каждая вершина и каждое ребро рассматриваются один раз: O(V + E)
+    visited = {start_node}
+    queue = deque([start_node])
     while queue:
-        node = queue.pop(0)
-        if node not in visited:
-            visited.append(node)
-            node_neighbours = set(x for x in graph[node])
-            queue.extend(node_neighbours.difference(visited))
-    return visited
+        node = queue.popleft()
+        yield node
+        for neighbour in graph[node]:
+            if neighbour not in visited:
+                visited.add(neighbour)
+                queue.append(neighbour)
+
+
+def breadth_first_bypass(graph, start_node) -> list:
+    """
+    Обход графа в ширину.
+    Возвращает список пройденных вершин в порядке их обхода.
+    """
+    return list(iter_breadth_first_bypass(graph, start_node))
 
 
 def breadth_first_search(graph, start_node, target_node) -> list:
     """
-    Поиск пути от стартовой вершины до конечной.
+    Поиск кратчайшего по числу рёбер пути от стартовой вершины до конечной.
     Возвращает список пройденных вершин или None если вершина недостижима.
     """
     if not graph.has_node(start_node):
@@ -29,40 +46,73 @@ def breadth_first_search(graph, start_node, target_node) -> list:
     if not graph.has_node(target_node):
         raise NodeNotFoundError(target_node)
 
-    queue = [(start_node, [start_node])]  # (node, [path_to_target])
+    # Как и прежде, путь из вершины в неё саму не ищется
+    if start_node == target_node:
+        return None
+
+    # Для каждой достигнутой вершины запоминается только её предшественник,
+    # сам путь восстанавливается один раз - когда цель найдена
+    parents = {start_node: None}
+    queue = deque([start_node])
     while queue:
-        (node, path) = queue.pop(0)
-        # Проход по всем соседям за исключением тех кого уже обошли
-        node_neighbours = set(x for x in graph[node])
-        for neighbour in node_neighbours - set(path):
-            if neighbour == target_node:
-                return path + [neighbour]
-            else:
-                queue.append((neighbour, path + [neighbour]))
+        node = queue.popleft()
+        if node == target_node:
+            return _restore_path(parents, target_node)
+        for neighbour in graph[node]:
+            if neighbour not in parents:
+                parents[neighbour] = node
+                queue.append(neighbour)
 
     return None
 
 
-def breadth_first_paths(graph, start_node, target_node) -> list:
+def shortest_path_length(graph, start_node, target_node):
     """
-    Поиск всех путей от стартовой вершины до конечной.
-    Возвращает список путей, где каждый путь - набор пройденных вершин.
+    Возвращает длину кратчайшего по числу рёбер пути от стартовой вершины до конечной
+    или None если вершина недостижима. Сам путь при этом не строится.
     """
     if not graph.has_node(start_node):
         raise NodeNotFoundError(start_node)
     if not graph.has_node(target_node):
         raise NodeNotFoundError(target_node)
 
-    all_paths = []
-    queue = [(start_node, [start_node])]  # (node, [path_to_target])
-    while queue:
-        (node, path) = queue.pop(0)
-        # Проход по всем соседям за исключением тех кого уже обошли
-        node_neighbours = set(x for x in graph[node])
-        for neighbour in node_neighbours - set(path):
-            if neighbour == target_node:
-                all_paths.append(path + [neighbour])
-            else:
-                queue.append((neighbour, path + [neighbour]))
-
-    return all_paths
+    # Обход идёт по уровням, поэтому хватает множества посещённых вершин
+    visited = {start_node}
+    level = [start_node]
+    length = 0
+    while level:
+        if target_node in visited:
+            return length
+        next_level = []
+        for node in level:
+            for neighbour in graph[node]:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    next_level.append(neighbour)
+        level = next_level
+        length += 1
+
+    return None
+
+
+def breadth_first_paths(graph, start_node, target_node) -> list:
+    """
+    Поиск всех путей от стартовой вершины до конечной.
+    Возвращает список путей, где каждый путь - набор пройденных вершин.
+    Более короткие пути идут раньше. Для ленивого перебора с ограничениями
+    см. pygraph.algorithms.paths.iter_paths.
+    """
+    return list(iter_paths(graph, start_node, target_node, shortest_first=True))
+
+
+def _restore_path(parents: dict, target_node) -> list:
+    """
+    Восстанавливает путь до вершины по словарю вершина: предшественник.
+    """
+    path = []
+    node = target_node
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
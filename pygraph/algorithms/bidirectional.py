@@ -0,0 +1,124 @@
+from heapq import heappush, heappop
+from pygraph.exceptions import NodeNotFoundError, AlgorithmError
+from pygraph.algorithms.bfs import _restore_path
+
+
+def bidirectional_search(graph, start_node, target_node) -> list:
+    """
+    Поиск кратчайшего по числу рёбер пути от стартовой вершины до конечной
+    обходом в ширину одновременно с обоих концов.
+    Возвращает список пройденных вершин или None если вершина недостижима.
+    В ориентированном графе обратный обход идёт по входящим рёбрам.
+    """
+    if not graph.has_node(start_node):
+        raise NodeNotFoundError(start_node)
+    if not graph.has_node(target_node):
+        raise NodeNotFoundError(target_node)
+    if start_node == target_node:
+        return [start_node]
+
+    successors = graph.neighbors
+    predecessors = graph.reverse_neighbors if graph.DIRECTED else graph.neighbors
+    forward, backward = {start_node: None}, {target_node: None}
+    forward_depths, backward_depths = {start_node: 0}, {target_node: 0}
+    forward_level, backward_level = [start_node], [target_node]
+    while forward_level and backward_level:
+        # Каждый раз расширяется меньший из двух фронтов
+        if len(forward_level) <= len(backward_level):
+            forward_level, meeting = _expand_level(forward_level, successors, forward,
+                                                   forward_depths, backward_depths)
+        else:
+            backward_level, meeting = _expand_level(backward_level, predecessors, backward,
+                                                    backward_depths, forward_depths)
+        if meeting is not None:
+            return _join_paths(forward, backward, meeting)
+
+    return None
+
+
+def _expand_level(level: list, neighbours_of, parents: dict, depths: dict, other_depths: dict) -> tuple:
+    """
+    Расширяет фронт на один уровень.
+    Возвращает следующий уровень и вершину встречи с другим фронтом,
+    дающую кратчайший путь, или None если фронты не встретились.
+    """
+    next_level = []
+    meeting = None
+    best = None
+    depth = depths[level[0]] + 1
+    for node in level:
+        for neighbour in neighbours_of(node):
+            if neighbour not in parents:
+                parents[neighbour] = node
+                depths[neighbour] = depth
+                next_level.append(neighbour)
+            if neighbour in other_depths:
+                total = depths[neighbour] + other_depths[neighbour]
+                if best is None or total < best:
+                    best = total
+                    meeting = neighbour
+    return next_level, meeting
+
+
+def bidirectional_dijkstra(graph, start_node, target_node) -> list:
+    """
+    Поиск кратчайшего по сумме весов рёбер пути от стартовой вершины до конечной
+    алгоритмом Дейкстры одновременно с обоих концов.
+    Возвращает список пройденных вершин или None если вершина недостижима.
+    Веса рёбер должны быть неотрицательными.
+    """
+    if not graph.has_node(start_node):
+        raise NodeNotFoundError(start_node)
+    if not graph.has_node(target_node):
+        raise NodeNotFoundError(target_node)
+    if start_node == target_node:
+        return [start_node]
+
+    # Индекс 0 - прямой поиск от стартовой вершины, 1 - обратный от конечной
+    settled = ({}, {})
+    tentative = ({start_node: 0}, {target_node: 0})
+    parents = ({start_node: None}, {target_node: None})
+    heaps = ([(0, 0, start_node)], [(0, 0, target_node)])
+    counter = 1
+    best = None
+    meeting = None
+    while heaps[0] and heaps[1]:
+        # Ни один путь через ещё не извлечённые вершины не короче найденного
+        if best is not None and heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        distance, _, node = heappop(heaps[side])
+        if node in settled[side]:
+            continue
+        settled[side][node] = distance
+        own, other = tentative[side], tentative[1 - side]
+        for neighbour, weight in graph._weighted_neighbors(node, reverse=bool(side)):
+            if weight < 0:
+                raise AlgorithmError("Ребро между %s и %s имеет отрицательный вес %s" % (node, neighbour, weight))
+            candidate = distance + weight
+            if neighbour not in settled[side] and (neighbour not in own or candidate < own[neighbour]):
+                own[neighbour] = candidate
+                parents[side][neighbour] = node
+                heappush(heaps[side], (candidate, counter, neighbour))
+                counter += 1
+            if neighbour in own and neighbour in other:
+                total = own[neighbour] + other[neighbour]
+                if best is None or total < best:
+                    best = total
+                    meeting = neighbour
+
+    if meeting is None:
+        return None
+    return _join_paths(parents[0], parents[1], meeting)
+
+
+def _join_paths(forward: dict, backward: dict, meeting) -> list:
+    """
+    Склеивает путь от стартовой вершины до вершины встречи
+    и путь от вершины встречи до конечной.
+    """
+    path = _restore_path(forward, meeting)
+    tail = _restore_path(backward, meeting)
+    tail.reverse()
+    path.extend(tail[1:])
+    return path
@@ -1,26 +1,22 @@
-import itertools
 from pygraph.graph import Graph
-from pygraph.algorithms.isomorphism import isomorphism
-from pygraph.algorithms.check_connectivity import check_graph_is_connected
+from pygraph.digraph import DiGraph
+from pygraph.algorithms.isomorphism import subgraph_isomorphism
 
 
 def is_subgraph(graph: Graph, subgraph: Graph) -> (bool, Graph):
     """
-    Для двух заданных невзвешанных и неориентированных графов
-    определяет является ли один из графов подграфом другого графа.
+    Для двух заданных графов определяет, изоморфен ли меньший граф subgraph
+    порождённому подграфу графа graph.
+    Возвращает пару (True, найденный подграф) или (False, None).
+    Все вложения можно перебрать с помощью
+    pygraph.algorithms.isomorphism.iter_subgraph_isomorphisms.
     """
     if len(subgraph.nodes()) < len(graph.nodes()):
-        for sub_nodes in itertools.combinations(graph.nodes(), len(subgraph.nodes())):
-            subg = Graph("TmpSubgraph")
-            for node in sub_nodes:
-                subg.add_node(node)
-                for neighbour in graph.neighbors(node):
-                    new_edge = (node, neighbour)
-                    if not subg.has_edge(new_edge):
-                        try:
-                            subg.add_edge(new_edge)
-                        except KeyError:
-                            pass
-            if check_graph_is_connected(subg) and isomorphism(subg, subgraph):
-                return True, subg
+        phi = subgraph_isomorphism(graph, subgraph)
+        if phi is not False:
+            subg = DiGraph("TmpSubgraph") if graph.DIRECTED else Graph("TmpSubgraph")
+            images = set(phi.values())
+            subg.add_nodes_from(node for node in graph.nodes() if node in images)
+            subg.add_edges_from((phi[u], phi[v]) for u, v in subgraph.edges())
+            return True, subg
     return False, None
@@ -0,0 +1,129 @@
+from collections import deque
+from pygraph.union_find import UnionFind
+
+
+def connected_components(graph):
+    """
+    Ленивый перебор компонент связности.
+    Генератор выдаёт множества вершин по одной компоненте, каждая вершина и ребро
+    рассматриваются один раз. Для ориентированного графа выдаются компоненты
+    слабой связности (направление рёбер не учитывается).
+    """
+    directed = graph.DIRECTED
+    visited = set()
+    for root in graph.nodes():
+        if root in visited:
+            continue
+        visited.add(root)
+        component = {root}
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            neighbours = graph.neighbors(node)
+            if directed:
+                neighbours = list(neighbours) + list(graph.reverse_neighbors(node))
+            for neighbour in neighbours:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    component.add(neighbour)
+                    queue.append(neighbour)
+        yield component
+
+
+def weakly_connected_components(graph) -> list:
+    """
+    Возвращает список компонент слабой связности, найденных системой
+    непересекающихся множеств за один проход по рёбрам.
+    Для неориентированного графа это обычные компоненты связности.
+    """
+    components = UnionFind(graph.nodes())
+    for u, v in graph.edges():
+        components.union(u, v)
+    return components.groups()
+
+
+def strongly_connected_components(graph):
+    """
+    Ленивый перебор компонент сильной связности алгоритмом Тарьяна.
+    Обход итеративный, поэтому не упирается в ограничение глубины рекурсии.
+    Компоненты выдаются в обратном топологическом порядке.
+    """
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    counter = 0
+    for root in graph.nodes():
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        # Стек обхода хранит вершину и итератор по её ещё не просмотренным соседям
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, neighbours = work[-1]
+            for neighbour in neighbours:
+                if neighbour not in index:
+                    index[neighbour] = low[neighbour] = counter
+                    counter += 1
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    work.append((neighbour, iter(graph[neighbour])))
+                    break
+                if neighbour in on_stack and index[neighbour] < low[node]:
+                    low[node] = index[neighbour]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = set()
+                    while True:
+                        each = stack.pop()
+                        on_stack.discard(each)
+                        component.add(each)
+                        if each == node:
+                            break
+                    yield component
+
+
+def is_connected(graph) -> bool:
+    """
+    Возвращает True если граф связен (ориентированный - слабо связен), иначе False.
+    Пустой граф считается связным.
+    """
+    if not graph.order():
+        return True
+    return len(next(connected_components(graph))) == graph.order()
+
+
+def is_strongly_connected(graph) -> bool:
+    """
+    Возвращает True если из любой вершины графа достижима любая другая, иначе False.
+    Для ориентированного графа выполняются два обхода из одной вершины:
+    по исходящим рёбрам и по входящим, без построения обратного графа.
+    """
+    order = graph.order()
+    if not order:
+        return True
+    root = next(iter(graph.nodes()))
+    if _reachable_count(root, graph.neighbors) != order:
+        return False
+    if graph.DIRECTED:
+        return _reachable_count(root, graph.reverse_neighbors) == order
+    return True
+
+
+def _reachable_count(root, neighbours_of) -> int:
+    visited = {root}
+    queue = deque([root])
+    while queue:
+        for neighbour in neighbours_of(queue.popleft()):
+            if neighbour not in visited:
+                visited.add(neighbour)
+                queue.append(neighbour)
+    return len(visited)
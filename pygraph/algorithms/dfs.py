@@ -1,4 +1,6 @@
 from pygraph.exceptions import NodeNotFoundError
+from pygraph.algorithms.bfs import _restore_path
+from pygraph.algorithms.paths import iter_paths
 
 
 def depth_first_bypass(graph, start_node) -> list:
@@ -9,14 +11,15 @@ def depth_first_bypass(graph, start_node) -> list:
     if not graph.has_node(start_node):
         raise NodeNotFoundError(start_node)
 
-    visited, stack = [], [start_node]
+    bypassed, visited, stack = [], set(), [start_node]
     while stack:
         node = stack.pop()
         if node not in visited:
-            visited.append(node)
-            node_neighbours = set(x for x in graph[node])
-            stack.extend(node_neighbours.difference(visited))
-    return visited
+            visited.add(node)
+            bypassed.append(node)
+            # Соседи кладутся в обратном порядке, чтобы первым обходился первый добавленный
+            stack.extend(x for x in reversed(list(graph[node])) if x not in visited)
+    return bypassed
 
 
 def depth_first_search(graph, start_node, target_node) -> list:
@@ -29,15 +32,22 @@ def depth_first_search(graph, start_node, target_node) -> list:
     if not graph.has_node(target_node):
         raise NodeNotFoundError(target_node)
 
-    stack = [(start_node, [start_node])]
+    # Как и прежде, путь из вершины в неё саму не ищется
+    if start_node == target_node:
+        return None
+
+    # Каждая вершина посещается один раз, для неё запоминается предшественник,
+    # а путь восстанавливается только когда цель найдена
+    parents = {}
+    stack = [(start_node, None)]  # (node, parent)
     while stack:
-        (node, path) = stack.pop()
-        node_neighbours = set(x for x in graph[node])
-        for neighbour in node_neighbours.difference(set(path)):
-            if neighbour == target_node:
-                return path + [neighbour]
-            else:
-                stack.append((neighbour, path + [neighbour]))
+        (node, parent) = stack.pop()
+        if node in parents:
+            continue
+        parents[node] = parent
+        if node == target_node:
+            return _restore_path(parents, target_node)
+        stack.extend((x, node) for x in reversed(list(graph[node])) if x not in parents)
 
     return None
 
@@ -46,21 +56,6 @@ def depth_first_paths(graph, start_node, target_node) -> list:
     """
     Поиск всех путей от стартовой вершины до конечной.
     Возвращает список путей, где каждый путь - набор пройденных вершин.
+    Для ленивого перебора с ограничениями см. pygraph.algorithms.paths.iter_paths.
     """
-    if not graph.has_node(start_node):
-        raise NodeNotFoundError(start_node)
-    if not graph.has_node(target_node):
-        raise NodeNotFoundError(target_node)
-
-    all_paths = []
-    stack = [(start_node, [start_node])]
-    while stack:
-        (node, path) = stack.pop()
-        node_neighbours = set(x for x in graph[node])
-        for neighbour in node_neighbours.difference(set(path)):
-            if neighbour == target_node:
-                all_paths.append(path + [neighbour])
-            else:
-                stack.append((neighbour, path + [neighbour]))
-
-    return all_paths
+    return list(iter_paths(graph, start_node, target_node))
@@ -0,0 +1,82 @@
+from heapq import heappush, heappop
+from pygraph.exceptions import NodeNotFoundError, AlgorithmError
+from pygraph.algorithms.bfs import _restore_path
+
+
+def dijkstra_distances(graph, start_node) -> dict:
+    """
+    Поиск кратчайших по сумме весов рёбер расстояний от стартовой вершины до всех остальных.
+    Возвращает словарь вершина: расстояние для всех достижимых вершин.
+    Веса рёбер должны быть неотрицательными.
+    """
+    if not graph.has_node(start_node):
+        raise NodeNotFoundError(start_node)
+
+    distances, _ = _dijkstra(graph, start_node, None)
+    return distances
+
+
+def dijkstra_search(graph, start_node, target_node) -> list:
+    """
+    Поиск кратчайшего по сумме весов рёбер пути от стартовой вершины до конечной.
+    Возвращает список пройденных вершин или None если вершина недостижима.
+    Поиск прекращается, как только расстояние до конечной вершины установлено.
+    """
+    if not graph.has_node(start_node):
+        raise NodeNotFoundError(start_node)
+    if not graph.has_node(target_node):
+        raise NodeNotFoundError(target_node)
+
+    distances, parents = _dijkstra(graph, start_node, target_node)
+    if target_node not in distances:
+        return None
+    return _restore_path(parents, target_node)
+
+
+def dijkstra_path_length(graph, start_node, target_node):
+    """
+    Возвращает сумму весов рёбер кратчайшего пути от стартовой вершины до конечной
+    или None если вершина недостижима.
+    """
+    if not graph.has_node(start_node):
+        raise NodeNotFoundError(start_node)
+    if not graph.has_node(target_node):
+        raise NodeNotFoundError(target_node)
+
+    distances, _ = _dijkstra(graph, start_node, target_node)
+    return distances.get(target_node)
+
+
+def _dijkstra(graph, start_node, target_node) -> tuple:
+    """
+    Алгоритм Дейкстры на двоичной куче с ленивым удалением:
+    при улучшении расстояния в кучу кладётся новый элемент, а устаревшие
+    элементы пропускаются при извлечении. Веса исходящих рёбер вершины
+    читаются за один проход по её таблице соседей.
+    Возвращает словари окончательных расстояний и предшественников.
+    """
+    distances = {}
+    tentative = {start_node: 0}
+    parents = {start_node: None}
+    # Счётчик в элементе кучи нужен, чтобы не сравнивать сами вершины при равных расстояниях
+    heap = [(0, 0, start_node)]
+    counter = 1
+    while heap:
+        distance, _, node = heappop(heap)
+        if node in distances:
+            continue
+        distances[node] = distance
+        if node == target_node:
+            break
+        for neighbour, weight in graph._weighted_neighbors(node):
+            if weight < 0:
+                raise AlgorithmError("Ребро (%s, %s) имеет отрицательный вес %s" % (node, neighbour, weight))
+            if neighbour in distances:
+                continue
+            candidate = distance + weight
+            if neighbour not in tentative or candidate < tentative[neighbour]:
+                tentative[neighbour] = candidate
+                parents[neighbour] = node
+                heappush(heap, (candidate, counter, neighbour))
+                counter += 1
+    return distances, parents
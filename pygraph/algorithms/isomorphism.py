@@ -1,90 +1,345 @@
-def isomorphism(graph_1, graph_2):
-    """Определяет, являются ли два неориентированных графа graph_1 и graph_2,
-    представленных своими матрицами смежности изоморфными.
-
-    Если да, то возвращает список phi длины N (число вершин в графах),
-    состоящий из чисел 0..N-1, такой что phi[i] - номер вершины второго графа,
-    соответствующей i-й вершине первого графа
-    (верщины нумеруются числами 0..N-1); если нет - возвращает
-    пустой список."""
-
-    g_len = len(graph_1)
-    if g_len != len(graph_2):
+from collections import Counter
+from hashlib import blake2b
+
+# Сколько раундов уточнения раскраски выполнять перед перебором.
+# На графах большого диаметра (например, длинных путях) раскраска стабилизируется
+# лишь за число раундов порядка диаметра, а перебору хватает и частичного уточнения.
+_REFINEMENT_ROUNDS = 8
+
+_MISSING = object()
+
+
+class _Structure:
+    """
+    Целочисленное представление графа для сопоставления вершин.
+    Вершины пронумерованы 0..N-1 в порядке graph.nodes(), соседи каждой вершины
+    хранятся в словаре номер_соседа: ключ_ребра, поэтому проверка смежности - O(1).
+    Ключ ребра и вершины - пара (вес, метка), где несравниваемые атрибуты
+    заменены на None. Для неориентированного графа pred совпадает с succ.
+    """
+
+    def __init__(self, graph, match_labels: bool = False, match_weights: bool = False):
+        self.directed = graph.DIRECTED
+        self.names = list(graph.nodes())
+        index = {name: i for i, name in enumerate(self.names)}
+
+        def key(weight_of, label_of, item) -> tuple:
+            return (weight_of(item) if match_weights else None,
+                    label_of(item) if match_labels else None)
+
+        self.node_keys = [key(graph.get_node_weight, graph.get_node_label, name) for name in self.names]
+        if match_labels or match_weights:
+            self.succ = [{index[n]: key(graph.get_edge_weight, graph.get_edge_label, (name, n))
+                          for n in graph.neighbors(name)} for name in self.names]
+        else:
+            self.succ = [dict.fromkeys(index[n] for n in graph.neighbors(name)) for name in self.names]
+        if self.directed:
+            self.pred = [{} for _ in self.names]
+            for u, neighbours in enumerate(self.succ):
+                for v, edge_key in neighbours.items():
+                    self.pred[v][u] = edge_key
+        else:
+            self.pred = self.succ
+        self.size = sum(len(neighbours) for neighbours in self.succ)
+
+    def __len__(self):
+        return len(self.names)
+
+    def initial_colours(self) -> list:
+        """
+        Начальная раскраска: ключ вершины, степени и наличие петли.
+        """
+        succ = self.succ
+        pred = self.pred
+        return [(self.node_keys[i], len(succ[i]), len(pred[i]), succ[i].get(i, False))
+                for i in range(len(self.names))]
+
+
+def refine_colours(structures: list, rounds: int = None) -> list:
+    """
+    Совместное уточнение раскраски вершин нескольких графов (алгоритм Вейсфейлера-Лемана).
+    На каждом шаге цвет вершины заменяется номером пары (цвет, мультимножество цветов
+    соседей вместе с ключами рёбер); номера общие для всех графов, поэтому цвета
+    можно сравнивать между графами. Уточнение прекращается, когда число цветов
+    перестаёт расти или после rounds раундов.
+    Возвращает списки цветов вершин для каждого графа.
+    """
+    palette = {}
+    colours = [[palette.setdefault(c, len(palette)) for c in s.initial_colours()] for s in structures]
+    count = len(palette)
+    while rounds is None or rounds > 0:
+        palette = {}
+        refined = []
+        for s, c in zip(structures, colours):
+            new = []
+            for i in range(len(s)):
+                signature = (c[i], tuple(sorted((c[j], k) for j, k in s.succ[i].items())))
+                if s.directed:
+                    signature += (tuple(sorted((c[j], k) for j, k in s.pred[i].items())),)
+                new.append(palette.setdefault(signature, len(palette)))
+            refined.append(new)
+        colours = refined
+        if len(palette) == count:
+            break
+        count = len(palette)
+        if rounds is not None:
+            rounds -= 1
+    return colours
+
+
+def _digest(data: bytes) -> bytes:
+    return blake2b(data, digest_size=16).digest()
+
+
+def weisfeiler_lehman_hash(graph, rounds: int = 3) -> str:
+    """
+    Возвращает хеш класса изоморфизма графа по Вейсфейлеру-Леману.
+    У изоморфных графов хеши совпадают, обратное в общем случае неверно.
+    Атрибуты вершин и рёбер не учитываются.
+    Хеш вычисляется через blake2b и одинаков в разных процессах.
+    """
+    s = _Structure(graph)
+    colours = [_digest(repr(c).encode()) for c in s.initial_colours()]
+    result = blake2b(repr((s.directed, len(s), s.size)).encode(), digest_size=16)
+    for colour in sorted(colours):
+        result.update(colour)
+    for _ in range(rounds):
+        refined = []
+        for i in range(len(s)):
+            signature = colours[i] + b"".join(sorted(colours[j] for j in s.succ[i]))
+            if s.directed:
+                signature += b"|" + b"".join(sorted(colours[j] for j in s.pred[i]))
+            refined.append(_digest(signature))
+        colours = refined
+        for colour in sorted(colours):
+            result.update(colour)
+    return result.hexdigest()
+
+
+def exact_hash(graph) -> str:
+    """
+    Возвращает хеш графа с точностью до порядка добавления вершин и рёбер:
+    учитываются имена вершин, рёбра и все атрибуты вершин и рёбер.
+    Равные графы имеют равные хеши, если repr() имён вершин и значений атрибутов
+    не зависит от процесса (строки, числа и т.п.).
+    """
+    directed = graph.DIRECTED
+    digests = []
+    for node in graph.nodes():
+        attrs = sorted(graph.get_node_attributes(node).items())
+        digests.append(_digest(repr(("node", node, attrs)).encode()))
+    for u, v in graph.edges():
+        attrs = sorted(graph.get_edge_attributes((u, v)).items())
+        ends = (repr(u), repr(v)) if directed else tuple(sorted((repr(u), repr(v))))
+        digests.append(_digest(repr(("edge", ends, attrs)).encode()))
+    digests.sort()
+    result = blake2b(repr(directed).encode(), digest_size=16)
+    for each in digests:
+        result.update(each)
+    return result.hexdigest()
+
+
+def isomorphism(graph_1, graph_2, match_labels: bool = False, match_weights: bool = False):
+    """
+    Определяет, являются ли графы graph_1 и graph_2 изоморфными.
+    Поддерживаются неориентированные и ориентированные графы.
+
+    Если да, то возвращает словарь phi, в котором phi[x] - вершина второго графа,
+    соответствующая вершине x первого графа; если нет - возвращает False.
+    match_labels и match_weights требуют, чтобы у сопоставленных вершин и рёбер
+    совпадали метки и веса соответственно.
+
+    Вершины сначала разбиваются на классы уточнением раскраски (Вейсфейлер-Леман),
+    затем перебор в духе VF2++ сопоставляет вершины внутри классов,
+    наращивая отображение вдоль рёбер. Перебор итеративный и не упирается
+    в ограничение глубины рекурсии.
+    """
+    if graph_1.DIRECTED != graph_2.DIRECTED:
+        return False
+    if graph_1.order() != graph_2.order():
+        return False
+    # Отпечатки кешируются в графах, поэтому при повторных сравнениях
+    # неизоморфные графы отбрасываются без построения структур
+    if graph_1.fingerprint() != graph_2.fingerprint():
         return False
 
-    # хеш-таблица, отображающая ключ - характеристику-инвариант
-    # вершин при перенумерации в пару списков номеров вершин имеющих эту
-    # характеристикой из графов G1 и G2
-    groups = {}
-
-    for g in [0, 1]:
-        graph = [graph_1, graph_2][g]
-        for x in graph.nodes():
-            # в данном алгоритме характеристика каждой вершин
-            # состоит из ее степени (v_pov)
-            # и мультимножества степеней соседних с ней вершин (a_pov)
-            v_pow = len(graph.neighbors(x))
-            a_pov = tuple(sorted(len(graph.neighbors(y)) for y in graph[x]))
-            c = (v_pow, a_pov)
-
-            if c not in groups:
-                groups[c] = [[], []]
-            groups[c][g].append(x)
-
-    # проверяем что размеры группы вершин с одинаковой характеристикой
-    # одинаковы в обоих графах
-    for A, B in groups.values():
-        if len(A) != len(B):
-            return False
+    s1 = _Structure(graph_1, match_labels, match_weights)
+    s2 = _Structure(graph_2, match_labels, match_weights)
+    if s1.size != s2.size:
+        return False
 
-    # теперь остается только перебрать какая вершина первого графа
-    # соответствует какой вершине второго графа внутри каждой группы
-
-    # упорядочиваем группы по возрастанию их размера
-    sgroups = [(len(A), A, B) for A, B in groups.values()]
-    sgroups = sorted(sgroups)
-
-    # перебор
-    phi = dict()
-    rev = dict()
-
-    def good(x, y):
-        for z in graph_1[x]:
-            # если есть образ,который не соединен с образом X,
-            # то предположение не верно
-            if z in phi and not graph_2.has_edge((phi[x], phi[z])):
-                return False
-        for z in graph_2[y]:
-            # если есть праобраз,который не соединен с праобразом Y,
-            # то предположение не верно
-            if z in rev and not graph_1.has_edge((rev[y], rev[z])):
-                return False
-        return True
+    colours_1, colours_2 = refine_colours([s1, s2], _REFINEMENT_ROUNDS)
+    if Counter(colours_1) != Counter(colours_2):
+        return False
+
+    rarity = Counter(colours_1)
+    order, anchors = _matching_order(s1, lambda u: (rarity[colours_1[u]], -len(s1.succ[u]) - len(s1.pred[u])))
+    classes = {}
+    for v, colour in enumerate(colours_2):
+        classes.setdefault(colour, []).append(v)
+
+    def compatible(u, v) -> bool:
+        return colours_1[u] == colours_2[v]
+
+    def pool(u) -> list:
+        return classes[colours_1[u]]
+
+    mapping = next(_iter_matches(s1, s2, order, anchors, pool, compatible, induced=True), None)
+    if mapping is None:
+        return False
+    return {s1.names[u]: s2.names[v] for u, v in enumerate(mapping)}
+
+
+def iter_subgraph_isomorphisms(graph, pattern, induced: bool = True,
+                               match_labels: bool = False, match_weights: bool = False):
+    """
+    Ленивый перебор вложений графа pattern в граф graph.
+    Генератор выдаёт словари phi, в которых phi[x] - вершина graph, соответствующая
+    вершине x шаблона. Каждому ребру шаблона соответствует ребро graph.
+    При induced=True, кроме того, между образами несмежных вершин шаблона рёбер нет
+    (шаблон изоморфен порождённому подграфу), иначе ищутся и неиндуцированные вложения.
+    match_labels и match_weights требуют совпадения меток и весов вершин и рёбер.
 
-    def rec(k, i):
-        #  закончили работать с группами
-        if k == len(sgroups):
+    Отображение наращивается от вершин шаблона с наибольшей степенью вдоль его рёбер,
+    кандидаты отсеиваются по степеням, петлям и атрибутам, а подграфы-кандидаты
+    не строятся. Симметричные вложения одного и того же подграфа выдаются отдельно.
+    """
+    if graph.DIRECTED != pattern.DIRECTED:
+        return iter(())
+    s1 = _Structure(pattern, match_labels, match_weights)
+    s2 = _Structure(graph, match_labels, match_weights)
+    if len(s1) > len(s2) or s1.size > s2.size:
+        return iter(())
+
+    def compatible(u, v) -> bool:
+        if s1.node_keys[u] != s2.node_keys[v]:
+            return False
+        if len(s1.succ[u]) > len(s2.succ[v]) or len(s1.pred[u]) > len(s2.pred[v]):
+            return False
+        loop = s1.succ[u].get(u, _MISSING)
+        if loop is _MISSING and not induced:
             return True
+        return loop == s2.succ[v].get(v, _MISSING)
+
+    candidates = {}
+
+    def pool(u) -> list:
+        if u not in candidates:
+            candidates[u] = [v for v in range(len(s2)) if compatible(u, v)]
+        return candidates[u]
+
+    keys = Counter(s2.node_keys)
+    order, anchors = _matching_order(s1, lambda u: (-len(s1.succ[u]) - len(s1.pred[u]), keys[s1.node_keys[u]]))
+    return ({s1.names[u]: s2.names[v] for u, v in enumerate(mapping)}
+            for mapping in _iter_matches(s1, s2, order, anchors, pool, compatible, induced))
+
+
+def subgraph_isomorphism(graph, pattern, induced: bool = True,
+                         match_labels: bool = False, match_weights: bool = False):
+    """
+    Возвращает первое вложение графа pattern в граф graph
+    (см. iter_subgraph_isomorphisms) или False если вложений нет.
+    """
+    return next(iter_subgraph_isomorphisms(graph, pattern, induced, match_labels, match_weights), False)
+
+
+def _matching_order(s: _Structure, preference) -> tuple:
+    """
+    Порядок сопоставления вершин первого графа.
+    Каждая компонента обходится в ширину, начиная с наиболее предпочтительной вершины
+    (меньшее значение preference), а соседи просматриваются в том же порядке предпочтения.
+    Для вершины, достигнутой по ребру, запоминается её родитель в обходе
+    и направление ребра - кандидатов для неё можно брать среди соседей образа родителя.
+    """
+    order = []
+    anchors = []
+    seen = set()
+    for root in sorted(range(len(s)), key=preference):
+        if root in seen:
+            continue
+        seen.add(root)
+        order.append(root)
+        anchors.append(None)
+        position = len(order) - 1
+        while position < len(order):
+            node = order[position]
+            position += 1
+            neighbours = [(j, True) for j in s.succ[node]]
+            if s.directed:
+                neighbours.extend((j, False) for j in s.pred[node])
+            neighbours.sort(key=lambda item: preference(item[0]))
+            for j, forward in neighbours:
+                if j not in seen:
+                    seen.add(j)
+                    order.append(j)
+                    anchors.append((node, forward))
+    return order, anchors
+
+
+def _iter_matches(s1: _Structure, s2: _Structure, order: list, anchors: list, pool, compatible, induced: bool):
+    """
+    Перебор отображений вершин s1 в вершины s2, сохраняющих рёбра.
+    Вершины s1 сопоставляются в порядке order; для вершины без родителя
+    кандидаты берутся из pool(u), иначе - среди соседей образа родителя,
+    и в обоих случаях отсеиваются функцией compatible(u, v).
+    При induced=True отображение должно сохранять и отсутствие рёбер.
+    Выдаёт список mapping, где mapping[u] - номер образа вершины u;
+    список общий для всего перебора и меняется при следующем шаге.
+    """
+    n = len(s1)
+    if not n:
+        yield []
+        return
+    mapping = [None] * n
+    inverse = [None] * len(s2)
+    tables = ((s1.succ, s2.succ), (s1.pred, s2.pred)) if s1.directed else ((s1.succ, s2.succ),)
+
+    def candidates(depth):
+        u = order[depth]
+        anchor = anchors[depth]
+        if anchor is None:
+            vertices = pool(u)
+        else:
+            parent, forward = anchor
+            image = mapping[parent]
+            vertices = s2.succ[image] if forward else s2.pred[image]
+        return iter([v for v in vertices if inverse[v] is None and compatible(u, v)])
+
+    def feasible(u, v) -> bool:
+        for table_1, table_2 in tables:
+            neighbours_2 = table_2[v]
+            mapped = 0
+            for w, edge_key in table_1[u].items():
+                x = mapping[w]
+                if x is not None and w != u:
+                    if neighbours_2.get(x, _MISSING) != edge_key:
+                        return False
+                    mapped += 1
+            if induced:
+                # У образа не должно быть лишних рёбер к уже сопоставленным вершинам
+                for x in neighbours_2:
+                    if inverse[x] is not None and x != v:
+                        mapped -= 1
+                if mapped:
+                    return False
+        return True
 
-        # закончили работать с конкретной группой
-        L, A, B = sgroups[k]
-        if i == L:
-            return rec(k+1, 0)
-
-        x = A[i]
-        for y in B:
-            #  если у элемента уже есть праобраз, то мы его пропускаем
-            if y in rev:
-                continue
-
-            # строим отображение
-            phi[x] = y
-            rev[y] = x
-            if good(x, y) and rec(k, i+1):
-                return True
-            phi.pop(x)
-            rev.pop(y)
-
-    if rec(0, 0):
-        return phi
-    return False
+    stack = [candidates(0)]
+    while stack:
+        depth = len(stack) - 1
+        u = order[depth]
+        if mapping[u] is not None:
+            inverse[mapping[u]] = None
+            mapping[u] = None
+        for v in stack[-1]:
+            if feasible(u, v):
+                mapping[u] = v
+                inverse[v] = u
+                if depth + 1 < n:
+                    stack.append(candidates(depth + 1))
+                    break
+                yield mapping
+                inverse[v] = None
+                mapping[u] = None
+        else:
+            stack.pop()
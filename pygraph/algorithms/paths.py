@@ -0,0 +1,83 @@
+from itertools import islice
+from time import monotonic
+from pygraph.exceptions import NodeNotFoundError
+
+# Как часто (в шагах перебора) сверяться с крайним сроком
+_DEADLINE_CHECK_PERIOD = 1024
+
+
+def iter_paths(graph, start_node, target_node, max_depth: int = None, max_paths: int = None,
+               deadline: float = None, shortest_first: bool = False):
+    """
+    Ленивый перебор всех простых путей от стартовой вершины до конечной.
+    Генератор выдаёт пути по одному, каждый путь - новый список пройденных вершин.
+
+    max_depth ограничивает длину пути в рёбрах, max_paths - количество выданных путей.
+    deadline - момент по часам time.monotonic(), после которого перебор молча
+    прекращается. shortest_first=True выдаёт пути в порядке неубывания длины
+    (поиск с итеративным углублением), иначе - в порядке обхода в глубину.
+    Граф нельзя изменять во время перебора.
+    """
+    if not graph.has_node(start_node):
+        raise NodeNotFoundError(start_node)
+    if not graph.has_node(target_node):
+        raise NodeNotFoundError(target_node)
+
+    if shortest_first:
+        paths = _iter_shortest_first(graph, start_node, target_node, max_depth, deadline)
+    else:
+        paths = _iter_backtracking(graph, start_node, target_node, max_depth, None, deadline)
+    if max_paths is not None:
+        paths = islice(paths, max_paths)
+    return paths
+
+
+def _iter_shortest_first(graph, start_node, target_node, max_depth, deadline):
+    depth = 1
+    while max_depth is None or depth <= max_depth:
+        if deadline is not None and monotonic() >= deadline:
+            return
+        # Перебор возвращает True, если какую-то ветку пришлось обрезать по глубине,
+        # т.е. более длинные пути ещё могут существовать
+        truncated = yield from _iter_backtracking(graph, start_node, target_node, depth, depth, deadline)
+        if not truncated:
+            return
+        depth += 1
+
+
+def _iter_backtracking(graph, start_node, target_node, max_depth, exact_depth, deadline):
+    # Текущий путь, множество его вершин и итераторы по соседям каждой вершины пути
+    # общие для всего перебора: шаг вперёд и откат стоят O(1), а список
+    # копируется только при выдаче найденного пути
+    path = [start_node]
+    on_path = {start_node}
+    neighbours = [iter(graph[start_node])]
+    truncated = False
+    steps = 0
+    while neighbours:
+        if deadline is not None and steps % _DEADLINE_CHECK_PERIOD == 0 and monotonic() >= deadline:
+            return truncated
+        steps += 1
+        # Длина пути в рёбрах после шага в очередного соседа
+        depth = len(path)
+        for neighbour in neighbours[-1]:
+            if neighbour in on_path:
+                continue
+            if neighbour == target_node:
+                if max_depth is not None and depth > max_depth:
+                    truncated = True
+                elif exact_depth is None or depth == exact_depth:
+                    yield path + [neighbour]
+                continue
+            # Из промежуточной вершины до цели нужно пройти ещё хотя бы одно ребро
+            if max_depth is not None and depth + 1 > max_depth:
+                truncated = True
+                continue
+            path.append(neighbour)
+            on_path.add(neighbour)
+            neighbours.append(iter(graph[neighbour]))
+            break
+        else:
+            neighbours.pop()
+            on_path.discard(path.pop())
+    return truncated
@@ -0,0 +1,215 @@
+import sys
+from array import array
+from operator import itemgetter
+from collections.abc import MutableMapping
+
+
+class DictStore:
+    """
+    Хранилище атрибутов по умолчанию.
+    Запись - это обычный словарь имя_атрибута: значение,
+    который лежит прямо в таблице вершин или соседей графа.
+    """
+
+    def new(self, data: dict) -> dict:
+        """
+        Создаёт запись из словаря атрибутов. Словарь не копируется.
+        """
+        return data
+
+    def copy(self, record: dict) -> dict:
+        return dict(record)
+
+    def release(self, record: dict):
+        pass
+
+    def get(self, record: dict, key: str):
+        return record[key]
+
+    def set(self, record: dict, key: str, value):
+        record[key] = value
+
+    def has(self, record: dict, key: str) -> bool:
+        return key in record
+
+    def delete(self, record: dict, key: str):
+        del (record[key])
+
+    def attributes(self, record: dict) -> dict:
+        return record
+
+    def weight_getter(self):
+        """
+        Возвращает функцию запись -> вес для чтения весов в циклах алгоритмов.
+        """
+        return itemgetter("weight")
+
+
+_MISSING = object()
+
+
+class ColumnarStore:
+    """
+    Колоночное хранилище атрибутов.
+
+    Запись - целый номер строки. Каждый атрибут хранится в отдельной колонке:
+    веса - в массиве array("q"), метки - в списке интернированных строк,
+    остальные атрибуты - в словарях номер_строки: значение, которые создаются
+    при первом использовании имени атрибута.
+    Веса, не помещающиеся в 64 бита или не являющиеся целыми числами,
+    а также удалённые веса отмечаются в _weight_flags и хранятся в _weight_exceptions.
+    Освободившиеся строки используются повторно.
+    """
+
+    def __init__(self):
+        self._weights = array("q")
+        self._weight_flags = bytearray()
+        self._weight_exceptions = {}
+        self._labels = []
+        self._columns = {}
+        self._free_rows = []
+
+    def __len__(self):
+        return len(self._labels) - len(self._free_rows)
+
+    def new(self, data: dict) -> int:
+        """
+        Создаёт строку из словаря атрибутов и возвращает её номер.
+        """
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = len(self._labels)
+            self._weights.append(0)
+            self._weight_flags.append(0)
+            self._labels.append(_MISSING)
+        for key, value in data.items():
+            self.set(row, key, value)
+        if "weight" not in data:
+            self._weight_exceptions[row] = _MISSING
+            self._weight_flags[row] = 1
+        return row
+
+    def copy(self, row: int) -> int:
+        return self.new(self.attributes(row))
+
+    def release(self, row: int):
+        """
+        Освобождает строку, удаляя все её значения.
+        """
+        if self._weight_flags[row]:
+            del (self._weight_exceptions[row])
+            self._weight_flags[row] = 0
+        self._labels[row] = _MISSING
+        for column in self._columns.values():
+            column.pop(row, None)
+        self._free_rows.append(row)
+
+    def get(self, row: int, key: str):
+        if key == "weight":
+            if self._weight_flags[row]:
+                value = self._weight_exceptions[row]
+            else:
+                value = self._weights[row]
+        elif key == "label":
+            value = self._labels[row]
+        else:
+            value = self._columns.get(key, {}).get(row, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def set(self, row: int, key: str, value):
+        if key == "weight":
+            if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+                self._weights[row] = value
+                if self._weight_flags[row]:
+                    del (self._weight_exceptions[row])
+                    self._weight_flags[row] = 0
+            else:
+                self._weight_exceptions[row] = value
+                self._weight_flags[row] = 1
+        elif key == "label":
+            self._labels[row] = sys.intern(value) if type(value) is str else value
+        else:
+            if key not in self._columns:
+                self._columns[key] = {}
+            self._columns[key][row] = value
+
+    def has(self, row: int, key: str) -> bool:
+        try:
+            self.get(row, key)
+        except KeyError:
+            return False
+        return True
+
+    def delete(self, row: int, key: str):
+        if not self.has(row, key):
+            raise KeyError(key)
+        if key == "weight":
+            self._weight_exceptions[row] = _MISSING
+            self._weight_flags[row] = 1
+        elif key == "label":
+            self._labels[row] = _MISSING
+        else:
+            del (self._columns[key][row])
+
+    def keys(self, row: int) -> list:
+        keys = [key for key in ("weight", "label") if self.has(row, key)]
+        keys.extend(key for key, column in self._columns.items() if row in column)
+        return keys
+
+    def attributes(self, row: int) -> "AttributesProxy":
+        return AttributesProxy(self, row)
+
+    def weight_getter(self):
+        """
+        Возвращает функцию номер_строки -> вес для чтения весов в циклах алгоритмов.
+        Обычные веса читаются прямо из массива, минуя разбор имени атрибута.
+        """
+        weights = self._weights
+        flags = self._weight_flags
+        exceptions = self._weight_exceptions
+
+        def weight(row: int):
+            if flags[row]:
+                value = exceptions[row]
+                if value is _MISSING:
+                    raise KeyError("weight")
+                return value
+            return weights[row]
+
+        return weight
+
+
+class AttributesProxy(MutableMapping):
+    """
+    Лёгкое представление атрибутов одной строки колоночного хранилища.
+    Ведёт себя как словарь, но читает и пишет значения прямо в колонки.
+    """
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: ColumnarStore, row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._store.get(self._row, key)
+
+    def __setitem__(self, key, value):
+        self._store.set(self._row, key, value)
+
+    def __delitem__(self, key):
+        self._store.delete(self._row, key)
+
+    def __contains__(self, key):
+        return self._store.has(self._row, key)
+
+    def __iter__(self):
+        return iter(self._store.keys(self._row))
+
+    def __len__(self):
+        return len(self._store.keys(self._row))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
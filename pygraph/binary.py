@@ -0,0 +1,348 @@
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+
+from pygraph.frozen import FrozenGraph
+from pygraph.basegraph import BaseGraph
+from pygraph.exceptions import GraphError, InvalidIdentifierTypeError
+
+MAGIC = b"PYGRAPH\0"
+VERSION = 1
+
+_DIRECTED = 1
+_WEIGHTED = 2
+_BIG_ENDIAN = 4
+
+# Заголовок: сигнатура, версия, флаги, число разделов
+_HEADER = struct.Struct("<8sHHI")
+# Запись таблицы разделов: смещение, длина в байтах, код типа
+_SECTION = struct.Struct("<QQc7x")
+_ALIGN = 8
+# Код типа раздела, в котором лежат данные pickle, а не массив чисел
+_PICKLED = "p"
+_BYTES = "B"
+# Код типа колонки целых чисел, не помещающихся в 64 бита: десятичный текст по строкам
+_DECIMAL = "n"
+# Коды типов, допустимые в таблице разделов, и размер элемента для каждого
+_ITEM_SIZES = {_PICKLED: 1, _BYTES: 1, _DECIMAL: 1, "i": struct.calcsize("i"), "q": struct.calcsize("q")}
+
+SECTIONS = (
+    "name",
+    "name_offsets", "name_data", "name_order",
+    "label_offsets", "label_data",
+    "node_weights", "node_labels",
+    "offsets", "targets", "edge_weights", "edge_labels",
+    "reverse_offsets", "reverse_targets", "reverse_edges",
+    "extras",
+)
+
+
+def _string_table(strings) -> tuple:
+    """
+    Упаковывает строки в массив смещений и общий буфер UTF-8.
+    """
+    offsets = array("q", [0])
+    data = bytearray()
+    for string in strings:
+        data += string.encode("utf-8")
+        offsets.append(len(data))
+    return offsets, bytes(data)
+
+
+def _index_code(count: int) -> str:
+    return "i" if count < 2 ** 31 else "q"
+
+
+def _section(value) -> tuple:
+    """
+    Возвращает код типа и байты раздела.
+    Типизированные массивы записываются как есть, списки больших чисел -
+    десятичным текстом, остальное (дополнительные атрибуты) - через pickle.
+    """
+    if isinstance(value, bytes):
+        return _BYTES, value
+    if isinstance(value, (array, memoryview)):
+        return value.typecode if isinstance(value, array) else value.format, memoryview(value).cast("B")
+    if isinstance(value, list):
+        return _DECIMAL, "\n".join(map(str, value)).encode("ascii")
+    return _PICKLED, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_binary(graph, path: str):
+    """
+    Записывает граф в двоичный формат для последующей загрузки read_binary().
+
+    Файл состоит из заголовка, таблицы разделов и самих разделов,
+    выровненных по 8 байт: таблицы строк для имён вершин и меток,
+    колонки весов и номеров меток, таблица CSR и, для ориентированного графа,
+    обратная таблица. Веса, не помещающиеся в 64 бита, записываются
+    десятичным текстом, дополнительные атрибуты - через pickle.
+    Числа записываются в порядке байт текущей машины.
+    Имена вершин должны быть строками, иначе возбуждается InvalidIdentifierTypeError.
+    """
+    frozen = graph.freeze()
+    names = frozen._names
+    count = len(names)
+    for name in names:
+        if not isinstance(name, str):
+            raise InvalidIdentifierTypeError(name)
+
+    # Метки хранятся одной таблицей различных строк, колонки содержат номера в ней
+    labels = {}
+    label_code = _index_code(count + len(frozen._edge_labels))
+    node_labels = array(label_code, (labels.setdefault(label, len(labels)) for label in frozen._node_labels))
+    edge_labels = array(label_code, (labels.setdefault(label, len(labels)) for label in frozen._edge_labels))
+    name_offsets, name_data = _string_table(names)
+    label_offsets, label_data = _string_table(labels)
+    # Номера вершин, упорядоченные по имени, - для двоичного поиска при загрузке
+    name_order = array(_index_code(count), sorted(range(count), key=names.__getitem__))
+
+    values = {
+        "name": frozen.name.encode("utf-8"),
+        "name_offsets": name_offsets,
+        "name_data": name_data,
+        "name_order": name_order,
+        "label_offsets": label_offsets,
+        "label_data": label_data,
+        "node_weights": frozen._node_weights,
+        "node_labels": node_labels,
+        "offsets": frozen._offsets,
+        "targets": frozen._targets,
+        "edge_weights": frozen._edge_weights,
+        "edge_labels": edge_labels,
+        "reverse_offsets": frozen._reverse_offsets if frozen.DIRECTED else b"",
+        "reverse_targets": frozen._reverse_targets if frozen.DIRECTED else b"",
+        "reverse_edges": frozen._reverse_edges if frozen.DIRECTED else b"",
+        "extras": (dict(frozen._node_extras), dict(frozen._edge_extras))
+        if len(frozen._node_extras) or len(frozen._edge_extras) else b"",
+    }
+    flags = (_DIRECTED * frozen.DIRECTED) | (_WEIGHTED * bool(frozen.weighted))
+    if sys.byteorder == "big":
+        flags |= _BIG_ENDIAN
+
+    sections = [_section(values[name]) for name in SECTIONS]
+    position = _HEADER.size + _SECTION.size * len(sections)
+    entries = []
+    for typecode, data in sections:
+        position += -position % _ALIGN
+        entries.append((position, len(data), typecode.encode("ascii")))
+        position += len(data)
+
+    with open(path, "wb") as fileobj:
+        fileobj.write(_HEADER.pack(MAGIC, VERSION, flags, len(sections)))
+        for entry in entries:
+            fileobj.write(_SECTION.pack(*entry))
+        for (offset, _, _), (_, data) in zip(entries, sections):
+            fileobj.write(bytes(offset - fileobj.tell()))
+            fileobj.write(data)
+
+
+class _Strings(Sequence):
+    """
+    Последовательность строк из таблицы строк файла.
+    Строка декодируется при каждом обращении.
+    """
+    __slots__ = ("_offsets", "_data")
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        offsets = self._offsets
+        return str(self._data[offsets[index]:offsets[index + 1]], "utf-8")
+
+
+class _Column(Sequence):
+    """
+    Колонка меток: номера в таблице строк.
+    """
+    __slots__ = ("_codes", "_strings")
+
+    def __init__(self, codes: memoryview, strings: _Strings):
+        self._codes = codes
+        self._strings = strings
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._strings[code] for code in self._codes[index]]
+        return self._strings[self._codes[index]]
+
+
+class _NameIndex(Mapping):
+    """
+    Отображение имени вершины в её номер.
+    Имена не загружаются в словарь: поиск двоичный по упорядоченным номерам.
+    Обход выдаёт имена в порядке номеров, как graph.nodes().
+    """
+    __slots__ = ("_names", "_order")
+
+    def __init__(self, names: _Strings, order: memoryview):
+        self._names = names
+        self._order = order
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __getitem__(self, node):
+        if not isinstance(node, str):
+            raise KeyError(node)
+        names = self._names
+        order = self._order
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if names[order[mid]] < node:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and names[order[lo]] == node:
+            return order[lo]
+        raise KeyError(node)
+
+    def __contains__(self, node):
+        try:
+            self[node]
+        except KeyError:
+            return False
+        return True
+
+
+class _Extras(Mapping):
+    """
+    Дополнительные атрибуты, распаковываемые из pickle при первом обращении.
+    """
+    __slots__ = ("_data", "_index", "_value")
+
+    def __init__(self, data, index: int):
+        self._data = data
+        self._index = index
+        self._value = None
+
+    def _load(self) -> dict:
+        if self._value is None:
+            self._value = pickle.loads(self._data())[self._index] if self._data else {}
+        return self._value
+
+    def __len__(self):
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def get(self, key, default=None):
+        return self._load().get(key, default)
+
+
+class MappedGraph(FrozenGraph):
+    """
+    Неизменяемый граф, отображённый в память из файла двоичного формата.
+
+    Колонки и таблица CSR - представления memoryview над mmap, поэтому
+    загрузка не читает файл целиком: страницы подгружаются операционной
+    системой по мере обращения и разделяются между процессами, открывшими
+    тот же файл. Имена вершин и метки декодируются при обращении,
+    дополнительные атрибуты распаковываются при первом запросе.
+    При передаче в другой процесс через pickle файл отображается заново.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        with open(path, "rb") as fileobj:
+            # Пустой файл отобразить нельзя, а короче заголовка он быть не может
+            if os.fstat(fileobj.fileno()).st_size < _HEADER.size:
+                raise GraphError("Файл %s не является графом в двоичном формате" % path)
+            self._mmap = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        magic, version, flags, count = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise GraphError("Файл %s не является графом в двоичном формате" % path)
+        if version != VERSION:
+            raise GraphError("Версия формата %d не поддерживается" % version)
+        if bool(flags & _BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise GraphError("Файл %s записан с другим порядком байт" % path)
+        if count != len(SECTIONS) or len(buffer) < _HEADER.size + _SECTION.size * count:
+            raise GraphError("Файл %s повреждён" % path)
+
+        sections = {}
+        for index, name in enumerate(SECTIONS):
+            offset, length, typecode = _SECTION.unpack_from(buffer, _HEADER.size + _SECTION.size * index)
+            typecode = typecode.decode("latin-1")
+            # Раздел должен целиком лежать в файле и состоять из целого числа элементов
+            if (typecode not in _ITEM_SIZES or offset + length > len(buffer)
+                    or length % _ITEM_SIZES[typecode]):
+                raise GraphError("Файл %s повреждён" % path)
+            # Через pickle записываются только дополнительные атрибуты,
+            # и распаковываются они лишь при обращении к ним
+            if typecode == _PICKLED and name != "extras":
+                raise GraphError("Файл %s повреждён" % path)
+            sections[name] = (buffer[offset:offset + length], typecode)
+
+        def column(name):
+            data, typecode = sections[name]
+            if typecode == _DECIMAL:
+                try:
+                    return [int(value) for value in bytes(data).split(b"\n")] if len(data) else []
+                except ValueError:
+                    raise GraphError("Файл %s повреждён" % path)
+            return data.cast(typecode)
+
+        BaseGraph.__init__(self, str(sections["name"][0], "utf-8"), bool(flags & _WEIGHTED))
+        self.DIRECTED = bool(flags & _DIRECTED)
+        names = _Strings(column("name_offsets"), column("name_data"))
+        labels = _Strings(column("label_offsets"), column("label_data"))
+        self._names = names
+        self._ids = _NameIndex(names, column("name_order"))
+        self._node_weights = column("node_weights")
+        self._node_labels = _Column(column("node_labels"), labels)
+        self._offsets = column("offsets")
+        self._targets = column("targets")
+        self._edge_weights = column("edge_weights")
+        self._edge_labels = _Column(column("edge_labels"), labels)
+        if self.DIRECTED:
+            self._reverse_offsets = column("reverse_offsets")
+            self._reverse_targets = column("reverse_targets")
+            self._reverse_edges = column("reverse_edges")
+        else:
+            self._reverse_offsets = self._offsets
+            self._reverse_targets = self._targets
+            self._reverse_edges = None
+        extras = sections["extras"][0]
+        load_extras = (lambda: extras) if len(extras) else None
+        self._node_extras = _Extras(load_extras, 0)
+        self._edge_extras = _Extras(load_extras, 1)
+
+    def __reduce__(self):
+        return MappedGraph, (self._path,)
+
+
+def read_binary(path: str) -> MappedGraph:
+    """
+    Отображает в память граф, записанный write_binary(), и возвращает его
+    в виде неизменяемого графа с интерфейсом FrozenGraph.
+    Дополнительные атрибуты хранятся через pickle и распаковываются при первом
+    обращении к ним, поэтому файлы из недоверенных источников открывать нельзя:
+    pickle может выполнить произвольный код.
+    """
+    return MappedGraph(path)
@@ -1,5 +1,10 @@
 from copy import deepcopy
 from pygraph.basegraph import BaseGraph
+from pygraph.frozen import FrozenGraph
+from pygraph.complement import ComplementGraph
+from pygraph.algorithms.isomorphism import weisfeiler_lehman_hash, exact_hash
+
+_HASH_MASK = (1 << 64) - 1
 
 
 class CommonMixin:
@@ -7,12 +12,57 @@ class CommonMixin:
     Общие методы для всех видов графов.
     """
 
+    def __init__(self):
+        # Номер версии растёт при каждом изменении графа,
+        # вместе с ним сбрасываются закешированные отпечатки
+        self._version = 0
+        self._fingerprints = {}
+        # Сумма хешей вершин и рёбер по модулю 2^64, поддерживается при каждом изменении
+        # и позволяет за O(1) отличить графы с разной структурой
+        self._structure_hash = 0
+
+    def __setstate__(self, state: dict):
+        # Хеши строк различаются между процессами, поэтому после загрузки
+        # копии (pickle, deepcopy) структурный хеш пересчитывается
+        self.__dict__.update(state)
+        self._structure_hash = self._compute_structure_hash()
+
+    def _update_structure_hash(self, delta: int):
+        self._structure_hash = (self._structure_hash + delta) & _HASH_MASK
+
+    def _compute_structure_hash(self) -> int:
+        total = sum(hash(node) for node in self.nodes())
+        total += sum(self._edge_hash(u, v) for u, v in self.edges())
+        return total & _HASH_MASK
+
+    def _changed(self):
+        """
+        Отмечает изменение графа.
+        """
+        self._version += 1
+        if self._fingerprints:
+            self._fingerprints = {}
+
+    def fingerprint(self, exact: bool = False) -> str:
+        """
+        Возвращает отпечаток графа - строку, одинаковую в разных процессах.
+        По умолчанию это хеш Вейсфейлера-Лемана: у изоморфных графов он совпадает,
+        поэтому графы с разными отпечатками заведомо неизоморфны.
+        exact=True возвращает хеш, учитывающий имена вершин, веса, метки
+        и прочие атрибуты: у равных графов он совпадает.
+        Отпечаток кешируется до следующего изменения графа. Изменения атрибутов
+        напрямую через словарь из get_*_attributes() не отслеживаются.
+        """
+        if exact not in self._fingerprints:
+            self._fingerprints[exact] = exact_hash(self) if exact else weisfeiler_lehman_hash(self)
+        return self._fingerprints[exact]
+
     def __str__(self):
         """
         Возвращает строковое представление графа при вызове str() или print().
         """
-        str_nodes = repr(self.nodes())
-        str_edges = repr(self.edges())
+        str_nodes = repr(list(self.nodes()))
+        str_edges = repr(list(self.edges()))
         return "%s %s" % (str_nodes, str_edges)
 
     def __repr__(self):
@@ -25,8 +75,7 @@ class CommonMixin:
         """
         Возвращает итератор для прохода по всем вершинам.
         """
-        for n in self.nodes():
-            yield n
+        return iter(self.nodes())
 
     def __len__(self):
         """
@@ -41,8 +90,7 @@ class CommonMixin:
         for node in graph["target_node"]:
             print(node)
         """
-        for n in self.neighbors(node):
-            yield n
+        return iter(self.neighbors(node))
 
     def order(self):
         """
@@ -54,25 +102,36 @@ class CommonMixin:
         """
         Дополняет граф до полного.
         Модифицирует текущий граф!
+        Недостающие рёбра находятся по таблице соседей и добавляются одним пакетом.
         https://ru.wikipedia.org/wiki/Полный_граф
         """
-        for each in self.nodes():
-            for other in self.nodes():
-                if each != other and not self.has_edge((each, other)):
-                    self.add_edge((each, other))
+        names = self._names
+        neighbors = self._neighbors
+        ids = list(self._ids.values())
+        directed = self.DIRECTED
+        missing = ((names[i], names[j]) for i in ids for j in ids
+                   if i != j and (directed or i < j) and j not in neighbors[i])
+        self.add_edges_from(missing, check_duplicates=False)
+
+    def complement(self) -> ComplementGraph:
+        """
+        Возвращает ленивое представление дополнения графа.
+        В отличие от inverse() оно ничего не копирует и отражает текущее состояние графа.
+        https://ru.wikipedia.org/wiki/Дополнение_графа
+        """
+        return ComplementGraph(self)
 
     def inverse(self):
         """
         Возвращает дополнение графа (обратный граф).
+        Рёбра дополнения перечисляются без построения полного графа,
+        но их количество порядка V², поэтому для больших разреженных графов
+        лучше использовать complement().
         https://ru.wikipedia.org/wiki/Дополнение_графа
         """
-        inv = self.__class__(self.name)
-        for i in self.nodes():
-            inv.add_node(i, attrs=self.get_node_attributes(i))
-        inv.complete()
-        for each in self.edges():
-            if inv.has_edge(each):
-                inv.del_edge(each)
+        inv = self.__class__(self.name, columnar=self.columnar)
+        inv.add_nodes_from((i, 1, "", self.get_node_attributes(i)) for i in self.nodes())
+        inv.add_edges_from(self.complement().edges(), check_duplicates=False)
         return inv
 
     def reverse(self):
@@ -83,7 +142,7 @@ class CommonMixin:
         if not self.DIRECTED:
             return deepcopy(self)
 
-        new_graph = self.__class__(self.name)
+        new_graph = self.__class__(self.name, columnar=self.columnar)
         for i in self.nodes():
             weight = self.get_node_weight(i)
             label = self.get_node_label(i)
@@ -98,30 +157,58 @@ class CommonMixin:
 
         return new_graph
 
+    def freeze(self) -> FrozenGraph:
+        """
+        Возвращает неизменяемый снимок графа в формате CSR.
+        Снимок занимает меньше памяти и быстрее обходится,
+        но не отражает последующие изменения графа.
+        """
+        return FrozenGraph(self)
+
     def __eq__(self, other: BaseGraph) -> bool:
         """
         Возвращает True если множества вершин и рёбер совпадают.
+        Графы разного размера или с разными структурными хешами
+        различаются за O(1), иначе соседи сравниваются как множества за O(V + E).
         """
-
-        def nodes_eq():
-            for each in self.nodes():
-                if not other.has_node(each):
-                    return False
-            for each in other.nodes():
-                if not self.has_node(each):
+        try:
+            if self.DIRECTED != other.DIRECTED:
+                return self._edges_match(other)
+            if self.order() != other.order() or len(self.edges()) != len(other.edges()):
+                return False
+            other_hash = getattr(other, "_structure_hash", None)
+            if other_hash is not None and other_hash != self._structure_hash:
+                return False
+            if self.nodes() != other.nodes():
+                return False
+            for node in self.nodes():
+                mine = self.neighbors(node)
+                theirs = other.neighbors(node)
+                if len(mine) != len(theirs):
                     return False
+                for neighbour in theirs:
+                    if neighbour not in mine:
+                        return False
             return True
+        except AttributeError:
+            return False
 
-        def edges_eq():
-            for edge in self.edges():
-                if not other.has_edge(edge):
+    def _edges_match(self, other) -> bool:
+        """
+        Сравнение графов разной ориентированности поштучной проверкой вершин и рёбер.
+        edges() перечисляет неориентированное ребро один раз, поэтому для него
+        в ориентированном графе проверяются оба направления.
+        """
+        for each in self.nodes():
+            if not other.has_node(each):
+                return False
+        for each in other.nodes():
+            if not self.has_node(each):
+                return False
+        for graph, another in ((self, other), (other, self)):
+            for (u, v) in graph.edges():
+                if not another.has_edge((u, v)):
                     return False
-            for edge in other.edges():
-                if not self.has_edge(edge):
+                if not graph.DIRECTED and not another.has_edge((v, u)):
                     return False
-            return True
-
-        try:
-            return nodes_eq() and edges_eq()
-        except AttributeError:
-            return False
+        return True
@@ -0,0 +1,142 @@
+from itertools import islice
+
+from pygraph.basegraph import BaseGraph
+from pygraph.views import EdgeView, ComplementNeighborView
+
+
+class ComplementGraph(BaseGraph):
+    """
+    Ленивое представление дополнения графа.
+
+    Ничего не копирует: вершины те же, что у исходного графа, а ребро (u, v)
+    при u != v есть в дополнении тогда и только тогда, когда его нет в исходном графе.
+    Петель в дополнении нет. has_edge() отвечает за O(1), соседи вершины
+    вычисляются как разность множества вершин и её соседей в исходном графе
+    при обходе, поэтому дополнение разреженного графа не занимает памяти.
+    Представление отражает текущее состояние исходного графа.
+    """
+
+    def __init__(self, graph):
+        BaseGraph.__init__(self, graph.name, graph.weighted)
+        self.DIRECTED = graph.DIRECTED
+        self._graph = graph
+
+    def __str__(self):
+        """
+        Возвращает строковое представление графа при вызове str() или print().
+        """
+        return "%s %s" % (repr(list(self.nodes())), repr(list(self.edges())))
+
+    def __repr__(self):
+        """
+        Возвращает строковое представление графа при вызове repr().
+        """
+        return "<%s.%s %s>" % (self.__class__.__module__, self.__class__.__name__, str(self))
+
+    def __iter__(self):
+        """
+        Возвращает итератор для прохода по всем вершинам.
+        """
+        return iter(self.nodes())
+
+    def __len__(self):
+        """
+        Вызов len() функции для графа вернёт количество вершин.
+        """
+        return self.order()
+
+    def __contains__(self, node):
+        return self.has_node(node)
+
+    def __getitem__(self, node):
+        """
+        Возвращает итератор для прохода по всем соседям.
+        """
+        return iter(self.neighbors(node))
+
+    def nodes(self):
+        """
+        Возвращает множество вершин.
+        """
+        return self._graph.nodes()
+
+    def order(self) -> int:
+        """
+        Возвращает порядок графа (количество вершин)
+        """
+        return len(self._graph.nodes())
+
+    def has_node(self, node) -> bool:
+        """
+        Возвращает True если указанная вершина присутствует в графе, иначе False.
+        """
+        return self._graph.has_node(node)
+
+    def neighbors(self, node) -> ComplementNeighborView:
+        """
+        Возвращает множество соседей указанной вершины в дополнении.
+        """
+        return ComplementNeighborView(self._graph.nodes(), self._graph.neighbors(node), node)
+
+    def reverse_neighbors(self, node) -> ComplementNeighborView:
+        """
+        Возвращает множество вершин из которых в дополнении есть рёбра к указанной.
+        """
+        if not self.DIRECTED:
+            return self.neighbors(node)
+        return ComplementNeighborView(self._graph.nodes(), self._graph.reverse_neighbors(node), node)
+
+    def node_degree(self, node) -> int:
+        """
+        Возвращает степень указанной вершины.
+        """
+        return len(self.neighbors(node))
+
+    node_out_degree = node_degree
+
+    def node_in_degree(self, node) -> int:
+        """
+        Возвращает входящую степень указанной вершины.
+        """
+        return len(self.reverse_neighbors(node))
+
+    def has_edge(self, edge: tuple) -> bool:
+        """
+        Возвращает True если указанное ребро присутствует в дополнении, иначе False.
+        """
+        u, v = edge
+        return u != v and self._graph.has_node(u) and self._graph.has_node(v) and not self._graph.has_edge(edge)
+
+    def edges(self) -> EdgeView:
+        """
+        Возвращает множество рёбер дополнения.
+        Рёбра перечисляются при обходе, поэтому обход занимает O(V²) времени,
+        но не требует дополнительной памяти.
+        """
+        return EdgeView(self)
+
+    def _edges(self):
+        graph = self._graph
+        nodes = list(graph.nodes())
+        for position, u in enumerate(nodes):
+            neighbours = graph.neighbors(u)
+            # В неориентированном графе каждая пара перечисляется один раз
+            others = nodes if self.DIRECTED else islice(nodes, position + 1, None)
+            for v in others:
+                if v != u and v not in neighbours:
+                    yield (u, v)
+
+    def _edges_count(self) -> int:
+        graph = self._graph
+        order = len(graph.nodes())
+        pairs = order * (order - 1)
+        if not self.DIRECTED:
+            pairs //= 2
+        loops = sum(1 for node in graph.nodes() if graph.has_edge((node, node)))
+        return pairs - (len(graph.edges()) - loops)
+
+    def complement(self):
+        """
+        Дополнение дополнения - исходный граф.
+        """
+        return self._graph
@@ -0,0 +1,78 @@
+from pygraph.union_find import UnionFind
+
+
+class ComponentsMixin:
+    """
+    Отслеживание компонент связности неориентированного графа.
+
+    Отслеживание включается явно методом track_components(). После этого
+    система непересекающихся множеств номеров вершин пополняется при каждом
+    добавлении вершин и рёбер, и вопрос "лежат ли две вершины в одной компоненте"
+    решается почти за константу. Удаление рёбер и вершин не поддерживается
+    системой непересекающихся множеств, поэтому оно лишь помечает данные
+    устаревшими, а пересчёт выполняется при следующем запросе.
+    """
+
+    def __init__(self):
+        self._components_tracked = False
+        # None - компоненты не отслеживаются или устарели
+        self._components = None
+
+    def track_components(self, enabled: bool = True):
+        """
+        Включает или выключает отслеживание компонент связности.
+        """
+        self._components_tracked = enabled
+        self._components = None
+
+    def same_component(self, u, v) -> bool:
+        """
+        Возвращает True если вершины лежат в одной компоненте связности, иначе False.
+        Без включённого отслеживания выполняется обход графа.
+        """
+        iu = self._node_id(u)
+        iv = self._node_id(v)
+        if not self._components_tracked:
+            return self._reachable(iu, iv)
+        return self._tracked_components().connected(iu, iv)
+
+    def components_count(self) -> int:
+        """
+        Возвращает количество компонент связности.
+        """
+        if self._components_tracked:
+            return self._tracked_components().count
+        return self._build_components().count
+
+    def _tracked_components(self) -> UnionFind:
+        if self._components is None:
+            self._components = self._build_components()
+        return self._components
+
+    def _build_components(self) -> UnionFind:
+        components = UnionFind(self._ids.values())
+        for u, neighbors in enumerate(self._neighbors):
+            if neighbors is not None:
+                for v in neighbors:
+                    components.union(u, v)
+        return components
+
+    def _reachable(self, iu: int, iv: int) -> bool:
+        neighbors = self._neighbors
+        visited = {iu}
+        stack = [iu]
+        while stack:
+            node = stack.pop()
+            if node == iv:
+                return True
+            for each in neighbors[node]:
+                if each not in visited:
+                    visited.add(each)
+                    stack.append(each)
+        return False
+
+    def _components_changed(self):
+        """
+        Помечает отслеживаемые компоненты устаревшими.
+        """
+        self._components = None
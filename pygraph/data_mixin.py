@@ -1,47 +1,68 @@
-from pygraph.exceptions import NodeNotFoundError, EdgeNotFoundError, \
-    InvalidWeightError, InvalidLabelError, InvalidAttrKeyError
+from pygraph.attr_store import DictStore, ColumnarStore
+from pygraph.exceptions import InvalidWeightError, InvalidLabelError, InvalidAttrKeyError
 
 
 class DataMixin:
     """
     Добавление поддержки хранения данных для вершин и рёбер.
+    Записи атрибутов вершин хранятся в списке, индексируемом номерами вершин,
+    а записи атрибутов рёбер - в таблице соседей (см. IndexMixin).
+    Что такое запись, определяет хранилище: словарь для DictStore
+    или номер строки в колонках для ColumnarStore.
     """
 
-    def __init__(self):
-        self._edges_attrs = {}
-        self._nodes_attrs = {}
+    def __init__(self, columnar: bool = False):
+        self.columnar = columnar
+        if columnar:
+            self._node_store = ColumnarStore()
+            self._edge_store = ColumnarStore()
+        else:
+            self._node_store = DictStore()
+            self._edge_store = DictStore()
+        self._nodes_attrs = []
+
+    @staticmethod
+    def _make_attributes(weight: int = 1, label: str = "", attrs=None) -> dict:
+        """
+        Проверяет вес, метку и ключи атрибутов и собирает из них
+        словарь атрибутов вершины или ребра.
+        Используется при пакетном добавлении, чтобы записать все атрибуты за раз.
+        """
+        if not isinstance(weight, int):
+            raise InvalidWeightError(weight)
+        if not isinstance(label, str):
+            raise InvalidLabelError(label)
+        data = {"weight": weight, "label": label}
+        if attrs:
+            for key in attrs:
+                if not isinstance(key, str):
+                    raise InvalidAttrKeyError(key)
+            data.update(attrs)
+        return data
 
     def get_node_weight(self, node) -> int:
         """
         Возвращает вес вершины.
         """
-        if node not in self._nodes_attrs:
-            raise NodeNotFoundError(node)
-        return self._nodes_attrs[node]["weight"]
+        return self._node_store.get(self._nodes_attrs[self._node_id(node)], "weight")
 
     def get_node_label(self, node) -> str:
         """
         Возвращает метку вершины.
         """
-        if node not in self._nodes_attrs:
-            raise NodeNotFoundError(node)
-        return self._nodes_attrs[node]["label"]
+        return self._node_store.get(self._nodes_attrs[self._node_id(node)], "label")
 
     def get_edge_weight(self, edge: tuple) -> int:
         """
         Возвращает вес ребра.
         """
-        if edge not in self._edges_attrs:
-            raise EdgeNotFoundError(edge)
-        return self._edges_attrs[edge]["weight"]
+        return self._edge_store.get(self._edge_record(edge), "weight")
 
     def get_edge_label(self, edge: tuple) -> str:
         """
         Возвращает метку ребра.
         """
-        if edge not in self._edges_attrs:
-            raise EdgeNotFoundError(edge)
-        return self._edges_attrs[edge]["label"]
+        return self._edge_store.get(self._edge_record(edge), "label")
 
     def set_node_weight(self, node, weight: int):
         """
@@ -82,24 +103,19 @@ class DataMixin:
         """
         if not isinstance(key, str):
             raise InvalidAttrKeyError(key)
-        if node not in self._nodes_attrs:
-            self._nodes_attrs[node] = {}
-        self._nodes_attrs[node][key] = value
+        self._node_store.set(self._nodes_attrs[self._node_id(node)], key, value)
+        self._changed()
 
     def add_edge_attribute(self, edge: tuple, key: str, value):
         """
         Добавляет атрибут к ребру.
         Если такой атрибут уже существовал, то его значение заменяется.
+        У неориентированного ребра одна запись атрибутов на оба направления.
         """
         if not isinstance(key, str):
             raise InvalidAttrKeyError(key)
-        if edge not in self._edges_attrs:
-            self._edges_attrs[edge] = {}
-        self._edges_attrs[edge][key] = value
-        if not self.DIRECTED and edge[0] != edge[1]:
-            if (edge[1], edge[0]) not in self._edges_attrs:
-                self._edges_attrs[(edge[1], edge[0])] = {}
-            self._edges_attrs[(edge[1], edge[0])][key] = value
+        self._edge_store.set(self._edge_record(edge), key, value)
+        self._changed()
 
     def add_node_attributes(self, node, attrs: dict):
         """
@@ -121,83 +137,60 @@ class DataMixin:
         """
         Возвращает словарь состоящий из атрибутов вершины.
         Каждый элемент словаря имеет вид имя_атрибута: значение.
+        В колоночном хранилище вместо словаря возвращается его лёгкое представление.
         """
-        if node not in self._nodes_attrs:
-            raise NodeNotFoundError(node)
-        return self._nodes_attrs[node]
+        return self._node_store.attributes(self._nodes_attrs[self._node_id(node)])
 
     def get_edge_attributes(self, edge) -> dict:
         """
         Возвращает словарь состоящий из атрибутов ребра.
         Каждый элемент словаря имеет вид имя_атрибута: значение.
+        В колоночном хранилище вместо словаря возвращается его лёгкое представление.
         """
-        if edge not in self._edges_attrs:
-            raise EdgeNotFoundError(edge)
-        return self._edges_attrs[edge]
+        return self._edge_store.attributes(self._edge_record(edge))
+
+    def _weighted_neighbors(self, node, reverse: bool = False) -> list:
+        """
+        Возвращает список пар (сосед, вес ребра) за один проход по таблице соседей.
+        reverse=True для ориентированного графа перебирает входящие рёбра.
+        """
+        table = self._reverse_neighbors if reverse and self.DIRECTED else self._neighbors
+        names = self._names
+        weight = self._edge_store.weight_getter()
+        try:
+            return [(names[i], weight(record)) for i, record in table[self._node_id(node)].items()]
+        except KeyError:
+            raise InvalidAttrKeyError("weight")
 
     def del_node_attribute(self, node, key: str):
         """
         Удаление атрибута с указанным ключём у вершины.
         """
-        if node not in self._nodes_attrs:
-            raise NodeNotFoundError(node)
-        if key not in self._nodes_attrs[node]:
+        record = self._nodes_attrs[self._node_id(node)]
+        if not self._node_store.has(record, key):
             raise InvalidAttrKeyError(key)
-        del (self._nodes_attrs[node][key])
+        self._node_store.delete(record, key)
+        self._changed()
 
     def del_edge_attribute(self, edge: tuple, key: str):
-        if edge not in self._edges_attrs:
-            raise EdgeNotFoundError(edge)
-        if key not in self._edges_attrs[edge]:
+        record = self._edge_record(edge)
+        if not self._edge_store.has(record, key):
             raise InvalidAttrKeyError(key)
-        del (self._edges_attrs[edge][key])
-
-    def del_node_data(self, node):
-        if node in self._nodes_attrs:
-            del (self._nodes_attrs[node])
-        else:
-            raise NodeNotFoundError(node)
-
-    def del_edge_data(self, edge):
-        if edge not in self._edges_attrs:
-            raise EdgeNotFoundError(edge)
-        del (self._edges_attrs[edge])
-
-        if not self.DIRECTED and edge[0] != edge[1]:
-            reversed_edge = edge[::-1]
-            if reversed_edge not in self._edges_attrs:
-                raise EdgeNotFoundError(reversed_edge)
-            del (self._edges_attrs[reversed_edge])
+        self._edge_store.delete(record, key)
+        self._changed()
 
     def __eq__(self, other):
         """
         Возвращает True если атрибуты рёбер и вершин совпадают, иначе False.
         """
-
-        def attrs_eq(attrs1: dict, attrs2: dict):
-            for key1 in attrs1:
-                if key1 not in attrs2:
-                    return False
-                if attrs1[key1] != attrs2[key1]:
-                    return False
-
-            for key2 in attrs2:
-                if key2 not in attrs1:
-                    return False
-                if attrs1[key2] != attrs2[key2]:
-                    return False
-            return True
-
-        def nodes_eq():
-            for node in self.nodes():
-                if not attrs_eq(self.get_node_attributes(node), other.get_node_attributes(node)):
-                    return False
-            return True
-
-        def edges_eq():
-            for edge in self.edges():
-                if not attrs_eq(self.get_edge_attributes(edge), other.get_edge_attributes(edge)):
-                    return False
-            return True
-
-        return nodes_eq() and edges_eq()
+        for node in self.nodes():
+            if self.get_node_attributes(node) != other.get_node_attributes(node):
+                return False
+        for (u, v) in self.edges():
+            attributes = self.get_edge_attributes((u, v))
+            if attributes != other.get_edge_attributes((u, v)):
+                return False
+            # Неориентированное ребро перечисляется один раз, а в ориентированном графе ему соответствуют два
+            if not self.DIRECTED and other.DIRECTED and attributes != other.get_edge_attributes((v, u)):
+                return False
+        return True
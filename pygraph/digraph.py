@@ -1,79 +1,97 @@
+from itertools import repeat
 from pygraph.basegraph import BaseGraph
 from pygraph.data_mixin import DataMixin
+from pygraph.index_mixin import IndexMixin
 from pygraph.common_mixin import CommonMixin
-from pygraph.exceptions import AdditionError, InvalidGraphType, NodeNotFoundError, EdgeNotFoundError
+from pygraph.views import NodeView, NeighborView, EdgeView
+from pygraph.exceptions import AdditionError, InvalidGraphType
 
 
-class DiGraph(CommonMixin, DataMixin, BaseGraph):
+class DiGraph(CommonMixin, DataMixin, IndexMixin, BaseGraph):
     """
     Класс описывающий ориентированный граф.
     """
     DIRECTED = True
 
-    def __init__(self, name, weighted=False):
+    def __init__(self, name, weighted=False, columnar=False):
         """
         Инициализация ориентированного графа.
+        columnar=True включает колоночное хранение атрибутов (см. ColumnarStore),
+        заметно уменьшающее расход памяти на больших графах.
         """
         CommonMixin.__init__(self)
-        DataMixin.__init__(self)
+        DataMixin.__init__(self, columnar)
+        IndexMixin.__init__(self)
         BaseGraph.__init__(self, name, weighted)
-        self._neighbors = {}
-        self._reverse_neighbors = {}
+        # Соседи хранятся в ключах словарей: они сохраняют порядок добавления
+        # и позволяют проверять наличие и удалять соседа за O(1).
+        # Значения обоих словарей - одна и та же запись атрибутов ребра.
+        self._neighbors = []
+        self._reverse_neighbors = []
+        self._size = 0
 
-    def nodes(self) -> list:
+    def _id_tables(self) -> tuple:
+        return self._neighbors, self._reverse_neighbors, self._nodes_attrs
+
+    def nodes(self) -> NodeView:
         """
-        Возвращает список вершин.
+        Возвращает множество вершин.
+        Это представление без копирования, отражающее текущее состояние графа.
         """
-        return list(self._neighbors.keys())
+        return NodeView(self._ids)
 
     def node_in_degree(self, node) -> int:
         """
         Возвращает входящую степень указанной вершины.
         """
-        if node not in self._neighbors:
-            raise NodeNotFoundError(node)
-        return len(self.reverse_neighbors(node))
+        return len(self._reverse_neighbors[self._node_id(node)])
 
     def node_out_degree(self, node) -> int:
         """
         Возвращает исходящую степень указанной вершины.
         """
-        if node not in self._neighbors:
-            raise NodeNotFoundError(node)
-        return len(self.neighbors(node))
+        return len(self._neighbors[self._node_id(node)])
 
-    def neighbors(self, node) -> list:
+    def neighbors(self, node) -> NeighborView:
         """
-        Возвращает список соседей указанной вершины.
+        Возвращает множество соседей указанной вершины в порядке добавления рёбер.
+        Это представление без копирования, отражающее текущее состояние графа.
         """
-        if node not in self._neighbors:
-            raise NodeNotFoundError(node)
-        return self._neighbors[node]
+        return NeighborView(self._neighbors[self._node_id(node)], self._ids, self._names)
 
-    def reverse_neighbors(self, node) -> list:
+    def reverse_neighbors(self, node) -> NeighborView:
         """
-        Возвращает список вершин из которых есть рёбра исходящие к указанной.
+        Возвращает множество вершин из которых есть рёбра исходящие к указанной.
+        Это представление без копирования, отражающее текущее состояние графа.
         """
-        if node not in self._neighbors:
-            raise NodeNotFoundError(node)
-        return self._reverse_neighbors[node]
+        return NeighborView(self._reverse_neighbors[self._node_id(node)], self._ids, self._names)
 
-    def edges(self) -> list:
+    def edges(self) -> EdgeView:
         """
-        Возвращает список рёбер.
+        Возвращает множество рёбер.
+        Это представление без копирования, отражающее текущее состояние графа.
         """
-        return [a for a in self._edges()]
+        return EdgeView(self)
 
     def _edges(self):
-        for n, neighbors in self._neighbors.items():
-            for neighbor in neighbors:
-                yield (n, neighbor)
+        names = self._names
+        for u, neighbors in enumerate(self._neighbors):
+            if neighbors is not None:
+                for v in neighbors:
+                    yield (names[u], names[v])
+
+    def _edges_count(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _edge_hash(u, v) -> int:
+        return hash((u, v))
 
     def has_node(self, node) -> bool:
         """
         Возвращает True если указанная вершина присутствует в графе, иначе False.
         """
-        return node in self._neighbors
+        return node in self._ids
 
     def add_node(self, node, weight: int = 1, label: str = "", attrs=None):
         """
@@ -82,17 +100,61 @@ class DiGraph(CommonMixin, DataMixin, BaseGraph):
         Опциально можно указать вес вершины, метку и другие атрибуты,
         передав их в в виде словаря с элементами вида имя_атрибута: значение.
         """
-        if attrs is None:
-            attrs = {}
-        if node not in self._neighbors:
-            self._neighbors[node] = []
-            self._reverse_neighbors[node] = []
-            self.set_node_weight(node, weight)
-            self.set_node_label(node, label)
-            self.add_node_attributes(node, attrs)
-        else:
+        if node in self._ids:
             raise AdditionError("Вершина %s уже присутствует в графе" % node)
 
+        data = self._make_attributes(weight, label, attrs)
+        i = self._new_id(node)
+        self._neighbors[i] = {}
+        self._reverse_neighbors[i] = {}
+        self._nodes_attrs[i] = self._node_store.new(data)
+        self._changed()
+        self._update_structure_hash(hash(node))
+
+    def add_nodes_from(self, nodes, check_duplicates: bool = True):
+        """
+        Добавляет к графу набор вершин.
+        Каждый элемент - либо вершина, либо кортеж вида
+        (вершина[, вес[, метка[, атрибуты]]]).
+        Добавление атомарно: при ошибке в любом элементе добавленные
+        из набора вершины удаляются и граф остаётся прежним.
+        check_duplicates=False отключает проверку повторов и откат
+        и годится только для заведомо корректных данных.
+        """
+        ids = self._ids
+        neighbors = self._neighbors
+        reverse_neighbors = self._reverse_neighbors
+        nodes_attrs = self._nodes_attrs
+        make_attributes = self._make_attributes
+        new_record = self._node_store.new
+        new_id = self._new_id
+        self._changed()
+        added = []
+        structure_hash = 0
+        try:
+            for item in nodes:
+                if isinstance(item, tuple):
+                    node, data = item[0], make_attributes(*item[1:])
+                else:
+                    node, data = item, {"weight": 1, "label": ""}
+                if check_duplicates:
+                    if node in ids:
+                        raise AdditionError("Вершина %s уже присутствует в графе" % node)
+                    added.append(node)
+                i = new_id(node)
+                neighbors[i] = {}
+                reverse_neighbors[i] = {}
+                nodes_attrs[i] = new_record(data)
+                structure_hash += hash(node)
+        except Exception:
+            self._update_structure_hash(structure_hash)
+            for node in added:
+                self._update_structure_hash(-hash(node))
+                self._node_store.release(nodes_attrs[ids[node]])
+                self._release_id(node)
+            raise
+        self._update_structure_hash(structure_hash)
+
     def add_edge(self, edge, weight: int = 1, label: str = "", attrs=None):
         """
         Добавляет направленное ребро соединяющее две вершины.
@@ -100,64 +162,167 @@ class DiGraph(CommonMixin, DataMixin, BaseGraph):
         Опциально можно указать вес ребра, метку и другие атрибуты,
         передав их в в виде словаря с элементами вида имя_атрибута: значение.
         """
-        if attrs is None:
-            attrs = {}
         u, v = edge
         for n in [u, v]:
-            if n not in self._neighbors:
+            if n not in self._ids:
                 raise AdditionError("Вершина %s отсутствует в таблице соседей" % n)
-            if n not in self._reverse_neighbors:
-                raise AdditionError("Вершина %s отсутствует в обратной таблице соседей" % n)
 
-        if v in self._neighbors[u] and u in self._reverse_neighbors[v]:
+        iu = self._ids[u]
+        iv = self._ids[v]
+        if iv in self._neighbors[iu]:
             raise AdditionError("Ребро (%s, %s) уже присутствует в графе" % (u, v))
-        else:
-            self._neighbors[u].append(v)
-            self._reverse_neighbors[v].append(u)
-            self.set_edge_weight(edge, weight)
-            self.set_edge_label(edge, label)
-            self.add_edge_attributes(edge, attrs)
+
+        record = self._edge_store.new(self._make_attributes(weight, label, attrs))
+        self._neighbors[iu][iv] = record
+        self._reverse_neighbors[iv][iu] = record
+        self._size += 1
+        self._changed()
+        self._update_structure_hash(self._edge_hash(u, v))
+
+    def add_edges_from(self, edges, check_duplicates: bool = True):
+        """
+        Добавляет к графу набор направленных рёбер.
+        Каждый элемент - кортеж вида (u, v[, вес[, метка[, атрибуты]]]).
+        Добавление атомарно: при ошибке в любом элементе добавленные
+        из набора рёбра удаляются и граф остаётся прежним.
+        check_duplicates=False отключает проверку наличия вершин и откат
+        и годится только для заведомо корректных данных; повторные рёбра
+        при этом не вызывают ошибку, а пропускаются.
+        """
+        ids = self._ids
+        neighbors = self._neighbors
+        reverse_neighbors = self._reverse_neighbors
+        make_attributes = self._make_attributes
+        new_record = self._edge_store.new
+        self._changed()
+        edge_hash = self._edge_hash
+        added = []
+        size = 0
+        structure_hash = 0
+        try:
+            for item in edges:
+                u, v = item[0], item[1]
+                if len(item) == 2:
+                    data = {"weight": 1, "label": ""}
+                else:
+                    data = make_attributes(*item[2:])
+                if check_duplicates:
+                    if u not in ids:
+                        raise AdditionError("Вершина %s отсутствует в таблице соседей" % u)
+                    if v not in ids:
+                        raise AdditionError("Вершина %s отсутствует в таблице соседей" % v)
+                iu = ids[u]
+                iv = ids[v]
+                if iv in neighbors[iu]:
+                    if check_duplicates:
+                        raise AdditionError("Ребро (%s, %s) уже присутствует в графе" % (u, v))
+                    # Без проверки повтор пропускается, остаётся первое ребро
+                    continue
+                if check_duplicates:
+                    added.append((u, v))
+                record = new_record(data)
+                neighbors[iu][iv] = record
+                reverse_neighbors[iv][iu] = record
+                size += 1
+                structure_hash += edge_hash(u, v)
+        except Exception:
+            self._size += size
+            self._update_structure_hash(structure_hash)
+            for edge in reversed(added):
+                self.del_edge(edge)
+            raise
+        self._size += size
+        self._update_structure_hash(structure_hash)
 
     def del_node(self, node):
         """
         Удаляет вершину из графа.
         """
-        if node not in self._neighbors or node not in self._reverse_neighbors:
-            raise NodeNotFoundError(node)
-
-        for each in list(self.reverse_neighbors(node)):
-            # Удаление всех рёбер инцидентных с заданной вершиной
-            self.del_edge((each, node))
-
-        for each in list(self.neighbors(node)):
-            # Удаление у соседей информации о рёбрах ведущих в указанную вершину
-            self.del_edge((node, each))
+        i = self._node_id(node)
 
-        # Удаление указанной вершины из таблицы соседей и инцидентности
-        del (self._neighbors[node])
-        del (self._reverse_neighbors[node])
+        # Удаление у соседей информации о рёбрах ведущих в указанную вершину и из неё
+        edge_store = self._edge_store
+        names = self._names
+        structure_hash = hash(node)
+        for each in self._reverse_neighbors[i]:
+            structure_hash += self._edge_hash(names[each], node)
+            edge_store.release(self._neighbors[each].pop(i))
+        for each in self._neighbors[i]:
+            if each != i:
+                structure_hash += self._edge_hash(node, names[each])
+                edge_store.release(self._reverse_neighbors[each].pop(i))
+        # Петля к этому моменту уже удалена из _neighbors[i], поэтому учитывается один раз
+        self._size -= len(self._neighbors[i]) + len(self._reverse_neighbors[i])
 
-        # Удаление атрибутов вершины
-        self.del_node_data(node)
+        # Удаление вершины из таблиц соседей, инцидентности и атрибутов
+        self._node_store.release(self._nodes_attrs[i])
+        self._release_id(node)
+        self._changed()
+        self._update_structure_hash(-structure_hash)
 
     def del_edge(self, edge: tuple):
         """
         Удаление направленного ребра.
         """
-        if edge not in self._edges_attrs:
-            raise EdgeNotFoundError(edge)
-
+        self._edge_record(edge)
         u, v = edge
-        self._neighbors[u].remove(v)
-        self._reverse_neighbors[v].remove(u)
-        self.del_edge_data((u, v))
+        iu = self._ids[u]
+        iv = self._ids[v]
+        self._edge_store.release(self._neighbors[iu].pop(iv))
+        del (self._reverse_neighbors[iv][iu])
+        self._size -= 1
+        self._changed()
+        self._update_structure_hash(-self._edge_hash(u, v))
+
+    def _add_edges_by_id(self, sources, targets, weights=None, check_duplicates: bool = True):
+        """
+        Пакетное добавление рёбер по внутренним номерам вершин.
+        sources и targets - номера концов рёбер, weights - целые веса или None (все веса 1).
+        В отличие от add_edges_from() имена не разрешаются и атрибуты не проверяются,
+        поэтому метод годится только для загрузчиков, которые уже перевели имена
+        в номера существующих вершин. Атомарность и check_duplicates - как в add_edges_from().
+        """
+        names = self._names
+        neighbors = self._neighbors
+        reverse_neighbors = self._reverse_neighbors
+        new_record = self._edge_store.new
+        self._changed()
+        edge_hash = self._edge_hash
+        if weights is None:
+            weights = repeat(1)
+        added = []
+        size = 0
+        structure_hash = 0
+        try:
+            for iu, iv, weight in zip(sources, targets, weights):
+                if iv in neighbors[iu]:
+                    if check_duplicates:
+                        raise AdditionError("Ребро (%s, %s) уже присутствует в графе" % (names[iu], names[iv]))
+                    continue
+                if check_duplicates:
+                    added.append((names[iu], names[iv]))
+                record = new_record({"weight": weight, "label": ""})
+                neighbors[iu][iv] = record
+                reverse_neighbors[iv][iu] = record
+                size += 1
+                structure_hash += edge_hash(names[iu], names[iv])
+        except Exception:
+            self._size += size
+            self._update_structure_hash(structure_hash)
+            for edge in reversed(added):
+                self.del_edge(edge)
+            raise
+        self._size += size
+        self._update_structure_hash(structure_hash)
 
     def has_edge(self, edge: tuple) -> bool:
         """
         Возвращает True если указанное ребро присутствует в графе, иначе False.
         """
         u, v = edge
-        return u in self._neighbors and v in self._neighbors[u]
+        iu = self._ids.get(u)
+        iv = self._ids.get(v)
+        return iu is not None and iv is not None and iv in self._neighbors[iu]
 
     def __eq__(self, other):
         """
@@ -0,0 +1,344 @@
+import re
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import GraphError, InvalidWeightError
+
+CHUNK_SIZE = 1 << 16
+
+# Пробелы и комментарии пропускаются тем же сопоставлением, что и следующая лексема.
+# Если лексема не распознана, ни одна группа не совпадает.
+_TOKEN = re.compile(r"""
+    (?:\s+|//[^\n]*|\#[^\n]*|/\*.*?\*/)*
+    (?:
+        (?P<id>[^\W\d]\w*|-?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?))
+      | (?P<string>"(?:[^"\\]|\\.)*")
+      | (?P<edgeop>--|->)
+      | (?P<punct>[{}\[\];,=:+])
+      | (?P<html><)
+    )?
+""", re.VERBOSE | re.DOTALL)
+
+_KEYWORDS = frozenset(["strict", "graph", "digraph", "node", "edge", "subgraph"])
+_KEYWORD_INITIALS = frozenset("sgdneSGDNE")
+
+_EOF = (None, None)
+
+
+# Экранированные кавычка и обратная косая черта, а также перенос длинной строки
+_ESCAPE = re.compile(r'\\(["\\]|\r?\n)')
+
+
+def _unquote(string: str) -> str:
+    # Экранирование разбирается за один проход слева направо,
+    # иначе \\" было бы прочитано как кавычка
+    return _ESCAPE.sub(lambda match: match.group(1) if match.group(1) in '"\\' else "", string[1:-1])
+
+
+def _html_end(buffer: str, pos: int) -> int:
+    """
+    Возвращает позицию сразу за HTML-строкой <...> начинающейся в pos
+    или -1 если строка в буфере не закончилась.
+    """
+    depth = 0
+    for index in range(pos, len(buffer)):
+        char = buffer[index]
+        if char == "<":
+            depth += 1
+        elif char == ">":
+            depth -= 1
+            if not depth:
+                return index + 1
+    return -1
+
+
+def tokenize(fileobj, chunk_size: int = CHUNK_SIZE):
+    """
+    Генератор лексем DOT, читающий текст из файлового объекта частями.
+    Выдаёт пары (вид, значение): вид "id" для идентификаторов, чисел и строк
+    (значение уже без кавычек), "keyword" для ключевых слов, "edgeop" для
+    -- и ->, а для знаков препинания вид совпадает с самим знаком.
+    В памяти держится только текущая часть файла.
+    """
+    buffer = ""
+    size = pos = 0
+    # Смещение начала буфера в файле, используется в сообщениях об ошибках
+    offset = 0
+    eof = False
+    match_token = _TOKEN.match
+    while True:
+        match = match_token(buffer, pos)
+        kind = match.lastgroup
+        end = match.end()
+        if kind == "html":
+            end = _html_end(buffer, match.start(kind))
+        # Лексема может продолжаться в следующей части файла: дочитываем и повторяем
+        if not eof and (kind is None or end == -1 or end == size):
+            chunk = fileobj.read(chunk_size)
+            offset += pos
+            buffer = buffer[pos:] + chunk
+            size, pos = len(buffer), 0
+            eof = not chunk
+            continue
+        if kind is None or end == -1:
+            if end == size:
+                return
+            position = match.end()
+            raise GraphError("Ошибка разбора DOT: неожиданный символ %s на позиции %d"
+                             % (repr(buffer[position]), offset + position))
+        if kind == "id":
+            value = match.group(kind)
+            if value[0] in _KEYWORD_INITIALS and value.lower() in _KEYWORDS:
+                yield "keyword", value.lower()
+            else:
+                yield "id", value
+        elif kind == "punct":
+            value = match.group(kind)
+            yield value, value
+        elif kind == "string":
+            yield "id", _unquote(match.group(kind))
+        elif kind == "edgeop":
+            yield kind, match.group(kind)
+        else:
+            yield "id", buffer[match.start(kind) + 1:end - 1]
+        pos = end
+
+
+_PLAIN_ID = re.compile(r"(?:[^\W\d]\w*|-?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?))\Z")
+
+WRITE_BATCH = 4096
+
+
+def quote(value) -> str:
+    """
+    Возвращает значение в виде идентификатора DOT, заключая его в кавычки
+    если оно не является простым идентификатором или числом.
+    """
+    value = str(value)
+    if _PLAIN_ID.match(value) and value.lower() not in _KEYWORDS:
+        return value
+    # Сначала обратная косая черта, чтобы она не экранировала закрывающую кавычку
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _attributes_line(attrs, skip_weight: bool) -> str:
+    items = ["%s=%s" % (quote(key), quote(value)) for key, value in attrs.items()
+             if not (skip_weight and key == "weight")]
+    if not items:
+        return ";\n"
+    return " [" + ", ".join(items) + "];\n"
+
+
+def write_dot(graph, fileobj, batch: int = WRITE_BATCH):
+    """
+    Записывает граф в формате DOT в текстовый файловый объект.
+    Строки копятся пачками по batch штук и записываются одним вызовом write(),
+    поэтому дополнительная память не зависит от размера графа.
+    Граф не изменяется: вес у невзвешенного графа просто не выводится.
+    Каждое ребро неориентированного графа перечисляется edges() один раз,
+    так что отдельная проверка повторов не нужна.
+    """
+    skip_weight = not graph.weighted
+    edge_op = " -> " if graph.DIRECTED else " -- "
+    lines = ["%s %s{\n" % ("digraph" if graph.DIRECTED else "graph",
+                           quote(graph.name) + " " if graph.name else "")]
+    for node in graph.nodes():
+        lines.append(quote(node) + _attributes_line(graph.get_node_attributes(node), skip_weight))
+        if len(lines) >= batch:
+            fileobj.write("".join(lines))
+            lines.clear()
+    for edge in graph.edges():
+        lines.append(quote(edge[0]) + edge_op + quote(edge[1]) +
+                     _attributes_line(graph.get_edge_attributes(edge), skip_weight))
+        if len(lines) >= batch:
+            fileobj.write("".join(lines))
+            lines.clear()
+    lines.append("}\n")
+    fileobj.write("".join(lines))
+
+
+def _weight(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise InvalidWeightError(value)
+
+
+class DotParser:
+    """
+    Потоковый разборщик DOT.
+    Вершины и рёбра добавляются в граф сразу по мере разбора операторов,
+    без построения промежуточного дерева. Поддерживается одно описание графа
+    (graph или digraph), атрибуты вершин и рёбер,
+    атрибуты по умолчанию (node [...] и edge [...]), цепочки рёбер a -- b -- c,
+    строки в кавычках с конкатенацией через +, HTML-строки и комментарии.
+    Атрибуты графа и порты вершин пропускаются, подграфы не поддерживаются.
+    В strict-графе повторное ребро объединяется с уже существующим,
+    в обычном - приводит к AdditionError, так как кратные рёбра не поддерживаются.
+    """
+
+    def __init__(self, fileobj, chunk_size: int = CHUNK_SIZE, columnar: bool = False):
+        self._tokens = tokenize(fileobj, chunk_size)
+        self._pending = []
+        self._columnar = columnar
+        self._node_defaults = {}
+        self._edge_defaults = {}
+        self._strict = False
+        self.graph = None
+
+    def _next(self) -> tuple:
+        if self._pending:
+            return self._pending.pop()
+        return next(self._tokens, _EOF)
+
+    def _peek(self) -> tuple:
+        if not self._pending:
+            self._pending.append(next(self._tokens, _EOF))
+        return self._pending[-1]
+
+    @staticmethod
+    def _unexpected(token: tuple):
+        if token is _EOF:
+            return GraphError("Ошибка разбора DOT: неожиданный конец файла")
+        return GraphError("Ошибка разбора DOT: неожиданная лексема %s" % repr(token[1]))
+
+    def _expect(self, kind: str) -> str:
+        token = self._next()
+        if token[0] != kind:
+            raise self._unexpected(token)
+        return token[1]
+
+    def _identifier(self) -> str:
+        value = self._expect("id")
+        while self._peek()[0] == "+":
+            self._next()
+            value += self._expect("id")
+        return value
+
+    def _skip_port(self):
+        while self._peek()[0] == ":":
+            self._next()
+            self._identifier()
+
+    def _attributes(self) -> dict:
+        attrs = {}
+        while self._peek()[0] == "[":
+            self._next()
+            while True:
+                kind, value = self._next()
+                if kind == "]":
+                    break
+                if kind in (";", ","):
+                    continue
+                if kind != "id":
+                    raise self._unexpected((kind, value))
+                if self._peek()[0] == "=":
+                    self._next()
+                    attrs[value] = self._identifier()
+                else:
+                    attrs[value] = "true"
+        return attrs
+
+    def parse(self):
+        """
+        Разбирает описание графа и возвращает построенный граф.
+        """
+        token = self._next()
+        if token == ("keyword", "strict"):
+            self._strict = True
+            token = self._next()
+        if token == ("keyword", "graph"):
+            graph_type, edge_op = Graph, "--"
+        elif token == ("keyword", "digraph"):
+            graph_type, edge_op = DiGraph, "->"
+        else:
+            raise self._unexpected(token)
+        name = self._identifier() if self._peek()[0] == "id" else ""
+        self._expect("{")
+        self.graph = graph_type(name, columnar=self._columnar)
+        self._statements(edge_op)
+        if self._next() is not _EOF:
+            raise GraphError("Строка содержит 0 или более 1 графа")
+        return self.graph
+
+    def _statements(self, edge_op: str):
+        while True:
+            token = self._next()
+            kind, value = token
+            if kind == "}":
+                return
+            if kind in (";", ","):
+                continue
+            if kind == "keyword" and value in ("graph", "node", "edge"):
+                attrs = self._attributes()
+                if value == "node":
+                    self._node_defaults.update(attrs)
+                elif value == "edge":
+                    self._edge_defaults.update(attrs)
+                continue
+            if kind == "{" or token == ("keyword", "subgraph"):
+                raise GraphError("Подграфы в DOT не поддерживаются")
+            if kind != "id":
+                raise self._unexpected(token)
+            self._pending.append(token)
+            node = self._identifier()
+            self._skip_port()
+            if self._peek()[0] == "=":
+                # Атрибут графа
+                self._next()
+                self._identifier()
+                continue
+            if self._peek()[0] != "edgeop":
+                self._add_node(node, self._attributes())
+                continue
+            chain = [node]
+            while self._peek()[0] == "edgeop":
+                found = self._next()[1]
+                if found != edge_op:
+                    raise GraphError("Ошибка разбора DOT: ребро %s не соответствует типу графа" % found)
+                chain.append(self._identifier())
+                self._skip_port()
+            attrs = self._attributes()
+            for index in range(1, len(chain)):
+                self._add_edge(chain[index - 1], chain[index], attrs)
+
+    def _split(self, defaults: dict, attrs: dict) -> tuple:
+        # Копия нужна и потому, что одни атрибуты используются всей цепочкой рёбер
+        attrs = dict(defaults, **attrs)
+        weight = attrs.pop("weight", None)
+        if weight is not None:
+            self.graph.weighted = True
+            weight = _weight(weight)
+        return weight, attrs.pop("label", None), attrs
+
+    def _add_node(self, node: str, attrs: dict):
+        graph = self.graph
+        if not graph.has_node(node):
+            weight, label, attrs = self._split(self._node_defaults, attrs)
+            graph.add_node(node, weight=1 if weight is None else weight,
+                           label="" if label is None else label, attrs=attrs)
+            return
+        # Повторное упоминание вершины дополняет её атрибуты
+        weight, label, attrs = self._split({}, attrs)
+        if weight is not None:
+            graph.set_node_weight(node, weight)
+        if label is not None:
+            graph.set_node_label(node, label)
+        graph.add_node_attributes(node, attrs)
+
+    def _add_edge(self, u: str, v: str, attrs: dict):
+        graph = self.graph
+        for node in (u, v):
+            if not graph.has_node(node):
+                self._add_node(node, {})
+        if self._strict and graph.has_edge((u, v)):
+            # В strict-графе повторное ребро не создаётся, а дополняет атрибуты существующего
+            weight, label, attrs = self._split({}, attrs)
+            if weight is not None:
+                graph.set_edge_weight((u, v), weight)
+            if label is not None:
+                graph.set_edge_label((u, v), label)
+            graph.add_edge_attributes((u, v), attrs)
+            return
+        weight, label, attrs = self._split(self._edge_defaults, attrs)
+        graph.add_edge((u, v), weight=1 if weight is None else weight,
+                       label="" if label is None else label, attrs=attrs)
@@ -0,0 +1,256 @@
+import csv
+import io
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import GraphError, InvalidWeightError
+
+EDGE_BATCH = 1 << 14
+# Частей файла на один процесс: запас на случай неравномерной длины строк
+CHUNKS_PER_WORKER = 4
+
+
+def _column_index(column, header: list) -> int:
+    """
+    Возвращает номер столбца, заданного номером или именем из заголовка.
+    """
+    if isinstance(column, int):
+        return column
+    if header is None:
+        raise GraphError("Столбец %s задан именем, но заголовок не прочитан" % repr(column))
+    try:
+        return header.index(column)
+    except ValueError:
+        raise GraphError("Столбец %s отсутствует в заголовке" % repr(column))
+
+
+def _weight_error(weight: str, line: int, place: str = None) -> InvalidWeightError:
+    error = InvalidWeightError(weight)
+    error.msg = "%s: %s" % (place or "Строка %d" % line, error.msg)
+    error.line = line
+    return error
+
+
+def read_edgelist(fileobj, directed: bool = False, name: str = "", delimiter: str = ",",
+                  header: bool = False, source=0, target=1, weight_column=None,
+                  label_column=None, attr_columns=(), check_duplicates: bool = True,
+                  batch: int = EDGE_BATCH, columnar: bool = False):
+    """
+    Чтение графа из списка рёбер в формате CSV.
+    fileobj - текстовый файловый объект (файлы лучше открывать с newline="").
+    Столбцы задаются номерами или, при header=True, именами из первой строки.
+    Значения столбцов attr_columns сохраняются как атрибуты рёбер под именами
+    из заголовка, а без заголовка - под номерами столбцов в виде строк.
+    Строки читаются пачками по batch штук: новые вершины пачки добавляются
+    одним вызовом add_nodes_from(), рёбра - одним пакетным добавлением.
+    Пустые строки пропускаются. Вершины без рёбер в списке рёбер не представлены.
+    """
+    graph = (DiGraph if directed else Graph)(name, weighted=weight_column is not None, columnar=columnar)
+    reader = csv.reader(fileobj, delimiter=delimiter)
+    names = next(reader, None) if header else None
+    source = _column_index(source, names)
+    target = _column_index(target, names)
+    weight_index = None if weight_column is None else _column_index(weight_column, names)
+    label_index = None if label_column is None else _column_index(label_column, names)
+    attrs = [(names[index] if names else str(index), index)
+             for index in (_column_index(column, names) for column in attr_columns)]
+    # Без меток и атрибутов рёбра добавляются по номерам вершин, минуя разбор имён
+    by_id = label_index is None and not attrs
+    # Таблица номеров вершин графа: проверка в ней дешевле вызова has_node()
+    known = graph._ids
+    while True:
+        # Строки разбираются по мере чтения, поэтому reader.line_num - номер текущей строки
+        position = reader.line_num
+        new_nodes = {}
+        edges = []
+        sources = []
+        targets = []
+        weights = None if weight_index is None else []
+        try:
+            for row in islice(reader, batch):
+                if not row:
+                    continue
+                u = row[source]
+                v = row[target]
+                if u not in known and u not in new_nodes:
+                    new_nodes[u] = None
+                if v not in known and v not in new_nodes:
+                    new_nodes[v] = None
+                if by_id:
+                    sources.append(u)
+                    targets.append(v)
+                    if weights is not None:
+                        weights.append(int(row[weight_index]))
+                    continue
+                weight = 1 if weight_index is None else int(row[weight_index])
+                label = "" if label_index is None else row[label_index]
+                edges.append((u, v, weight, label, {key: row[index] for key, index in attrs}))
+        except IndexError:
+            raise GraphError("Строка %d: недостаточно столбцов" % reader.line_num)
+        except ValueError:
+            raise _weight_error(row[weight_index], reader.line_num)
+        if reader.line_num == position:
+            return graph
+        graph.add_nodes_from(new_nodes, check_duplicates=False)
+        if by_id:
+            graph._add_edges_by_id(map(known.__getitem__, sources), map(known.__getitem__, targets),
+                                   weights, check_duplicates)
+        else:
+            graph.add_edges_from(edges, check_duplicates=check_duplicates)
+
+
+def _byte_ranges(path: str, start: int, count: int) -> list:
+    """
+    Делит файл начиная с позиции start на count отрезков примерно равной длины.
+    Границы сдвигаются к началу следующей строки, поэтому каждая строка
+    целиком попадает в один отрезок.
+    """
+    size = os.path.getsize(path)
+    bounds = [start]
+    with open(path, "rb") as fileobj:
+        for k in range(1, count):
+            position = start + (size - start) * k // count
+            if position <= bounds[-1]:
+                continue
+            fileobj.seek(position - 1)
+            fileobj.readline()
+            position = fileobj.tell()
+            if bounds[-1] < position < size:
+                bounds.append(position)
+    bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] < bounds[i + 1]]
+
+
+def _parse_range(path: str, start: int, end: int, delimiter: str,
+                 source: int, target: int, weight_index) -> tuple:
+    """
+    Разбирает отрезок файла в отдельном процессе.
+    Имена вершин отрезка нумеруются локально, рёбра возвращаются компактными
+    массивами номеров и весов: (имена, источники, приёмники, веса или None).
+    """
+    with open(path, "rb") as fileobj:
+        fileobj.seek(start)
+        data = fileobj.read(end - start)
+    reader = csv.reader(io.StringIO(data.decode("utf-8"), newline=""), delimiter=delimiter)
+    ids = {}
+    sources = array("i")
+    targets = array("i")
+    weights = None if weight_index is None else []
+    try:
+        for row in reader:
+            if not row:
+                continue
+            u = row[source]
+            v = row[target]
+            iu = ids.get(u)
+            if iu is None:
+                iu = ids[u] = len(ids)
+            iv = ids.get(v)
+            if iv is None:
+                iv = ids[v] = len(ids)
+            sources.append(iu)
+            targets.append(iv)
+            if weights is not None:
+                weights.append(int(row[weight_index]))
+    except IndexError:
+        raise GraphError("Байты %d-%d, строка %d: недостаточно столбцов" % (start, end, reader.line_num))
+    except ValueError:
+        line = reader.line_num
+        raise _weight_error(row[weight_index], line, "Байты %d-%d, строка %d" % (start, end, line))
+    if weights is not None:
+        try:
+            weights = array("q", weights)
+        except OverflowError:
+            pass
+    return list(ids), sources, targets, weights
+
+
+def _merge_range(graph, parsed: tuple, check_duplicates: bool):
+    """
+    Добавляет в граф вершины и рёбра, разобранные в отрезке файла.
+    Локальные номера отрезка переводятся в номера графа по таблице,
+    которая строится один раз, и рёбра добавляются по номерам без разбора имён.
+    """
+    names, sources, targets, weights = parsed
+    known = graph._ids
+    graph.add_nodes_from([name for name in names if name not in known], check_duplicates=False)
+    table = [known[name] for name in names]
+    graph._add_edges_by_id(map(table.__getitem__, sources), map(table.__getitem__, targets),
+                           weights, check_duplicates)
+
+
+def read_edgelist_parallel(path: str, directed: bool = False, name: str = "", delimiter: str = ",",
+                           header: bool = False, source=0, target=1, weight_column=None,
+                           workers: int = None, chunks: int = None, check_duplicates: bool = True,
+                           columnar: bool = False):
+    """
+    Параллельное чтение графа из файла со списком рёбер в формате CSV.
+    Файл делится на отрезки по границам строк, отрезки разбираются
+    в ProcessPoolExecutor из workers процессов, а результаты по порядку
+    сливаются в один граф в текущем процессе. Порядок вершин и рёбер
+    такой же, как у read_edgelist().
+    Читаются только столбцы вершин и веса; записи не должны содержать
+    переводов строки внутри кавычек. Файл должен быть в кодировке UTF-8.
+    """
+    graph = (DiGraph if directed else Graph)(name, weighted=weight_column is not None, columnar=columnar)
+    start = 0
+    names = None
+    if header:
+        with open(path, "rb") as fileobj:
+            line = fileobj.readline()
+            start = fileobj.tell()
+        names = next(csv.reader([line.decode("utf-8")], delimiter=delimiter), None)
+    source = _column_index(source, names)
+    target = _column_index(target, names)
+    weight_index = None if weight_column is None else _column_index(weight_column, names)
+
+    workers = workers or os.cpu_count() or 1
+    ranges = _byte_ranges(path, start, chunks or workers * CHUNKS_PER_WORKER)
+    arguments = [(path, lo, hi, delimiter, source, target, weight_index) for lo, hi in ranges]
+    if workers == 1 or len(ranges) < 2:
+        for each in arguments:
+            _merge_range(graph, _parse_range(*each), check_duplicates)
+        return graph
+    with ProcessPoolExecutor(workers) as pool:
+        # Результаты приходят по порядку отрезков и сливаются, пока остальные ещё разбираются
+        for parsed in pool.map(_parse_range, *zip(*arguments)):
+            _merge_range(graph, parsed, check_duplicates)
+    return graph
+
+
+def write_edgelist(graph, fileobj, delimiter: str = ",", header: bool = False,
+                   weight: bool = None, label: bool = False, attrs=()):
+    """
+    Запись рёбер графа в формате CSV: источник, приёмник, затем по желанию
+    вес (по умолчанию - только для взвешенного графа), метка и указанные атрибуты.
+    При header=True первой строкой записываются имена столбцов
+    source, target, weight, label и имена атрибутов.
+    Строки формируются по одной при обходе рёбер.
+    """
+    if weight is None:
+        weight = graph.weighted
+    attrs = list(attrs)
+    writer = csv.writer(fileobj, delimiter=delimiter, lineterminator="\n")
+    if header:
+        writer.writerow(["source", "target"] + ["weight"] * weight + ["label"] * label + attrs)
+    if not (weight or label or attrs):
+        writer.writerows(graph.edges())
+        return
+    get_attributes = graph.get_edge_attributes
+
+    def rows():
+        for edge in graph.edges():
+            data = get_attributes(edge)
+            row = list(edge)
+            if weight:
+                row.append(data["weight"])
+            if label:
+                row.append(data["label"])
+            for key in attrs:
+                row.append(data.get(key, ""))
+            yield row
+
+    writer.writerows(rows())
@@ -0,0 +1,363 @@
+import sys
+from array import array
+from bisect import bisect_left
+
+from pygraph.basegraph import BaseGraph
+from pygraph.exceptions import NodeNotFoundError, EdgeNotFoundError
+from pygraph.views import NodeView
+from pygraph.algorithms.isomorphism import weisfeiler_lehman_hash, exact_hash
+
+
+def _int_column(values) -> array:
+    """
+    Упаковывает целые числа в типизированный массив.
+    Числа не помещающиеся в 64 бита оставляются в обычном списке.
+    """
+    # Генератор мог бы быть частично израсходован до переполнения
+    values = list(values)
+    try:
+        return array("q", values)
+    except OverflowError:
+        return list(values)
+
+
+class FrozenGraph(BaseGraph):
+    """
+    Неизменяемый снимок графа в формате CSR (compressed sparse row).
+
+    Вершины пронумерованы целыми числами в порядке graph.nodes().
+    Соседи всех вершин лежат подряд в массиве _targets, отсортированные
+    по номеру, а соседи вершины i занимают отрезок
+    _targets[_offsets[i]:_offsets[i + 1]]. Веса и метки рёбер хранятся
+    в параллельных колонках с тем же индексом.
+    Для ориентированного графа дополнительно строится обратная таблица,
+    в которой _reverse_edges[k] - индекс ребра в прямой таблице.
+
+    Снимок поддерживает методы чтения Graph и DiGraph,
+    поэтому алгоритмы из pygraph.algorithms работают с ним без изменений.
+    """
+
+    def __init__(self, graph):
+        """
+        Строит снимок указанного графа.
+        """
+        BaseGraph.__init__(self, graph.name, graph.weighted)
+        self.DIRECTED = graph.DIRECTED
+
+        names = tuple(graph.nodes())
+        ids = {name: i for i, name in enumerate(names)}
+        self._names = names
+        self._ids = ids
+
+        self._node_weights = _int_column(graph.get_node_weight(n) for n in names)
+        self._node_labels = [sys.intern(graph.get_node_label(n)) for n in names]
+        self._node_extras = {}
+        for i, name in enumerate(names):
+            extras = self._extra_attributes(graph.get_node_attributes(name))
+            if extras:
+                self._node_extras[i] = extras
+
+        targets_code = "i" if len(names) < 2 ** 31 else "q"
+        offsets = array("q", [0])
+        targets = array(targets_code)
+        weights = []
+        labels = []
+        self._edge_extras = {}
+        for name in names:
+            for target in sorted(ids[n] for n in graph.neighbors(name)):
+                edge = (name, names[target])
+                attrs = graph.get_edge_attributes(edge)
+                extras = self._extra_attributes(attrs)
+                if extras:
+                    self._edge_extras[len(targets)] = extras
+                targets.append(target)
+                weights.append(attrs["weight"])
+                labels.append(sys.intern(attrs["label"]))
+            offsets.append(len(targets))
+
+        self._offsets = offsets
+        self._targets = targets
+        self._edge_weights = _int_column(weights)
+        self._edge_labels = labels
+
+        if self.DIRECTED:
+            self._build_reverse_table()
+        else:
+            # В неориентированном графе обратная таблица совпадает с прямой
+            self._reverse_offsets = offsets
+            self._reverse_targets = targets
+            self._reverse_edges = None
+
+    @staticmethod
+    def _extra_attributes(attrs: dict) -> dict:
+        return {k: v for k, v in attrs.items() if k != "weight" and k != "label"}
+
+    def _build_reverse_table(self):
+        """
+        Строит обратную таблицу соседей сортировкой подсчётом по целевой вершине.
+        """
+        count = len(self._names)
+        offsets = self._offsets
+        targets = self._targets
+
+        reverse_offsets = array("q", bytes(8 * (count + 1)))
+        for target in targets:
+            reverse_offsets[target + 1] += 1
+        for i in range(count):
+            reverse_offsets[i + 1] += reverse_offsets[i]
+
+        position = array("q", reverse_offsets)
+        reverse_targets = array(targets.typecode, bytes(targets.itemsize * len(targets)))
+        reverse_edges = array("q", bytes(8 * len(targets)))
+        for source in range(count):
+            for k in range(offsets[source], offsets[source + 1]):
+                target = targets[k]
+                p = position[target]
+                reverse_targets[p] = source
+                reverse_edges[p] = k
+                position[target] = p + 1
+
+        self._reverse_offsets = reverse_offsets
+        self._reverse_targets = reverse_targets
+        self._reverse_edges = reverse_edges
+
+    def _node_id(self, node) -> int:
+        if node not in self._ids:
+            raise NodeNotFoundError(node)
+        return self._ids[node]
+
+    def _edge_index(self, edge: tuple) -> int:
+        """
+        Возвращает индекс ребра в колонках или -1 если ребра нет.
+        Поиск двоичный, так как соседи каждой вершины отсортированы.
+        """
+        u, v = edge
+        if u not in self._ids or v not in self._ids:
+            return -1
+        iu = self._ids[u]
+        iv = self._ids[v]
+        hi = self._offsets[iu + 1]
+        k = bisect_left(self._targets, iv, self._offsets[iu], hi)
+        if k < hi and self._targets[k] == iv:
+            return k
+        return -1
+
+    def _checked_edge_index(self, edge: tuple) -> int:
+        k = self._edge_index(edge)
+        if k < 0:
+            raise EdgeNotFoundError(edge)
+        return k
+
+    def __str__(self):
+        """
+        Возвращает строковое представление графа при вызове str() или print().
+        """
+        return "%s %s" % (repr(list(self._names)), repr(self.edges()))
+
+    def __repr__(self):
+        """
+        Возвращает строковое представление графа при вызове repr().
+        """
+        return "<%s.%s %s>" % (self.__class__.__module__, self.__class__.__name__, str(self))
+
+    def __iter__(self):
+        """
+        Возвращает итератор для прохода по всем вершинам.
+        """
+        return iter(self._names)
+
+    def __len__(self):
+        """
+        Вызов len() функции для графа вернёт количество вершин.
+        """
+        return len(self._names)
+
+    def __contains__(self, node):
+        return node in self._ids
+
+    def __getitem__(self, node):
+        """
+        Возвращает итератор для прохода по всем соседям.
+        """
+        i = self._node_id(node)
+        names = self._names
+        for k in range(self._offsets[i], self._offsets[i + 1]):
+            yield names[self._targets[k]]
+
+    def order(self) -> int:
+        """
+        Возвращает порядок графа (количество вершин)
+        """
+        return len(self._names)
+
+    def fingerprint(self, exact: bool = False) -> str:
+        """
+        Возвращает отпечаток снимка (см. CommonMixin.fingerprint).
+        Снимок неизменяем, поэтому отпечаток вычисляется один раз.
+        """
+        fingerprints = self.__dict__.setdefault("_fingerprints", {})
+        if exact not in fingerprints:
+            fingerprints[exact] = exact_hash(self) if exact else weisfeiler_lehman_hash(self)
+        return fingerprints[exact]
+
+    def freeze(self):
+        """
+        Снимок уже неизменяем, поэтому возвращается он сам.
+        """
+        return self
+
+    def reverse(self):
+        """
+        Возвращает снимок графа со сменой направления рёбер на противоположное.
+        Для неориентированного графа возвращается сам снимок.
+        Атрибуты вершин разделяются с исходным снимком, а колонки рёбер переставляются.
+        """
+        if not self.DIRECTED:
+            return self
+
+        reverse_edges = self._reverse_edges
+        rev = FrozenGraph.__new__(FrozenGraph)
+        BaseGraph.__init__(rev, self.name, self.weighted)
+        rev.DIRECTED = True
+        rev._names = self._names
+        rev._ids = self._ids
+        rev._node_weights = self._node_weights
+        rev._node_labels = self._node_labels
+        rev._node_extras = self._node_extras
+        rev._offsets = self._reverse_offsets
+        rev._targets = self._reverse_targets
+        rev._edge_weights = _int_column(self._edge_weights[k] for k in reverse_edges)
+        rev._edge_labels = [self._edge_labels[k] for k in reverse_edges]
+        rev._edge_extras = {}
+        rev._reverse_offsets = self._offsets
+        rev._reverse_targets = self._targets
+        rev._reverse_edges = array("q", bytes(8 * len(reverse_edges)))
+        for p, k in enumerate(reverse_edges):
+            rev._reverse_edges[k] = p
+            if k in self._edge_extras:
+                rev._edge_extras[p] = self._edge_extras[k]
+        return rev
+
+    def nodes(self) -> NodeView:
+        """
+        Возвращает множество вершин.
+        """
+        return NodeView(self._ids)
+
+    def has_node(self, node) -> bool:
+        """
+        Возвращает True если указанная вершина присутствует в графе, иначе False.
+        """
+        return node in self._ids
+
+    def neighbors(self, node) -> list:
+        """
+        Возвращает список соседей указанной вершины.
+        """
+        i = self._node_id(node)
+        names = self._names
+        return [names[t] for t in self._targets[self._offsets[i]:self._offsets[i + 1]]]
+
+    def reverse_neighbors(self, node) -> list:
+        """
+        Возвращает список вершин из которых есть рёбра исходящие к указанной.
+        """
+        i = self._node_id(node)
+        names = self._names
+        offsets = self._reverse_offsets
+        return [names[t] for t in self._reverse_targets[offsets[i]:offsets[i + 1]]]
+
+    def _weighted_neighbors(self, node, reverse: bool = False) -> list:
+        """
+        Возвращает список пар (сосед, вес ребра).
+        reverse=True для ориентированного графа перебирает входящие рёбра.
+        """
+        i = self._node_id(node)
+        names = self._names
+        weights = self._edge_weights
+        if reverse and self.DIRECTED:
+            offsets = self._reverse_offsets
+            targets = self._reverse_targets
+            edges = self._reverse_edges
+            return [(names[targets[p]], weights[edges[p]]) for p in range(offsets[i], offsets[i + 1])]
+        offsets = self._offsets
+        targets = self._targets
+        return [(names[targets[k]], weights[k]) for k in range(offsets[i], offsets[i + 1])]
+
+    def node_degree(self, node) -> int:
+        """
+        Возвращает степень указанной вершины.
+        """
+        i = self._node_id(node)
+        return self._offsets[i + 1] - self._offsets[i]
+
+    node_out_degree = node_degree
+
+    def node_in_degree(self, node) -> int:
+        """
+        Возвращает входящую степень указанной вершины.
+        """
+        i = self._node_id(node)
+        return self._reverse_offsets[i + 1] - self._reverse_offsets[i]
+
+    def edges(self) -> list:
+        """
+        Возвращает список рёбер.
+        Ребро неориентированного графа встречается в списке один раз.
+        """
+        names = self._names
+        offsets = self._offsets
+        targets = self._targets
+        directed = self.DIRECTED
+        return [(names[i], names[targets[k]])
+                for i in range(len(names))
+                for k in range(offsets[i], offsets[i + 1])
+                if directed or i <= targets[k]]
+
+    def has_edge(self, edge: tuple) -> bool:
+        """
+        Возвращает True если указанное ребро присутствует в графе, иначе False.
+        """
+        return self._edge_index(edge) >= 0
+
+    def get_node_weight(self, node) -> int:
+        """
+        Возвращает вес вершины.
+        """
+        return self._node_weights[self._node_id(node)]
+
+    def get_node_label(self, node) -> str:
+        """
+        Возвращает метку вершины.
+        """
+        return self._node_labels[self._node_id(node)]
+
+    def get_node_attributes(self, node) -> dict:
+        """
+        Возвращает новый словарь состоящий из атрибутов вершины.
+        """
+        i = self._node_id(node)
+        attrs = {"weight": self._node_weights[i], "label": self._node_labels[i]}
+        attrs.update(self._node_extras.get(i, {}))
+        return attrs
+
+    def get_edge_weight(self, edge: tuple) -> int:
+        """
+        Возвращает вес ребра.
+        """
+        return self._edge_weights[self._checked_edge_index(edge)]
+
+    def get_edge_label(self, edge: tuple) -> str:
+        """
+        Возвращает метку ребра.
+        """
+        return self._edge_labels[self._checked_edge_index(edge)]
+
+    def get_edge_attributes(self, edge: tuple) -> dict:
+        """
+        Возвращает новый словарь состоящий из атрибутов ребра.
+        """
+        k = self._checked_edge_index(edge)
+        attrs = {"weight": self._edge_weights[k], "label": self._edge_labels[k]}
+        attrs.update(self._edge_extras.get(k, {}))
+        return attrs
@@ -1,46 +1,60 @@
+from itertools import repeat
 from pygraph.basegraph import BaseGraph
 from pygraph.data_mixin import DataMixin
+from pygraph.index_mixin import IndexMixin
 from pygraph.common_mixin import CommonMixin
-from pygraph.exceptions import AdditionError, InvalidGraphType, \
-    NodeNotFoundError, EdgeNotFoundError, InvalidIdentifierTypeError
+from pygraph.components_mixin import ComponentsMixin
+from pygraph.views import NodeView, NeighborView, EdgeView
+from pygraph.exceptions import AdditionError, InvalidGraphType, InvalidIdentifierTypeError
 
 
-class Graph(CommonMixin, DataMixin, BaseGraph):
+class Graph(CommonMixin, ComponentsMixin, DataMixin, IndexMixin, BaseGraph):
     """
     Класс описывающий неориентированный граф.
     """
     DIRECTED = False
 
-    def __init__(self, name, weighted=False):
+    def __init__(self, name, weighted=False, columnar=False):
         """
         Инициализация графа.
+        columnar=True включает колоночное хранение атрибутов (см. ColumnarStore),
+        заметно уменьшающее расход памяти на больших графах.
         """
         CommonMixin.__init__(self)
-        DataMixin.__init__(self)
+        ComponentsMixin.__init__(self)
+        DataMixin.__init__(self, columnar)
+        IndexMixin.__init__(self)
         BaseGraph.__init__(self, name, weighted)
-        self._neighbors = {}
+        # Соседи хранятся в ключах словаря: он сохраняет порядок добавления
+        # и позволяет проверять наличие и удалять соседа за O(1).
+        # Значения словаря - записи атрибутов соответствующего ребра.
+        # Ребро (u, v) хранит одну запись, на которую ссылаются и _neighbors[u][v],
+        # и _neighbors[v][u], поэтому атрибуты одинаковы в обоих направлениях.
+        self._neighbors = []
+        self._size = 0
 
-    def nodes(self) -> list:
+    def _id_tables(self) -> tuple:
+        return self._neighbors, self._nodes_attrs
+
+    def nodes(self) -> NodeView:
         """
-        Возвращает список вершин.
+        Возвращает множество вершин.
+        Это представление без копирования, отражающее текущее состояние графа.
         """
-        return list(self._neighbors.keys())
+        return NodeView(self._ids)
 
     def node_degree(self, node) -> int:
         """
         Возвращает степень указанной вершины.
         """
-        if node not in self._neighbors:
-            raise NodeNotFoundError(node)
-        return len(self.neighbors(node))
+        return len(self._neighbors[self._node_id(node)])
 
-    def neighbors(self, node) -> list:
+    def neighbors(self, node) -> NeighborView:
         """
-        Возвращает список соседей указанной вершины.
+        Возвращает множество соседей указанной вершины в порядке добавления рёбер.
+        Это представление без копирования, отражающее текущее состояние графа.
         """
-        if node not in self._neighbors:
-            raise NodeNotFoundError(node)
-        return self._neighbors[node]
+        return NeighborView(self._neighbors[self._node_id(node)], self._ids, self._names)
 
     def add_node(self, node, weight: int = 1, label: str = "", attrs=None):
         """
@@ -51,41 +65,120 @@ class Graph(CommonMixin, DataMixin, BaseGraph):
         if not isinstance(node, str):
             raise InvalidIdentifierTypeError(node)
 
-        if attrs is None:
-            attrs = {}
-
-        if node not in self._neighbors:
-            self._neighbors[node] = []
-            self.set_node_weight(node, weight)
-            self.set_node_label(node, label)
-            self.add_node_attributes(node, attrs)
-        else:
+        if node in self._ids:
             raise AdditionError("Вершина %s уже присутствует в графе" % node)
 
+        data = self._make_attributes(weight, label, attrs)
+        i = self._new_id(node)
+        self._neighbors[i] = {}
+        self._nodes_attrs[i] = self._node_store.new(data)
+        self._changed()
+        self._update_structure_hash(hash(node))
+        if self._components is not None:
+            self._components.add(i)
+
+    def add_nodes_from(self, nodes, check_duplicates: bool = True):
+        """
+        Добавляет к графу набор вершин.
+        Каждый элемент - либо вершина, либо кортеж вида
+        (вершина[, вес[, метка[, атрибуты]]]).
+        Добавление атомарно: при ошибке в любом элементе добавленные
+        из набора вершины удаляются и граф остаётся прежним.
+        check_duplicates=False отключает проверку повторов и откат
+        и годится только для заведомо корректных данных.
+        """
+        ids = self._ids
+        neighbors = self._neighbors
+        nodes_attrs = self._nodes_attrs
+        make_attributes = self._make_attributes
+        new_record = self._node_store.new
+        new_id = self._new_id
+        components = self._components
+        self._changed()
+        added = []
+        structure_hash = 0
+        try:
+            for item in nodes:
+                if isinstance(item, tuple):
+                    node, data = item[0], make_attributes(*item[1:])
+                else:
+                    node, data = item, {"weight": 1, "label": ""}
+                if not isinstance(node, str):
+                    raise InvalidIdentifierTypeError(node)
+                if check_duplicates:
+                    if node in ids:
+                        raise AdditionError("Вершина %s уже присутствует в графе" % node)
+                    added.append(node)
+                i = new_id(node)
+                neighbors[i] = {}
+                nodes_attrs[i] = new_record(data)
+                structure_hash += hash(node)
+                if components is not None:
+                    components.add(i)
+        except Exception:
+            self._components_changed()
+            self._update_structure_hash(structure_hash)
+            for node in added:
+                self._update_structure_hash(-hash(node))
+                self._node_store.release(nodes_attrs[ids[node]])
+                self._release_id(node)
+            raise
+        self._update_structure_hash(structure_hash)
+
     def has_node(self, node) -> bool:
         """
         Возвращает True если указанная вершина присутствует в графе, иначе False.
         """
-        return node in self._neighbors
+        return node in self._ids
 
     def del_node(self, node):
         """
         Удаляет указанную вершину из графа, а также инцидентные ей рёбра.
         """
-        if node not in self._neighbors:
-            raise NodeNotFoundError(node)
-
-        for each in list(self.neighbors(node)):
-            if each != node:
-                self.del_edge((each, node))
-        del (self._neighbors[node])
-        del (self._nodes_attrs[node])
+        i = self._node_id(node)
+        neighbors = self._neighbors
+        names = self._names
+        edge_store = self._edge_store
+        structure_hash = hash(node)
+        for each, record in neighbors[i].items():
+            structure_hash += self._edge_hash(node, names[each])
+            edge_store.release(record)
+            if each != i:
+                del (neighbors[each][i])
+        self._size -= len(neighbors[i])
+        self._node_store.release(self._nodes_attrs[i])
+        self._release_id(node)
+        self._changed()
+        self._update_structure_hash(-structure_hash)
+        self._components_changed()
 
-    def edges(self) -> list:
+    def edges(self) -> EdgeView:
         """
-        Возвращает список рёбер.
+        Возвращает множество рёбер.
+        При обходе каждое ребро встречается один раз, а проверка вхождения
+        симметрична: (u, v) in edges() равносильно (v, u) in edges().
+        Это представление без копирования, отражающее текущее состояние графа.
         """
-        return [a for a in self._edges_attrs.keys()]
+        return EdgeView(self)
+
+    def _edges(self):
+        # Ребро выдаётся со стороны вершины с меньшим номером
+        names = self._names
+        for u, neighbors in enumerate(self._neighbors):
+            if neighbors is not None:
+                for v in neighbors:
+                    if u <= v:
+                        yield (names[u], names[v])
+
+    def _edges_count(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _edge_hash(u, v) -> int:
+        # Симметричный хеш: рёбра (u, v) и (v, u) неразличимы
+        hu = hash(u)
+        hv = hash(v)
+        return hash((hu + hv, hu ^ hv))
 
     def add_edge(self, edge: tuple, weight: int = 1, label: str = "", attrs=None):
         """
@@ -100,41 +193,150 @@ class Graph(CommonMixin, DataMixin, BaseGraph):
         if not isinstance(edge[1], str):
             raise InvalidIdentifierTypeError(edge[1])
 
-        if attrs is None:
-            attrs = {}
-
         u, v = edge
-        if (v not in self._neighbors[u]) and (u not in self._neighbors[v]):
-            self._neighbors[u].append(v)
-            if u != v:
-                self._neighbors[v].append(u)
-
-            self.set_edge_weight((u, v), weight)
-            self.set_edge_label((u, v), label)
-            self.add_edge_attributes((u, v), attrs)
-        else:
+        iu = self._ids[u]
+        iv = self._ids[v]
+        neighbors = self._neighbors
+        if iv in neighbors[iu]:
             raise AdditionError("Ребро (%s, %s) уже присутствует в графе" % (u, v))
 
+        record = self._edge_store.new(self._make_attributes(weight, label, attrs))
+        neighbors[iu][iv] = record
+        neighbors[iv][iu] = record
+        self._size += 1
+        self._changed()
+        self._update_structure_hash(self._edge_hash(u, v))
+        if self._components is not None:
+            self._components.union(iu, iv)
+
+    def add_edges_from(self, edges, check_duplicates: bool = True):
+        """
+        Добавляет к графу набор рёбер.
+        Каждый элемент - кортеж вида (u, v[, вес[, метка[, атрибуты]]]).
+        Добавление атомарно: при ошибке в любом элементе добавленные
+        из набора рёбра удаляются и граф остаётся прежним.
+        check_duplicates=False отключает проверку наличия вершин и откат
+        и годится только для заведомо корректных данных; повторные рёбра
+        при этом не вызывают ошибку, а пропускаются.
+        """
+        ids = self._ids
+        neighbors = self._neighbors
+        make_attributes = self._make_attributes
+        new_record = self._edge_store.new
+        components = self._components
+        self._changed()
+        edge_hash = self._edge_hash
+        added = []
+        size = 0
+        structure_hash = 0
+        try:
+            for item in edges:
+                u, v = item[0], item[1]
+                if not isinstance(u, str):
+                    raise InvalidIdentifierTypeError(u)
+                if not isinstance(v, str):
+                    raise InvalidIdentifierTypeError(v)
+                if len(item) == 2:
+                    data = {"weight": 1, "label": ""}
+                else:
+                    data = make_attributes(*item[2:])
+                if check_duplicates:
+                    if u not in ids:
+                        raise AdditionError("Вершина %s отсутствует в таблице соседей" % u)
+                    if v not in ids:
+                        raise AdditionError("Вершина %s отсутствует в таблице соседей" % v)
+                iu = ids[u]
+                iv = ids[v]
+                if iv in neighbors[iu]:
+                    if check_duplicates:
+                        raise AdditionError("Ребро (%s, %s) уже присутствует в графе" % (u, v))
+                    # Без проверки повтор пропускается, остаётся первое ребро
+                    continue
+                if check_duplicates:
+                    added.append((u, v))
+                record = new_record(data)
+                neighbors[iu][iv] = record
+                neighbors[iv][iu] = record
+                size += 1
+                structure_hash += edge_hash(u, v)
+                if components is not None:
+                    components.union(iu, iv)
+        except Exception:
+            self._size += size
+            self._update_structure_hash(structure_hash)
+            for edge in reversed(added):
+                self.del_edge(edge)
+            raise
+        self._size += size
+        self._update_structure_hash(structure_hash)
+
+    def _add_edges_by_id(self, sources, targets, weights=None, check_duplicates: bool = True):
+        """
+        Пакетное добавление рёбер по внутренним номерам вершин.
+        sources и targets - номера концов рёбер, weights - целые веса или None (все веса 1).
+        В отличие от add_edges_from() имена не разрешаются и атрибуты не проверяются,
+        поэтому метод годится только для загрузчиков, которые уже перевели имена
+        в номера существующих вершин. Атомарность и check_duplicates - как в add_edges_from().
+        """
+        names = self._names
+        neighbors = self._neighbors
+        new_record = self._edge_store.new
+        components = self._components
+        self._changed()
+        edge_hash = self._edge_hash
+        if weights is None:
+            weights = repeat(1)
+        added = []
+        size = 0
+        structure_hash = 0
+        try:
+            for iu, iv, weight in zip(sources, targets, weights):
+                if iv in neighbors[iu]:
+                    if check_duplicates:
+                        raise AdditionError("Ребро (%s, %s) уже присутствует в графе" % (names[iu], names[iv]))
+                    continue
+                if check_duplicates:
+                    added.append((names[iu], names[iv]))
+                record = new_record({"weight": weight, "label": ""})
+                neighbors[iu][iv] = record
+                neighbors[iv][iu] = record
+                size += 1
+                structure_hash += edge_hash(names[iu], names[iv])
+                if components is not None:
+                    components.union(iu, iv)
+        except Exception:
+            self._size += size
+            self._update_structure_hash(structure_hash)
+            for edge in reversed(added):
+                self.del_edge(edge)
+            raise
+        self._size += size
+        self._update_structure_hash(structure_hash)
+
     def has_edge(self, edge: tuple) -> bool:
         """
         Возвращает True если указанное ребро присутствует в графе, иначе False.
         """
         u, v = edge
-        return u in self._neighbors and v in self._neighbors and \
-               u in self._neighbors[v] and v in self._neighbors[u]
+        iu = self._ids.get(u)
+        iv = self._ids.get(v)
+        return iu is not None and iv is not None and iv in self._neighbors[iu]
 
     def del_edge(self, edge: tuple):
         """
         Удаляет указанное ребро из графа.
         """
-        if edge not in self._edges_attrs:
-            raise EdgeNotFoundError(edge)
-
-        self.del_edge_data(edge)
+        self._edge_record(edge)
         u, v = edge
-        self._neighbors[u].remove(v)
-        if u != v:
-            self._neighbors[v].remove(u)
+        iu = self._ids[u]
+        iv = self._ids[v]
+        self._edge_store.release(self._neighbors[iu].pop(iv))
+        if iu != iv:
+            del (self._neighbors[iv][iu])
+        self._size -= 1
+        self._changed()
+        self._update_structure_hash(-self._edge_hash(u, v))
+        self._components_changed()
 
     def __eq__(self, other) -> bool:
         """
@@ -0,0 +1,72 @@
+from pygraph.exceptions import NodeNotFoundError, EdgeNotFoundError
+
+
+class IndexMixin:
+    """
+    Внутренняя нумерация вершин.
+
+    При добавлении вершине выдаётся плотный целочисленный номер.
+    Таблицы соседей и атрибутов хранятся в списках, индексируемых этими номерами,
+    а соседи - в словарях номер_соседа: запись_атрибутов_ребра, поэтому ребро не требует
+    ни отдельного кортежа-ключа, ни хеширования строк.
+    Номера удалённых вершин используются повторно.
+    Имена вершин переводятся в номера и обратно только в публичных методах.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._names = []
+        self._free_ids = []
+
+    def _id_tables(self) -> tuple:
+        """
+        Возвращает списки, индексируемые номерами вершин.
+        """
+        return ()
+
+    def _new_id(self, node) -> int:
+        """
+        Выдаёт номер новой вершине.
+        Если свободных номеров нет, все таблицы удлиняются на один элемент.
+        """
+        if self._free_ids:
+            i = self._free_ids.pop()
+            self._names[i] = node
+        else:
+            i = len(self._names)
+            self._names.append(node)
+            for table in self._id_tables():
+                table.append(None)
+        self._ids[node] = i
+        return i
+
+    def _release_id(self, node) -> int:
+        """
+        Освобождает номер удаляемой вершины и очищает её строки в таблицах.
+        """
+        i = self._ids.pop(node)
+        self._names[i] = None
+        for table in self._id_tables():
+            table[i] = None
+        self._free_ids.append(i)
+        return i
+
+    def _node_id(self, node) -> int:
+        """
+        Возвращает номер вершины.
+        """
+        i = self._ids.get(node)
+        if i is None:
+            raise NodeNotFoundError(node)
+        return i
+
+    def _edge_record(self, edge: tuple):
+        """
+        Возвращает запись атрибутов ребра из таблицы соседей.
+        """
+        u, v = edge
+        iu = self._ids.get(u)
+        iv = self._ids.get(v)
+        if iu is None or iv is None or iv not in self._neighbors[iu]:
+            raise EdgeNotFoundError(edge)
+        return self._neighbors[iu][iv]
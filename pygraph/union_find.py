@@ -0,0 +1,71 @@
+class UnionFind:
+    """
+    Система непересекающихся множеств (union-find).
+    Хранит разбиение элементов на множества и позволяет объединять множества
+    и проверять принадлежность элементов одному множеству за почти константное время
+    благодаря объединению по размеру и сокращению путей.
+    """
+
+    def __init__(self, items=()):
+        self._parents = {}
+        self._sizes = {}
+        self.count = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self._parents)
+
+    def __contains__(self, item):
+        return item in self._parents
+
+    def add(self, item):
+        """
+        Добавляет элемент отдельным множеством, если его ещё нет.
+        """
+        if item not in self._parents:
+            self._parents[item] = item
+            self._sizes[item] = 1
+            self.count += 1
+
+    def find(self, item):
+        """
+        Возвращает представителя множества, содержащего элемент.
+        """
+        parents = self._parents
+        while parents[item] != item:
+            # Сокращение пути делением пополам
+            parents[item] = parents[parents[item]]
+            item = parents[item]
+        return item
+
+    def union(self, a, b) -> bool:
+        """
+        Объединяет множества, содержащие указанные элементы.
+        Возвращает True если множества были разными, иначе False.
+        """
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+        if self._sizes[a] < self._sizes[b]:
+            a, b = b, a
+        self._parents[b] = a
+        self._sizes[a] += self._sizes.pop(b)
+        self.count -= 1
+        return True
+
+    def connected(self, a, b) -> bool:
+        """
+        Возвращает True если элементы лежат в одном множестве, иначе False.
+        """
+        return self.find(a) == self.find(b)
+
+    def groups(self) -> list:
+        """
+        Возвращает список множеств в порядке появления их первых элементов.
+        """
+        groups = {}
+        for item in self._parents:
+            groups.setdefault(self.find(item), set()).add(item)
+        return list(groups.values())
@@ -0,0 +1,121 @@
+from collections.abc import Set
+
+
+class NodeView(Set):
+    """
+    Представление множества вершин графа.
+    Не копирует данные, а смотрит на внутреннюю таблицу графа,
+    поэтому всегда отражает его текущее состояние.
+    len() и проверка вхождения выполняются за O(1).
+    Порядок обхода совпадает с порядком добавления вершин.
+    """
+    __slots__ = ("_table",)
+
+    def __init__(self, table: dict):
+        self._table = table
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        # Результаты операций над множествами (&, |, - ...) - обычные множества
+        return set(iterable)
+
+    def __len__(self):
+        return len(self._table)
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __contains__(self, node):
+        return node in self._table
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, repr(list(self._table)))
+
+
+class NeighborView(NodeView):
+    """
+    Представление множества соседей вершины.
+    Соседи хранятся под номерами вершин, поэтому при обходе и проверке
+    вхождения имена переводятся через таблицы нумерации графа.
+    Порядок обхода совпадает с порядком добавления рёбер.
+    """
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self, table: dict, ids: dict, names: list):
+        NodeView.__init__(self, table)
+        self._ids = ids
+        self._names = names
+
+    def __iter__(self):
+        return map(self._names.__getitem__, self._table)
+
+    def __contains__(self, node):
+        i = self._ids.get(node)
+        return i is not None and i in self._table
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, repr(list(self)))
+
+
+class EdgeView(Set):
+    """
+    Представление множества рёбер графа.
+    Проверка вхождения делегируется has_edge(), а количество рёбер
+    и их обход берутся из внутренних таблиц графа без копирования.
+    """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __len__(self):
+        return self._graph._edges_count()
+
+    def __iter__(self):
+        return self._graph._edges()
+
+    def __contains__(self, edge):
+        if not isinstance(edge, tuple) or len(edge) != 2:
+            return False
+        return self._graph.has_edge(edge)
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, repr(list(self)))
+
+
+class ComplementNeighborView(Set):
+    """
+    Представление множества соседей вершины в дополнении графа:
+    все вершины, кроме самой вершины и её соседей в исходном графе.
+    Проверка вхождения и len() выполняются за O(1), обход - за O(V).
+    """
+    __slots__ = ("_nodes", "_neighbors", "_node")
+
+    def __init__(self, nodes, neighbors, node):
+        self._nodes = nodes
+        self._neighbors = neighbors
+        self._node = node
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __len__(self):
+        # Петля в исходном графе не уменьшает число соседей в дополнении
+        loop = self._node in self._neighbors
+        return len(self._nodes) - 1 - (len(self._neighbors) - loop)
+
+    def __iter__(self):
+        node = self._node
+        neighbors = self._neighbors
+        return (each for each in self._nodes if each != node and each not in neighbors)
+
+    def __contains__(self, each):
+        return each != self._node and each in self._nodes and each not in self._neighbors
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, repr(list(self)))
@@ -0,0 +1,59 @@
+import unittest
+from pygraph.graph import Graph
+from pygraph.exceptions import NodeNotFoundError, AlgorithmError
+from pygraph.algorithms.astar import astar, euclidean_heuristic
+from pygraph.algorithms.dijkstra import dijkstra_path_length
+from tests.graph_generator import new_digraph
+
+
+class TestAStar(unittest.TestCase):
+    def setUp(self):
+        # Решётка 10x10, вес ребра - 10 единиц длины
+        self.gr = Graph("Grid", weighted=True)
+        self.gr.add_nodes_from(("%d,%d" % (x, y), 1, "", {"x": x * 10, "y": y * 10})
+                               for x in range(10) for y in range(10))
+        for x in range(10):
+            for y in range(10):
+                if x < 9:
+                    self.gr.add_edge(("%d,%d" % (x, y), "%d,%d" % (x + 1, y)), weight=10)
+                if y < 9:
+                    self.gr.add_edge(("%d,%d" % (x, y), "%d,%d" % (x, y + 1)), weight=10)
+
+    def path_weight(self, graph, path):
+        return sum(graph.get_edge_weight(edge) for edge in zip(path, path[1:]))
+
+    def test_grid(self):
+        path = astar(self.gr, "0,0", "9,9", euclidean_heuristic())
+        assert path[0] == "0,0" and path[-1] == "9,9"
+        assert self.path_weight(self.gr, path) == 180
+        assert astar(self.gr, "3,3", "3,3", euclidean_heuristic()) == ["3,3"]
+
+    def test_heuristic_reduces_expansions(self):
+        expanded = []
+
+        def counting(attrs, goal_attrs):
+            expanded.append(attrs)
+            return euclidean_heuristic()(attrs, goal_attrs)
+
+        astar(self.gr, "0,0", "9,0", counting)
+        assert len(expanded) < 40
+
+    def test_without_heuristic(self):
+        for _ in range(3):
+            gr = new_digraph(30, 120, (0, 15))
+            for target in gr.nodes():
+                path = astar(gr, "0", target)
+                distance = dijkstra_path_length(gr, "0", target)
+                if distance is None:
+                    assert path is None
+                else:
+                    assert self.path_weight(gr, path) == distance
+
+    def test_errors(self):
+        self.gr.add_node("island", attrs={"x": 0, "y": 0})
+        assert astar(self.gr, "0,0", "island", euclidean_heuristic()) is None
+        with self.assertRaises(NodeNotFoundError):
+            astar(self.gr, "0,0", "nowhere")
+        self.gr.set_edge_weight(("0,0", "0,1"), -5)
+        with self.assertRaises(AlgorithmError):
+            astar(self.gr, "0,0", "9,9")
@@ -2,7 +2,8 @@ import unittest
 from pygraph.graph import Graph
 from pygraph.digraph import DiGraph
 from pygraph.exceptions import NodeNotFoundError
-from pygraph.algorithms.bfs import breadth_first_bypass, breadth_first_search, breadth_first_paths
+from pygraph.algorithms.bfs import breadth_first_bypass, breadth_first_search, breadth_first_paths, \
+    iter_breadth_first_bypass, shortest_path_length
 
 
 class TestBFS(unittest.TestCase):
@@ -161,6 +162,49 @@ class TestBFS(unittest.TestCase):
         paths = breadth_first_paths(gr, "3", "1")
         assert paths == []
 
+    def test_bfs_bypass_order(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from([str(i) for i in range(7)])
+        gr.add_edges_from([("0", "1"), ("0", "2"), ("1", "3"), ("1", "4"), ("2", "5"), ("5", "6"), ("6", "0")])
+        assert breadth_first_bypass(gr, "0") == ["0", "1", "2", "6", "3", "4", "5"]
+
+    def test_bfs_bypass_is_lazy(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from([str(i) for i in range(1000)])
+        gr.add_edges_from((str(i), str(i + 1)) for i in range(999))
+        bypass = iter_breadth_first_bypass(gr, "0")
+        assert next(bypass) == "0"
+        assert next(bypass) == "1"
+        gr2 = DiGraph("TestGraph")
+        gr2.add_node("1")
+        with self.assertRaises(NodeNotFoundError):
+            iter_breadth_first_bypass(gr2, "0")
+
+    def test_bfs_bypass_long_chain(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from([str(i) for i in range(50000)])
+        gr.add_edges_from((str(i), str(i + 1)) for i in range(49999))
+        assert len(breadth_first_bypass(gr, "25000")) == 50000
+
+    def test_bfs_search_shortest_path(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(["1", "2", "3", "4", "5"])
+        gr.add_edges_from([("1", "2"), ("2", "3"), ("3", "5"), ("1", "4"), ("4", "5"), ("5", "1")])
+        assert breadth_first_search(gr, "1", "5") == ["1", "4", "5"]
+        assert breadth_first_search(gr, "1", "1") is None
+        assert breadth_first_search(gr, "5", "3") == ["5", "1", "2", "3"]
+
+    def test_shortest_path_length(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(["1", "2", "3", "4", "5", "6"])
+        gr.add_edges_from([("1", "2"), ("2", "3"), ("3", "5"), ("1", "4"), ("4", "5")])
+        assert shortest_path_length(gr, "1", "5") == 2
+        assert shortest_path_length(gr, "1", "1") == 0
+        assert shortest_path_length(gr, "5", "1") is None
+        assert shortest_path_length(gr, "1", "6") is None
+        with self.assertRaises(NodeNotFoundError):
+            shortest_path_length(gr, "1", "7")
+
 
 if __name__ == "__main__":
     unittest.main()
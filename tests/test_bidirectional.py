@@ -0,0 +1,58 @@
+import unittest
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import NodeNotFoundError, AlgorithmError
+from pygraph.algorithms.bfs import shortest_path_length
+from pygraph.algorithms.dijkstra import dijkstra_path_length
+from pygraph.algorithms.bidirectional import bidirectional_search, bidirectional_dijkstra
+from tests.graph_generator import new_graph, new_digraph
+
+
+class TestBidirectional(unittest.TestCase):
+    def assert_path(self, graph, path, start, target):
+        assert path[0] == start and path[-1] == target
+        assert all(graph.has_edge(edge) for edge in zip(path, path[1:]))
+
+    def test_search(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(["1", "2", "3", "4", "5", "6"])
+        gr.add_edges_from([("1", "2"), ("2", "3"), ("3", "4"), ("4", "5"), ("1", "6"), ("6", "5")])
+        assert bidirectional_search(gr, "1", "5") == ["1", "6", "5"]
+        assert bidirectional_search(gr, "2", "5") == ["2", "3", "4", "5"]
+        assert bidirectional_search(gr, "5", "1") is None
+        assert bidirectional_search(gr, "3", "3") == ["3"]
+        with self.assertRaises(NodeNotFoundError):
+            bidirectional_search(gr, "1", "7")
+
+    def test_dijkstra(self):
+        gr = Graph("TestGraph", weighted=True)
+        gr.add_nodes_from(["a", "b", "c", "d"])
+        gr.add_edges_from([("a", "b", 1), ("b", "c", 1), ("c", "d", 1), ("a", "d", 5)])
+        assert bidirectional_dijkstra(gr, "a", "d") == ["a", "b", "c", "d"]
+        assert bidirectional_dijkstra(gr, "d", "a") == ["d", "c", "b", "a"]
+        gr.add_node("e")
+        assert bidirectional_dijkstra(gr, "a", "e") is None
+        gr.set_edge_weight(("a", "b"), -1)
+        with self.assertRaises(AlgorithmError):
+            bidirectional_dijkstra(gr, "a", "d")
+
+    def test_random_graphs(self):
+        for gr in (new_graph(60, 90, (0, 9)), new_digraph(60, 150, (0, 9))):
+            for snapshot in (gr, gr.freeze()):
+                for start in ("0", "1", "2"):
+                    for target in gr.nodes():
+                        length = shortest_path_length(gr, start, target)
+                        path = bidirectional_search(snapshot, start, target)
+                        if length is None:
+                            assert path is None
+                        else:
+                            assert len(path) - 1 == length
+                            self.assert_path(gr, path, start, target)
+
+                        distance = dijkstra_path_length(gr, start, target)
+                        path = bidirectional_dijkstra(snapshot, start, target)
+                        if distance is None:
+                            assert path is None
+                        else:
+                            self.assert_path(gr, path, start, target)
+                            assert sum(gr.get_edge_weight(e) for e in zip(path, path[1:])) == distance
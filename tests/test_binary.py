@@ -0,0 +1,113 @@
+import os
+import pickle
+import tempfile
+import unittest
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import GraphError, InvalidIdentifierTypeError
+from pygraph.readwrite import read_binary, write_binary, write
+from pygraph.algorithms.bfs import breadth_first_search
+from pygraph.algorithms.dijkstra import dijkstra_path_length
+from tests.graph_generator import new_graph, new_digraph
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".pygraph")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def assert_same(self, gr, mapped):
+        frozen = gr.freeze()
+        assert mapped.name == gr.name
+        assert mapped.DIRECTED == gr.DIRECTED
+        assert mapped.weighted == gr.weighted
+        assert list(mapped.nodes()) == list(gr.nodes())
+        assert mapped.edges() == frozen.edges()
+        assert write(mapped) == write(frozen)
+        for node in gr.nodes():
+            assert mapped.neighbors(node) == frozen.neighbors(node)
+            assert mapped.reverse_neighbors(node) == frozen.reverse_neighbors(node)
+            assert mapped.get_node_attributes(node) == frozen.get_node_attributes(node)
+        for edge in gr.edges():
+            assert mapped.has_edge(edge)
+            assert mapped.get_edge_attributes(edge) == frozen.get_edge_attributes(edge)
+
+    def test_round_trip(self):
+        for gr in (new_graph(40, 150, (1, 9)), new_digraph(40, 150, (1, 9))):
+            gr.weighted = True
+            write_binary(gr, self.path)
+            mapped = read_binary(self.path)
+            self.assert_same(gr, mapped)
+            assert mapped.fingerprint() == gr.fingerprint()
+            start, target = list(gr.nodes())[0], list(gr.nodes())[-1]
+            assert breadth_first_search(mapped, start, target) == breadth_first_search(gr.freeze(), start, target)
+            assert dijkstra_path_length(mapped, start, target) == dijkstra_path_length(gr, start, target)
+
+    def test_labels_and_extra_attributes(self):
+        gr = DiGraph("Граф")
+        gr.add_node("вершина", weight=2 ** 70, label="метка", attrs={"color": "red"})
+        gr.add_node("b", label="метка")
+        gr.add_node("")
+        gr.add_edge(("вершина", "b"), weight=3, label="ребро", attrs={"data": [1, 2]})
+        gr.add_edge(("b", ""))
+        write_binary(gr, self.path)
+        mapped = read_binary(self.path)
+        self.assert_same(gr, mapped)
+        assert "вершина" in mapped and "c" not in mapped and 1 not in mapped
+        assert mapped.get_node_weight("вершина") == 2 ** 70
+        assert mapped.get_edge_attributes(("вершина", "b"))["data"] == [1, 2]
+        assert list(mapped.reverse().edges()) == [("b", "вершина"), ("", "b")]
+        # Повторная запись отображённого графа и передача в другой процесс через pickle
+        copy_path = self.path + ".copy"
+        write_binary(mapped, copy_path)
+        try:
+            self.assert_same(gr, read_binary(copy_path))
+        finally:
+            os.remove(copy_path)
+        self.assert_same(gr, pickle.loads(pickle.dumps(mapped)))
+
+    def test_empty_graph(self):
+        write_binary(Graph("Empty"), self.path)
+        mapped = read_binary(self.path)
+        assert list(mapped.nodes()) == [] and mapped.edges() == []
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as fileobj:
+            fileobj.write(b"graph G { a -- b }")
+        with self.assertRaises(GraphError):
+            read_binary(self.path)
+        open(self.path, "wb").close()
+        with self.assertRaises(GraphError):
+            read_binary(self.path)
+
+    def test_truncated_file(self):
+        write_binary(new_digraph(40, 150), self.path)
+        with open(self.path, "rb") as fileobj:
+            data = fileobj.read()
+        for size in (30, 100, len(data) // 2, len(data) - 3):
+            with open(self.path, "wb") as fileobj:
+                fileobj.write(data[:size])
+            with self.assertRaisesRegex(GraphError, "повреждён|не является"):
+                read_binary(self.path)
+
+    def test_pickled_array_section(self):
+        write_binary(new_graph(10, 20), self.path)
+        with open(self.path, "r+b") as fileobj:
+            # Код типа раздела offsets: заголовок 16 байт, запись таблицы разделов 24 байта
+            fileobj.seek(16 + 24 * 8 + 16)
+            fileobj.write(b"p")
+        with self.assertRaisesRegex(GraphError, "повреждён"):
+            read_binary(self.path)
+
+    def test_non_string_names(self):
+        gr = DiGraph("Numbers")
+        gr.add_node(1)
+        with self.assertRaises(InvalidIdentifierTypeError):
+            write_binary(gr, self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
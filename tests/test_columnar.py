@@ -0,0 +1,96 @@
+import unittest
+from copy import deepcopy
+
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.attr_store import AttributesProxy
+from pygraph.exceptions import InvalidAttrKeyError
+
+from tests.graph_generator import new_graph, new_digraph
+
+
+def to_columnar(gr):
+    columnar = gr.__class__(gr.name, gr.weighted, columnar=True)
+    for node in gr.nodes():
+        columnar.add_node(node, attrs=dict(gr.get_node_attributes(node)))
+    for edge in gr.edges():
+        if not columnar.has_edge(edge):
+            columnar.add_edge(edge, attrs=dict(gr.get_edge_attributes(edge)))
+    return columnar
+
+
+class TestColumnarStore(unittest.TestCase):
+    def test_columnar_graph_equals_dict_graph(self):
+        for gr in (new_graph(25, 120, (1, 50)), new_digraph(25, 120, (1, 50))):
+            columnar = to_columnar(gr)
+            assert columnar == gr
+            assert gr == columnar
+            for edge in gr.edges():
+                assert columnar.get_edge_weight(edge) == gr.get_edge_weight(edge)
+
+    def test_attributes_proxy(self):
+        gr = DiGraph("TestDiGraph", columnar=True)
+        gr.add_node("0", weight=3, label="zero", attrs={"x": 1.5})
+        gr.add_node("1")
+        gr.add_edge(("0", "1"), weight=7, label="edge", attrs={"color": "red"})
+
+        attrs = gr.get_edge_attributes(("0", "1"))
+        assert isinstance(attrs, AttributesProxy)
+        assert attrs == {"weight": 7, "label": "edge", "color": "red"}
+        attrs["color"] = "blue"
+        assert gr.get_edge_attributes(("0", "1"))["color"] == "blue"
+        assert dict(gr.get_node_attributes("0")) == {"weight": 3, "label": "zero", "x": 1.5}
+        assert dict(gr.get_node_attributes("1")) == {"weight": 1, "label": ""}
+
+    def test_undirected_edge_attributes_are_symmetric(self):
+        gr = Graph("TestGraph", columnar=True)
+        gr.add_nodes_from(["0", "1"])
+        gr.add_edge(("0", "1"))
+        gr.add_edge_attribute(("0", "1"), "key", "value")
+        gr.set_edge_weight(("1", "0"), 10)
+        assert gr.get_edge_attributes(("1", "0"))["key"] == "value"
+        assert gr.get_edge_weight(("0", "1")) == 10
+
+    def test_delete_attributes(self):
+        gr = Graph("TestGraph", columnar=True)
+        gr.add_nodes_from(["0", "1"])
+        gr.add_edge(("0", "1"), attrs={"key": "value"})
+        gr.del_node_attribute("0", "weight")
+        gr.del_edge_attribute(("0", "1"), "key")
+        assert "weight" not in gr.get_node_attributes("0")
+        assert "key" not in gr.get_edge_attributes(("0", "1"))
+        with self.assertRaises(KeyError):
+            gr.get_node_weight("0")
+        with self.assertRaises(InvalidAttrKeyError):
+            gr.del_node_attribute("0", "weight")
+        gr.set_node_weight("0", 4)
+        assert gr.get_node_weight("0") == 4
+
+    def test_weights_out_of_column_range(self):
+        gr = Graph("TestGraph", columnar=True)
+        gr.add_node("0", weight=2 ** 70)
+        gr.add_node("1", weight=True)
+        assert gr.get_node_weight("0") == 2 ** 70
+        assert gr.get_node_weight("1") is True
+
+    def test_rows_are_reused(self):
+        gr = DiGraph("TestDiGraph", columnar=True)
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.add_edge(("0", "1"), attrs={"key": "value"})
+        gr.add_edge(("1", "2"))
+        gr.del_node("1")
+        gr.add_node("3")
+        gr.add_edge(("0", "3"))
+        assert len(gr._edge_store._labels) == 2
+        assert dict(gr.get_edge_attributes(("0", "3"))) == {"weight": 1, "label": ""}
+        assert len(gr._node_store) == 3
+
+    def test_copies_keep_columnar_storage(self):
+        gr = to_columnar(new_digraph(10, 30))
+        assert gr.reverse().columnar
+        assert gr.inverse().columnar
+        assert deepcopy(gr) == gr
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
 import unittest
 from pygraph.graph import Graph
 from pygraph.digraph import DiGraph
+from pygraph.union_find import UnionFind
+from pygraph.algorithms.bfs import breadth_first_bypass
 from pygraph.algorithms.check_connectivity import check_graph_is_connected
+from pygraph.algorithms.connectivity import connected_components, weakly_connected_components, \
+    strongly_connected_components, is_connected, is_strongly_connected
+from tests.graph_generator import new_graph, new_digraph
 
 
 class ConnectivityTest(unittest.TestCase):
@@ -45,3 +50,60 @@ class ConnectivityTest(unittest.TestCase):
         gr.add_edge(("1", "2"))
         gr.add_edge(("0", "2"))
         assert not check_graph_is_connected(gr)
+
+    def test_empty_graph_is_connected(self):
+        assert check_graph_is_connected(Graph("TestGraph"))
+        assert is_connected(DiGraph("TestGraph"))
+
+    def test_connected_components(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2", "3", "4", "5"])
+        gr.add_edges_from([("0", "1"), ("1", "2"), ("3", "4")])
+        expected = [{"0", "1", "2"}, {"3", "4"}, {"5"}]
+        assert list(connected_components(gr)) == expected
+        assert weakly_connected_components(gr) == expected
+        assert not is_connected(gr)
+
+    def test_weakly_connected_components(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2", "3"])
+        gr.add_edges_from([("1", "0"), ("2", "1"), ("3", "3")])
+        expected = [{"0", "1", "2"}, {"3"}]
+        assert list(connected_components(gr)) == expected
+        assert weakly_connected_components(gr) == expected
+        gr.add_edge(("3", "2"))
+        assert is_connected(gr) and not is_strongly_connected(gr)
+
+    def test_strongly_connected_components(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2", "3", "4", "5"])
+        gr.add_edges_from([("0", "1"), ("1", "2"), ("2", "0"), ("2", "3"), ("3", "4"), ("4", "3"), ("4", "5")])
+        assert list(strongly_connected_components(gr)) == [{"5"}, {"3", "4"}, {"0", "1", "2"}]
+
+    def test_random_graphs(self):
+        for gr in (new_graph(50, 45), new_digraph(50, 90)):
+            reachable = {node: set(breadth_first_bypass(gr, node)) for node in gr.nodes()}
+            for component in strongly_connected_components(gr):
+                for node in component:
+                    assert {v for v in reachable[node] if node in reachable[v]} == component
+            assert sorted(map(sorted, connected_components(gr))) == \
+                sorted(map(sorted, weakly_connected_components(gr)))
+            assert sorted(map(sorted, weakly_connected_components(gr))) == \
+                sorted(map(sorted, weakly_connected_components(gr.freeze())))
+
+    def test_long_chain(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(range(20000))
+        gr.add_edges_from((i, i + 1) for i in range(19999))
+        gr.add_edge((19999, 0))
+        assert check_graph_is_connected(gr)
+        assert len(list(strongly_connected_components(gr))) == 1
+
+    def test_union_find(self):
+        sets = UnionFind("abcde")
+        assert sets.count == 5
+        assert sets.union("a", "b") and sets.union("c", "d") and sets.union("b", "d")
+        assert not sets.union("a", "c")
+        assert sets.connected("a", "d") and not sets.connected("a", "e")
+        assert sets.count == 2 and len(sets) == 5
+        assert sets.groups() == [{"a", "b", "c", "d"}, {"e"}]
@@ -112,3 +112,13 @@ class TestDFS(unittest.TestCase):
         gr.add_edge(("4", "2"))
         bypassed_nodes = depth_first_bypass(gr, "4")
         assert bypassed_nodes == ["4", "2"]
+
+    def test_dfs_search_visits_each_node_once(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from([str(i) for i in range(2000)])
+        gr.add_edges_from((str(i), str(j)) for i in range(0, 2000, 40) for j in range(i + 1, min(i + 41, 2000)))
+        path = depth_first_search(gr, "0", "1999")
+        assert path[0] == "0" and path[-1] == "1999"
+        assert all(gr.has_edge((u, v)) for u, v in zip(path, path[1:]))
+        assert len(set(path)) == len(path)
+        assert depth_first_search(gr, "5", "5") is None
@@ -2,7 +2,7 @@ import unittest
 from copy import deepcopy
 
 from pygraph.digraph import DiGraph
-from pygraph.exceptions import AdditionError
+from pygraph.exceptions import AdditionError, GraphError
 
 from tests.graph_generator import new_digraph
 
@@ -40,8 +40,8 @@ class TestDiGraph(unittest.TestCase):
             pass
         else:
             self.fail()
-        assert gr._neighbors == {"0": [], "1": []}
-        assert gr._reverse_neighbors == {"0": [], "1": []}
+        assert gr._neighbors == [{}, {}]
+        assert gr._reverse_neighbors == [{}, {}]
 
     def test_raise_exception_when_edge_added_to_non_existing_node(self):
         gr = DiGraph("TestDiGraph")
@@ -53,8 +53,8 @@ class TestDiGraph(unittest.TestCase):
             pass
         else:
             self.fail()
-        assert gr._neighbors == {"0": [], "1": []}
-        assert gr._reverse_neighbors == {"0": [], "1": []}
+        assert gr._neighbors == [{}, {}]
+        assert gr._reverse_neighbors == [{}, {}]
 
     def test_input_degree(self):
         gr = DiGraph("TestDiGraph")
@@ -133,8 +133,8 @@ class TestDiGraph(unittest.TestCase):
     def test_invert_empty_digraph(self):
         gr = DiGraph("TestDiGraph")
         inv = gr.inverse()
-        self.assertTrue(gr.nodes() == [])
-        self.assertTrue(inv.edges() == [])
+        self.assertTrue(list(gr.nodes()) == [])
+        self.assertTrue(list(inv.edges()) == [])
 
     def test_reverse_digraph(self):
         gr = new_digraph(25, 120)
@@ -147,8 +147,19 @@ class TestDiGraph(unittest.TestCase):
     def test_reverse_empty_digraph(self):
         gr = DiGraph("TestDiGraph")
         rev = gr.reverse()
-        self.assertTrue(rev.nodes() == [])
-        self.assertTrue(rev.edges() == [])
+        self.assertTrue(list(rev.nodes()) == [])
+        self.assertTrue(list(rev.edges()) == [])
+
+    def test_complement_view(self):
+        gr = new_digraph(20, 150)
+        comp = gr.complement()
+        inv = gr.inverse()
+        assert set(comp.edges()) == set(inv.edges())
+        assert len(comp.edges()) == len(inv.edges())
+        for node in gr.nodes():
+            assert set(comp.neighbors(node)) == set(inv.neighbors(node))
+            assert set(comp.reverse_neighbors(node)) == set(inv.reverse_neighbors(node))
+            assert comp.node_in_degree(node) == inv.node_in_degree(node)
 
     def test_complete_digraph(self):
         gr = DiGraph("TestDiGraph")
@@ -163,15 +174,15 @@ class TestDiGraph(unittest.TestCase):
     def test_complete_empty_digraph(self):
         gr = DiGraph("TestDiGraph")
         gr.complete()
-        self.assertTrue(gr.nodes() == [])
-        self.assertTrue(gr.edges() == [])
+        self.assertTrue(list(gr.nodes()) == [])
+        self.assertTrue(list(gr.edges()) == [])
 
     def test_complete_digraph_with_one_node(self):
         gr = DiGraph("TestDiGraph")
         gr.add_node("0")
         gr.complete()
-        self.assertTrue(gr.nodes() == ["0"])
-        self.assertTrue(gr.edges() == [])
+        self.assertTrue(list(gr.nodes()) == ["0"])
+        self.assertTrue(list(gr.edges()) == [])
 
     def test_repr(self):
         gr = new_digraph(25, 120)
@@ -342,6 +353,117 @@ class TestDiGraph(unittest.TestCase):
         assert not gr.has_edge(("2", "1"))
         assert not gr.has_edge(("1", "3"))
 
+    def test_neighbors_keep_insertion_order(self):
+        gr = DiGraph("TestDiGraph")
+        for i in range(5):
+            gr.add_node(str(i))
+        gr.add_edge(("0", "3"))
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("0", "4"))
+        gr.add_edge(("0", "2"))
+        gr.del_edge(("0", "1"))
+        assert list(gr.neighbors("0")) == ["3", "4", "2"]
+        gr.add_edge(("0", "1"))
+        assert list(gr.neighbors("0")) == ["3", "4", "2", "1"]
+
+    def test_bulk_addition_equals_single_addition(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_node("0")
+        gr.add_node("1", weight=2, label="one", attrs={"x": 1})
+        gr.add_node("2")
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("1", "2"), weight=3, label="l", attrs={"y": 2})
+        gr.add_edge(("2", "2"))
+
+        gr2 = DiGraph("TestDiGraph")
+        gr2.add_nodes_from(["0", ("1", 2, "one", {"x": 1}), ("2",)])
+        gr2.add_edges_from([("0", "1"), ("1", "2", 3, "l", {"y": 2}), ("2", "2")])
+
+        assert gr == gr2
+        assert list(gr.neighbors("1")) == list(gr2.neighbors("1"))
+
+    def test_bulk_addition_is_atomic(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.add_edge(("0", "1"))
+        for nodes in (["3", "4", "3"], ["3", "0"], ["3", ("4", "heavy")]):
+            with self.assertRaises(GraphError):
+                gr.add_nodes_from(nodes)
+        for edges in ([("1", "2"), ("0", "1")], [("1", "2"), ("1", "2")],
+                      [("1", "2"), ("2", "5")], [("1", "2", 1, 2)]):
+            with self.assertRaises(GraphError):
+                gr.add_edges_from(edges)
+        assert sorted(gr.nodes()) == ["0", "1", "2"]
+        assert not gr.has_edge(("1", "2"))
+
+    def test_bulk_addition_without_duplicates_check(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_nodes_from((str(i) for i in range(10)), check_duplicates=False)
+        gr.add_edges_from(((str(i), str(i + 1), i) for i in range(9)), check_duplicates=False)
+        assert gr.order() == 10
+        assert gr.get_edge_weight(("3", "4")) == 3
+        # Повтор без проверки пропускается и не портит счётчик рёбер
+        gr.add_edges_from([("3", "4", 10), ("0", "9")], check_duplicates=False)
+        assert len(gr.edges()) == len(list(gr.edges())) == 10
+        assert gr.get_edge_weight(("3", "4")) == 3
+        assert gr._structure_hash == gr._compute_structure_hash()
+
+    def test_node_ids_are_reused_after_deletion(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("1", "1"))
+        gr.del_node("1")
+        gr.add_node("3")
+        assert len(gr._names) == 3
+        assert list(gr.nodes()) == ["0", "2", "3"]
+        assert list(gr.neighbors("3")) == []
+        assert list(gr.neighbors("0")) == []
+        gr.add_edge(("0", "3"))
+        assert list(gr.neighbors("0")) == ["3"]
+        assert gr.has_edge(("0", "3"))
+        assert not gr.has_edge(("0", "1"))
+
+    def test_edges_count_after_deletions(self):
+        gr = new_digraph(25, 120)
+        gr.add_edge(("3", "3"))
+        gr.add_edge(("5", "5"))
+        for node in ["0", "3", "7"]:
+            gr.del_node(node)
+        gr.del_edge(next(iter(gr.edges())))
+        assert len(gr.edges()) == len(list(gr.edges()))
+
+    def test_structure_hash_is_maintained(self):
+        gr = new_digraph(30, 60)
+        gr.add_node("extra")
+        gr.add_edge(("extra", "0"))
+        gr.add_edge(("extra", "extra"))
+        gr.del_edge(next(edge for edge in gr.edges() if "extra" not in edge))
+        gr.del_node("1")
+        with self.assertRaises(AdditionError):
+            gr.add_edges_from([("extra", "2"), ("extra", "0")])
+        with self.assertRaises(AdditionError):
+            gr.add_nodes_from(["new", "extra"])
+        assert gr._structure_hash == gr._compute_structure_hash()
+        assert deepcopy(gr)._structure_hash == gr._structure_hash
+
+    def test_equality_short_circuits(self):
+        gr = DiGraph("TestGraph")
+        gr2 = DiGraph("TestGraph")
+        for g in (gr, gr2):
+            g.add_nodes_from(["0", "1", "2", "3"])
+        gr.add_edges_from([("0", "1"), ("2", "3")])
+        gr2.add_edges_from([("0", "2"), ("1", "3")])
+        assert gr._structure_hash != gr2._structure_hash
+        assert gr != gr2
+        gr2.del_edge(("0", "2"))
+        gr2.del_edge(("1", "3"))
+        gr2.add_edges_from([("2", "3"), ("0", "1")])
+        assert gr == gr2
+        assert gr == gr.freeze() and gr.freeze() == gr
+        gr2.del_edge(("2", "3"))
+        assert gr != gr2
+
 
 if __name__ == "__main__":
     unittest.main()
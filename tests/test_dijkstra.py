@@ -0,0 +1,68 @@
+import unittest
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import NodeNotFoundError, AlgorithmError
+from pygraph.algorithms.dijkstra import dijkstra_distances, dijkstra_search, dijkstra_path_length
+from tests.graph_generator import new_graph, new_digraph
+
+
+def bellman_ford(graph, start_node) -> dict:
+    distances = {start_node: 0}
+    for _ in range(graph.order()):
+        for u in list(distances):
+            for v in graph.neighbors(u):
+                candidate = distances[u] + graph.get_edge_weight((u, v))
+                if v not in distances or candidate < distances[v]:
+                    distances[v] = candidate
+    return distances
+
+
+class TestDijkstra(unittest.TestCase):
+    def setUp(self):
+        self.gr = DiGraph("TestGraph", weighted=True)
+        self.gr.add_nodes_from(["1", "2", "3", "4", "5", "6"])
+        self.gr.add_edges_from([("1", "2", 7), ("1", "3", 9), ("1", "6", 14), ("2", "3", 10), ("2", "4", 15),
+                                ("3", "4", 11), ("3", "6", 2), ("4", "5", 6), ("6", "5", 9)])
+
+    def test_distances(self):
+        assert dijkstra_distances(self.gr, "1") == {"1": 0, "2": 7, "3": 9, "4": 20, "5": 20, "6": 11}
+        assert dijkstra_distances(self.gr, "5") == {"5": 0}
+
+    def test_search(self):
+        assert dijkstra_search(self.gr, "1", "5") == ["1", "3", "6", "5"]
+        assert dijkstra_search(self.gr, "1", "1") == ["1"]
+        assert dijkstra_search(self.gr, "5", "1") is None
+        assert dijkstra_path_length(self.gr, "1", "4") == 20
+        assert dijkstra_path_length(self.gr, "5", "1") is None
+        with self.assertRaises(NodeNotFoundError):
+            dijkstra_search(self.gr, "1", "7")
+
+    def test_undirected_graph(self):
+        gr = Graph("TestGraph", weighted=True)
+        gr.add_nodes_from(["a", "b", "c"])
+        gr.add_edges_from([("a", "b", 5), ("b", "c", 1), ("c", "a", 1)])
+        assert dijkstra_search(gr, "b", "a") == ["b", "c", "a"]
+        assert dijkstra_distances(gr, "a") == {"a": 0, "b": 2, "c": 1}
+
+    def test_negative_weight(self):
+        self.gr.set_edge_weight(("3", "6"), -1)
+        with self.assertRaises(AlgorithmError):
+            dijkstra_distances(self.gr, "1")
+
+    def test_columnar_and_frozen(self):
+        expected = dijkstra_distances(self.gr, "1")
+        gr = DiGraph("TestGraph", weighted=True, columnar=True)
+        gr.add_nodes_from(self.gr.nodes())
+        gr.add_edges_from((u, v, self.gr.get_edge_weight((u, v))) for u, v in self.gr.edges())
+        assert dijkstra_distances(gr, "1") == expected
+        assert dijkstra_distances(self.gr.freeze(), "1") == expected
+
+    def test_random_graphs(self):
+        for gr in (new_graph(40, 150, (0, 20)), new_digraph(40, 300, (0, 20))):
+            for start in ("0", "17"):
+                expected = bellman_ford(gr, start)
+                assert dijkstra_distances(gr, start) == expected
+                assert dijkstra_distances(gr.freeze(), start) == expected
+                for target, distance in expected.items():
+                    path = dijkstra_search(gr, start, target)
+                    assert sum(gr.get_edge_weight(e) for e in zip(path, path[1:])) == distance
@@ -0,0 +1,136 @@
+import io
+import os
+import tempfile
+import unittest
+from pygraph.digraph import DiGraph
+from pygraph.graph import Graph
+from pygraph.exceptions import AdditionError, GraphError, InvalidWeightError
+from pygraph.readwrite import read_edgelist, read_edgelist_parallel, write_edgelist
+from tests.graph_generator import new_graph, new_digraph
+
+
+class TestEdgeList(unittest.TestCase):
+    def test_round_trip(self):
+        for gr in (new_graph(30, 100, (1, 9)), new_digraph(30, 100, (1, 9))):
+            gr.weighted = True
+            output = io.StringIO()
+            write_edgelist(gr, output, header=True)
+            output.seek(0)
+            recovered = read_edgelist(output, directed=gr.DIRECTED, header=True, weight_column="weight")
+            assert len(recovered.edges()) == len(gr.edges())
+            for edge in gr.edges():
+                assert recovered.get_edge_weight(edge) == gr.get_edge_weight(edge)
+
+    def test_small_batches(self):
+        gr = new_graph(40, 150)
+        output = io.StringIO()
+        write_edgelist(gr, output)
+        output.seek(0)
+        recovered = read_edgelist(output, batch=7, columnar=True)
+        assert len(recovered.edges()) == len(gr.edges())
+        for edge in gr.edges():
+            assert recovered.has_edge(edge)
+        assert recovered.columnar
+
+    def test_columns_and_attributes(self):
+        text = "w;label;to;from;color\n\n5;x;b;a;red\n7;y;c;b;blue\n"
+        gr = read_edgelist(io.StringIO(text), directed=True, delimiter=";", header=True,
+                           source="from", target="to", weight_column=0, label_column="label",
+                           attr_columns=["color"])
+        assert isinstance(gr, DiGraph)
+        assert gr.weighted
+        assert list(gr.edges()) == [("a", "b"), ("b", "c")]
+        assert gr.get_edge_weight(("b", "c")) == 7
+        assert gr.get_edge_label(("a", "b")) == "x"
+        assert gr.get_edge_attributes(("a", "b"))["color"] == "red"
+        output = io.StringIO()
+        write_edgelist(gr, output, delimiter=";", label=True, attrs=["color"])
+        assert output.getvalue() == "a;b;5;x;red\nb;c;7;y;blue\n"
+
+    def test_errors(self):
+        with self.assertRaises(GraphError):
+            read_edgelist(io.StringIO("a\n"))
+        with self.assertRaises(InvalidWeightError):
+            read_edgelist(io.StringIO("a,b,x\n"), weight_column=2)
+        with self.assertRaises(GraphError):
+            read_edgelist(io.StringIO("a,b\n"), source="src")
+        with self.assertRaises(AdditionError):
+            read_edgelist(io.StringIO("a,b\nb,a\n"))
+
+    def test_error_line_numbers(self):
+        with self.assertRaisesRegex(GraphError, "Строка 2:"):
+            read_edgelist(io.StringIO("a,b\nc\nd,e\nf,g\n"))
+        with self.assertRaises(InvalidWeightError) as context:
+            read_edgelist(io.StringIO("a,b,1\n\nc,d,x\ne,f,2\n"), weight_column=2)
+        assert context.exception.line == 3 and context.exception.msg.startswith("Строка 3:")
+
+
+class TestParallelEdgeList(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, gr, header: bool = False):
+        with open(self.path, "w", newline="") as fileobj:
+            write_edgelist(gr, fileobj, header=header, weight=True)
+        with open(self.path, newline="") as fileobj:
+            return read_edgelist(fileobj, directed=gr.DIRECTED, header=header, weight_column=2)
+
+    def test_matches_sequential_reader(self):
+        for gr in (new_graph(60, 300, (1, 9)), new_digraph(60, 300, (1, 9))):
+            expected = self.write(gr)
+            for workers, chunks in ((1, 5), (2, None), (3, 50)):
+                loaded = read_edgelist_parallel(self.path, directed=gr.DIRECTED, weight_column=2,
+                                                workers=workers, chunks=chunks)
+                assert list(loaded.nodes()) == list(expected.nodes())
+                assert list(loaded.edges()) == list(expected.edges())
+                for edge in expected.edges():
+                    assert loaded.get_edge_weight(edge) == expected.get_edge_weight(edge)
+
+    def test_header_and_names(self):
+        gr = new_digraph(30, 80)
+        self.write(gr, header=True)
+        loaded = read_edgelist_parallel(self.path, directed=True, header=True,
+                                        source="target", target="source", workers=2, chunks=7)
+        assert len(loaded.edges()) == len(gr.edges())
+        for u, v in gr.edges():
+            assert loaded.has_edge((v, u))
+
+    def test_errors(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("a,b,1\nb,c,x\n")
+        with self.assertRaises(InvalidWeightError) as context:
+            read_edgelist_parallel(self.path, weight_column=2, workers=2, chunks=2)
+        assert context.exception.msg.startswith("Байты 6-12, строка 1:")
+        with self.assertRaises(InvalidWeightError) as context:
+            read_edgelist_parallel(self.path, weight_column=2, workers=1, chunks=1)
+        assert context.exception.line == 2 and context.exception.msg.startswith("Байты 0-12, строка 2:")
+        with self.assertRaises(GraphError):
+            read_edgelist_parallel(self.path, weight_column=3, workers=1)
+
+    def test_duplicates_across_chunks(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("a,b\nb,c\nc,d\nb,a\n")
+        loaded = read_edgelist_parallel(self.path, directed=True, workers=1, chunks=3)
+        assert loaded._structure_hash == loaded._compute_structure_hash()
+        with self.assertRaises(AdditionError):
+            read_edgelist_parallel(self.path, workers=1, chunks=3)
+        loaded = read_edgelist_parallel(self.path, workers=1, chunks=3, check_duplicates=False)
+        assert len(loaded.edges()) == len(list(loaded.edges())) == 3
+        assert loaded._structure_hash == loaded._compute_structure_hash()
+        # Рёбра отрезка с повтором откатываются целиком
+        for gr in (Graph(""), DiGraph("")):
+            gr.add_nodes_from("abc")
+            gr.add_edge(("b", "c"))
+            expected = gr._structure_hash
+            with self.assertRaises(AdditionError):
+                gr._add_edges_by_id([0, 0, 1], [1, 2, 2])
+            assert list(gr.edges()) == [("b", "c")]
+            assert gr._structure_hash == expected == gr._compute_structure_hash()
+
+
+if __name__ == "__main__":
+    unittest.main()
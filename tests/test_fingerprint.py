@@ -0,0 +1,76 @@
+import random
+import unittest
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.algorithms.isomorphism import isomorphism, weisfeiler_lehman_hash
+from tests.graph_generator import new_graph, new_digraph
+
+
+def relabeled(graph, shuffle: bool = True):
+    nodes = list(graph.nodes())
+    names = list(nodes)
+    if shuffle:
+        random.shuffle(names)
+    mapping = dict(zip(nodes, ("n" + name for name in names)))
+    copy = graph.__class__("Copy")
+    copy.add_nodes_from(mapping[node] for node in reversed(nodes))
+    copy.add_edges_from((mapping[u], mapping[v], graph.get_edge_weight((u, v))) for u, v in graph.edges())
+    return copy
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_isomorphic_graphs_share_fingerprint(self):
+        for gr in (new_graph(30, 60), new_digraph(30, 90)):
+            copy = relabeled(gr)
+            assert gr.fingerprint() == copy.fingerprint()
+            assert gr.fingerprint() == weisfeiler_lehman_hash(gr.freeze())
+            assert gr.fingerprint(exact=True) != copy.fingerprint(exact=True)
+
+    def test_exact_fingerprint(self):
+        gr = new_graph(20, 40, (1, 5))
+        same = Graph("Same", columnar=True)
+        same.add_nodes_from(reversed(list(gr.nodes())))
+        same.add_edges_from((v, u, gr.get_edge_weight((u, v))) for u, v in reversed(list(gr.edges())))
+        assert gr == same
+        assert gr.fingerprint(exact=True) == same.fingerprint(exact=True)
+        assert gr.freeze().fingerprint(exact=True) == same.fingerprint(exact=True)
+        u, v = next(iter(same.edges()))
+        same.set_edge_weight((u, v), 100)
+        assert gr.fingerprint(exact=True) != same.fingerprint(exact=True)
+        assert gr.fingerprint() == same.fingerprint()
+
+    def test_cache_is_invalidated_on_mutation(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(["a", "b", "c"])
+        gr.add_edge(("a", "b"))
+        before = gr.fingerprint()
+        exact = gr.fingerprint(exact=True)
+        gr.add_edge(("b", "c"))
+        assert gr.fingerprint() != before
+        gr.del_edge(("b", "c"))
+        assert gr.fingerprint() == before
+        gr.set_node_label("c", "label")
+        assert gr.fingerprint() == before
+        assert gr.fingerprint(exact=True) != exact
+        gr.del_node("c")
+        assert gr.fingerprint() != before
+
+    def test_dedup_and_early_reject(self):
+        path = Graph("Path")
+        path.add_nodes_from(["1", "2", "3"])
+        path.add_edges_from([("1", "2"), ("2", "3")])
+        star = Graph("Star")
+        star.add_nodes_from(["1", "2", "3", "4"])
+        star.add_edges_from([("1", "2"), ("1", "3"), ("1", "4")])
+        graphs = [path, star, relabeled(path), relabeled(star), relabeled(path, shuffle=False)]
+        classes = {}
+        for gr in graphs:
+            classes.setdefault(gr.fingerprint(), []).append(gr)
+        assert len(classes) == 2
+        before = star.fingerprint()
+        star.del_edge(("1", "4"))
+        star.add_edge(("2", "3"))
+        assert star.fingerprint() != before
+        assert star.fingerprint() == relabeled(star).fingerprint()
+        assert isomorphism(star, relabeled(star))
+        assert isomorphism(star, path) is False
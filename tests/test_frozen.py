@@ -0,0 +1,96 @@
+import unittest
+
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import NodeNotFoundError, EdgeNotFoundError
+from pygraph.algorithms.bfs import breadth_first_bypass, breadth_first_search
+from pygraph.algorithms.check_connectivity import check_graph_is_connected
+
+from tests.graph_generator import new_graph, new_digraph
+
+
+def assert_same_graph(gr, frozen):
+    assert sorted(gr.nodes()) == sorted(frozen.nodes())
+    assert sorted(gr.edges()) == sorted(frozen.edges())
+    for node in gr.nodes():
+        assert sorted(gr.neighbors(node)) == sorted(frozen.neighbors(node))
+        assert gr.get_node_attributes(node) == frozen.get_node_attributes(node)
+    for edge in gr.edges():
+        assert frozen.has_edge(edge)
+        assert gr.get_edge_weight(edge) == frozen.get_edge_weight(edge)
+        assert gr.get_edge_attributes(edge) == frozen.get_edge_attributes(edge)
+
+
+class TestFrozenGraph(unittest.TestCase):
+    def test_freeze_graph(self):
+        gr = new_graph(25, 120, weight_range=(1, 100))
+        assert_same_graph(gr, gr.freeze())
+
+    def test_freeze_digraph(self):
+        gr = new_digraph(25, 120, weight_range=(1, 100))
+        frozen = gr.freeze()
+        assert_same_graph(gr, frozen)
+        for node in gr.nodes():
+            assert sorted(gr.reverse_neighbors(node)) == sorted(frozen.reverse_neighbors(node))
+            assert gr.node_in_degree(node) == frozen.node_in_degree(node)
+
+    def test_frozen_reverse(self):
+        gr = new_digraph(25, 120, weight_range=(1, 100))
+        assert_same_graph(gr.reverse(), gr.freeze().reverse())
+        assert_same_graph(gr, gr.freeze().reverse().reverse())
+
+    def test_frozen_attributes(self):
+        gr = Graph("TestGraph", weighted=True)
+        gr.add_node("0", weight=5, label="zero", attrs={"x": 1.5})
+        gr.add_node("1")
+        gr.add_edge(("0", "1"), weight=7, label="edge", attrs={"color": "red"})
+        frozen = gr.freeze()
+        assert frozen.weighted
+        assert frozen.get_node_weight("0") == 5
+        assert frozen.get_node_label("0") == "zero"
+        assert frozen.get_node_attributes("0")["x"] == 1.5
+        assert frozen.get_edge_label(("1", "0")) == "edge"
+        assert frozen.get_edge_attributes(("1", "0"))["color"] == "red"
+
+    def test_frozen_is_a_snapshot(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_node("0")
+        gr.add_node("1")
+        frozen = gr.freeze()
+        gr.add_edge(("0", "1"))
+        assert not frozen.has_edge(("0", "1"))
+
+    def test_frozen_huge_weights(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.set_node_weight("1", 2 ** 70)
+        gr.add_edges_from([("0", "1", 3), ("1", "2", 2 ** 70), ("2", "0", 5)])
+        frozen = gr.freeze()
+        assert [frozen.get_node_weight(node) for node in "012"] == [1, 2 ** 70, 1]
+        assert frozen.get_edge_weight(("0", "1")) == 3
+        assert frozen.get_edge_weight(("1", "2")) == 2 ** 70
+        assert frozen.get_edge_weight(("2", "0")) == 5
+        reverse = frozen.reverse()
+        assert reverse.get_edge_weight(("2", "1")) == 2 ** 70
+        assert reverse.get_edge_weight(("0", "2")) == 5
+
+    def test_frozen_missing_items(self):
+        frozen = new_digraph(5, 4).freeze()
+        with self.assertRaises(NodeNotFoundError):
+            frozen.neighbors("missing")
+        with self.assertRaises(EdgeNotFoundError):
+            frozen.get_edge_weight(("0", "missing"))
+        assert not frozen.has_edge(("0", "missing"))
+
+    def test_algorithms_on_frozen_graph(self):
+        gr = new_digraph(30, 100)
+        frozen = gr.freeze()
+        assert sorted(breadth_first_bypass(gr, "0")) == sorted(breadth_first_bypass(frozen, "0"))
+        assert check_graph_is_connected(gr) == check_graph_is_connected(frozen)
+        path = breadth_first_search(frozen, "0", "1")
+        if path is not None:
+            assert len(path) == len(breadth_first_search(gr, "0", "1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
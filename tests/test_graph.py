@@ -2,7 +2,8 @@ import unittest
 from copy import deepcopy
 
 from pygraph.graph import Graph
-from pygraph.exceptions import AdditionError
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import AdditionError, GraphError
 
 from tests.graph_generator import new_graph
 
@@ -40,7 +41,7 @@ class TestGraph(unittest.TestCase):
             pass
         else:
             self.fail()
-        assert gr._neighbors == {"0": [], "1": []}
+        assert gr._neighbors == [{}, {}]
 
     def test_raise_exception_when_edge_added_to_non_existing_node(self):
         gr = Graph("TestGraph")
@@ -52,7 +53,7 @@ class TestGraph(unittest.TestCase):
             pass
         else:
             self.fail()
-        assert gr._neighbors == {"0": [], "1": []}
+        assert gr._neighbors == [{}, {}]
 
     def test_node_degree(self):
         gr = Graph("TestGraph")
@@ -95,11 +96,13 @@ class TestGraph(unittest.TestCase):
         gr.add_edge(("0", "1"), label="label", attrs={"key": "value"})
         assert ("0", "1") in gr.edges()
         assert ("1", "0") in gr.edges()
-        assert len(gr.edges()) == 2
-        assert gr.neighbors("0") == ["1"]
-        assert gr.neighbors("1") == ["0"]
-        assert ("0", "1") in gr._edges_attrs
-        assert ("1", "0") in gr._edges_attrs
+        assert len(gr.edges()) == 1
+        assert list(gr.edges()) == [("0", "1")]
+        assert list(gr.neighbors("0")) == ["1"]
+        assert list(gr.neighbors("1")) == ["0"]
+        assert gr.get_edge_label(("0", "1")) == "label"
+        assert gr.get_edge_attributes(("1", "0"))["key"] == "value"
+        assert gr.get_edge_attributes(("0", "1")) is gr.get_edge_attributes(("1", "0"))
 
     def test_edges_between_same_nodes_should_be_a_single_arrow(self):
         gr = Graph("TestGraph")
@@ -107,9 +110,8 @@ class TestGraph(unittest.TestCase):
         gr.add_edge(("0", "0"), label="label", attrs={"key": "value"})
         assert ("0", "0") in gr.edges()
         assert len(gr.edges()) == 1
-        assert gr.neighbors("0") == ["0"]
-        assert ("0", "0") in gr._edges_attrs
-        assert len(gr._edges_attrs[("0", "0")]) == 3
+        assert list(gr.neighbors("0")) == ["0"]
+        assert len(gr.get_edge_attributes(("0", "0"))) == 3
 
     def test_invert_graph(self):
         gr = new_graph(25, 120)
@@ -122,8 +124,27 @@ class TestGraph(unittest.TestCase):
     def test_invert_empty_graph(self):
         gr = Graph("TestGraph")
         inv = gr.inverse()
-        self.assertTrue(gr.edges() == [])
-        self.assertTrue(inv.nodes() == [])
+        self.assertTrue(list(gr.edges()) == [])
+        self.assertTrue(list(inv.nodes()) == [])
+
+    def test_complement_view(self):
+        gr = new_graph(25, 120)
+        gr.add_edge(("0", "0"))
+        comp = gr.complement()
+        inv = gr.inverse()
+        assert sorted(map(sorted, comp.edges())) == sorted(map(sorted, inv.edges()))
+        assert len(comp.edges()) == len(inv.edges())
+        for node in gr.nodes():
+            assert set(comp.neighbors(node)) == set(inv.neighbors(node))
+            assert len(comp.neighbors(node)) == inv.node_degree(node)
+            assert not comp.has_edge((node, node))
+        gr.del_edge(("0", "0"))
+        u, v = next(iter(gr.edges()))
+        assert not comp.has_edge((u, v)) and not comp.has_edge((v, u))
+        gr.del_edge((u, v))
+        assert comp.has_edge((u, v)) and comp.has_edge((v, u))
+        assert v in comp.neighbors(u)
+        assert comp.complement() is gr
 
     def test_complete_graph(self):
         gr = Graph("TestGraph")
@@ -137,15 +158,15 @@ class TestGraph(unittest.TestCase):
     def test_complete_empty_graph(self):
         gr = Graph("TestGraph")
         gr.complete()
-        self.assertTrue(gr.nodes() == [])
-        self.assertTrue(gr.edges() == [])
+        self.assertTrue(list(gr.nodes()) == [])
+        self.assertTrue(list(gr.edges()) == [])
 
     def test_complete_graph_with_one_node(self):
         gr = Graph("TestGraph")
         gr.add_node("0")
         gr.complete()
-        self.assertTrue(gr.nodes() == ["0"])
-        self.assertTrue(gr.edges() == [])
+        self.assertTrue(list(gr.nodes()) == ["0"])
+        self.assertTrue(list(gr.edges()) == [])
 
     def test_reverse_digraph(self):
         gr = new_graph(25, 120)
@@ -158,8 +179,8 @@ class TestGraph(unittest.TestCase):
     def test_reverse_empty_digraph(self):
         gr = Graph("TestDiGraph")
         rev = gr.reverse()
-        self.assertTrue(rev.nodes() == [])
-        self.assertTrue(rev.edges() == [])
+        self.assertTrue(list(rev.nodes()) == [])
+        self.assertTrue(list(rev.edges()) == [])
 
     def test_repr(self):
         gr = new_graph(25, 120)
@@ -278,7 +299,7 @@ class TestGraph(unittest.TestCase):
         gr5 = deepcopy(gr)
         gr5.del_node("2")
         gr5.add_node("2")
-        gr5.add_node_attribute(0, "d", "k")
+        gr5.add_node_attribute("0", "d", "k")
 
         assert gr == gr2
         assert gr2 == gr
@@ -320,6 +341,184 @@ class TestGraph(unittest.TestCase):
         assert not gr.has_edge(("2", "1"))
         assert not gr.has_edge(("1", "3"))
 
+    def test_neighbors_keep_insertion_order(self):
+        gr = Graph("TestGraph")
+        for i in range(5):
+            gr.add_node(str(i))
+        gr.add_edge(("0", "3"))
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("0", "4"))
+        gr.add_edge(("0", "2"))
+        gr.del_edge(("0", "1"))
+        assert list(gr.neighbors("0")) == ["3", "4", "2"]
+        gr.add_edge(("0", "1"))
+        assert list(gr.neighbors("0")) == ["3", "4", "2", "1"]
+
+    def test_bulk_addition_equals_single_addition(self):
+        gr = Graph("TestGraph")
+        gr.add_node("0")
+        gr.add_node("1", weight=2, label="one", attrs={"x": 1})
+        gr.add_node("2")
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("1", "2"), weight=3, label="l", attrs={"y": 2})
+        gr.add_edge(("2", "2"))
+
+        gr2 = Graph("TestGraph")
+        gr2.add_nodes_from(["0", ("1", 2, "one", {"x": 1}), ("2",)])
+        gr2.add_edges_from([("0", "1"), ("1", "2", 3, "l", {"y": 2}), ("2", "2")])
+
+        assert gr == gr2
+        assert list(gr.neighbors("1")) == list(gr2.neighbors("1"))
+
+    def test_bulk_addition_is_atomic(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.add_edge(("0", "1"))
+        for nodes in (["3", "4", "3"], ["3", "0"], ["3", ("4", "heavy")]):
+            with self.assertRaises(GraphError):
+                gr.add_nodes_from(nodes)
+        for edges in ([("1", "2"), ("0", "1")], [("1", "2"), ("1", "2")],
+                      [("1", "2"), ("2", "5")], [("1", "2", 1, 2)]):
+            with self.assertRaises(GraphError):
+                gr.add_edges_from(edges)
+        assert sorted(gr.nodes()) == ["0", "1", "2"]
+        assert not gr.has_edge(("1", "2"))
+
+    def test_bulk_addition_without_duplicates_check(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from((str(i) for i in range(10)), check_duplicates=False)
+        gr.add_edges_from(((str(i), str(i + 1), i) for i in range(9)), check_duplicates=False)
+        assert gr.order() == 10
+        assert gr.get_edge_weight(("3", "4")) == 3
+        # Повтор без проверки пропускается и не портит счётчик рёбер
+        gr.add_edges_from([("4", "3", 10), ("0", "9")], check_duplicates=False)
+        assert len(gr.edges()) == len(list(gr.edges())) == 10
+        assert gr.get_edge_weight(("3", "4")) == 3
+        assert gr._structure_hash == gr._compute_structure_hash()
+
+    def test_node_ids_are_reused_after_deletion(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("1", "1"))
+        gr.del_node("1")
+        gr.add_node("3")
+        assert len(gr._names) == 3
+        assert list(gr.nodes()) == ["0", "2", "3"]
+        assert list(gr.neighbors("3")) == []
+        assert list(gr.neighbors("0")) == []
+        gr.add_edge(("0", "3"))
+        assert list(gr.neighbors("0")) == ["3"]
+        assert gr.has_edge(("0", "3"))
+        assert not gr.has_edge(("0", "1"))
+
+    def test_edges_count_after_deletions(self):
+        gr = new_graph(25, 120)
+        gr.add_edge(("3", "3"))
+        gr.add_edge(("5", "5"))
+        for node in ["0", "3", "7"]:
+            gr.del_node(node)
+        gr.del_edge(next(iter(gr.edges())))
+        assert len(gr.edges()) == len(list(gr.edges()))
+
+    def test_undirected_edge_attributes_are_shared(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.add_edges_from([("0", "1", 5), ("1", "2")])
+        gr.add_edge_attribute(("1", "0"), "key", "value")
+        gr.set_edge_weight(("2", "1"), 7)
+        assert gr.get_edge_attributes(("0", "1"))["key"] == "value"
+        assert gr.get_edge_weight(("1", "2")) == 7
+        assert gr.get_edge_weight(("1", "0")) == 5
+        gr.del_edge_attribute(("0", "1"), "key")
+        assert "key" not in gr.get_edge_attributes(("1", "0"))
+        gr.del_edge(("1", "0"))
+        assert not gr.has_edge(("0", "1"))
+        assert len(gr.edges()) == 1
+
+    def test_tracked_components(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.track_components()
+        gr.add_node("3")
+        gr.add_nodes_from(["4", "5"])
+        assert gr.components_count() == 6
+        gr.add_edge(("0", "1"))
+        gr.add_edges_from([("1", "2"), ("3", "4")])
+        assert gr.same_component("0", "2") and gr.same_component("4", "3")
+        assert not gr.same_component("0", "3")
+        assert gr.components_count() == 3
+        with self.assertRaises(AdditionError):
+            gr.add_edges_from([("2", "3"), ("0", "1")])
+        assert not gr.same_component("0", "3")
+        gr.del_edge(("1", "2"))
+        assert not gr.same_component("0", "2") and gr.components_count() == 4
+        gr.del_node("0")
+        gr.add_node("6")
+        gr.add_edge(("6", "1"))
+        assert gr.same_component("1", "6") and not gr.same_component("6", "2")
+        with self.assertRaises(GraphError):
+            gr.same_component("0", "1")
+
+    def test_components_match_untracked(self):
+        gr = new_graph(60, 50)
+        tracked = deepcopy(gr)
+        tracked.track_components()
+        for u, v in [("0", "1"), ("2", "3"), ("4", "5"), ("0", "5")]:
+            if not gr.has_edge((u, v)):
+                gr.add_edge((u, v))
+                tracked.add_edge((u, v))
+        assert gr.components_count() == tracked.components_count()
+        for node in gr.nodes():
+            assert gr.same_component("0", node) == tracked.same_component("0", node)
+
+    def test_structure_hash_is_maintained(self):
+        gr = new_graph(30, 60)
+        gr.add_node("extra")
+        gr.add_edge(("extra", "0"))
+        gr.add_edge(("extra", "extra"))
+        gr.del_edge(next(edge for edge in gr.edges() if "extra" not in edge))
+        gr.del_node("1")
+        with self.assertRaises(AdditionError):
+            gr.add_edges_from([("extra", "2"), ("extra", "0")])
+        with self.assertRaises(AdditionError):
+            gr.add_nodes_from(["new", "extra"])
+        assert gr._structure_hash == gr._compute_structure_hash()
+        assert deepcopy(gr)._structure_hash == gr._structure_hash
+
+    def test_equality_short_circuits(self):
+        gr = Graph("TestGraph")
+        gr2 = Graph("TestGraph")
+        for g in (gr, gr2):
+            g.add_nodes_from(["0", "1", "2", "3"])
+        gr.add_edges_from([("0", "1"), ("2", "3")])
+        gr2.add_edges_from([("0", "2"), ("1", "3")])
+        assert gr._structure_hash != gr2._structure_hash
+        assert gr != gr2
+        gr2.del_edge(("0", "2"))
+        gr2.del_edge(("1", "3"))
+        gr2.add_edges_from([("2", "3"), ("0", "1")])
+        assert gr == gr2
+        assert gr == gr.freeze() and gr.freeze() == gr
+        gr2.del_edge(("2", "3"))
+        assert gr != gr2
+
+    def test_equality_with_digraph(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["a", "b"])
+        gr.add_edge(("a", "b"))
+        di = DiGraph("TestGraph")
+        di.add_nodes_from(["a", "b"])
+        di.add_edge(("a", "b"))
+        assert gr != di
+        assert di != gr
+        di.add_edge(("b", "a"))
+        assert gr == di
+        assert di == gr
+        di.set_edge_weight(("b", "a"), 5)
+        assert gr != di
+        assert di != gr
+
 
 if __name__ == "__main__":
     unittest.main()
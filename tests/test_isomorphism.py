@@ -58,5 +58,65 @@ class TestIso(unittest.TestCase):
 
         assert isomorphism(g1, g2) == t
 
+    def test_regular_graphs(self):
+        # Два треугольника и шестиугольник неразличимы уточнением раскраски
+        gr1 = Graph("Triangles")
+        gr1.add_nodes_from([str(i) for i in range(6)])
+        gr1.add_edges_from([("0", "1"), ("1", "2"), ("2", "0"), ("3", "4"), ("4", "5"), ("5", "3")])
+        gr2 = Graph("Hexagon")
+        gr2.add_nodes_from([str(i) for i in range(6)])
+        gr2.add_edges_from((str(i), str((i + 1) % 6)) for i in range(6))
+        assert isomorphism(gr1, gr2) is False
+        gr3 = Graph("Hexagon")
+        gr3.add_nodes_from([str(i) for i in range(6)])
+        gr3.add_edges_from((str(i * 5 % 6), str((i + 1) * 5 % 6)) for i in range(6))
+        phi = isomorphism(gr2, gr3)
+        assert all(gr3.has_edge((phi[u], phi[v])) for u, v in gr2.edges())
+
+    def test_edge_direction_matters(self):
+        gr1 = DiGraph("Path")
+        gr1.add_nodes_from(["a", "b", "c"])
+        gr1.add_edges_from([("a", "b"), ("b", "c")])
+        gr2 = DiGraph("Star")
+        gr2.add_nodes_from(["a", "b", "c"])
+        gr2.add_edges_from([("a", "b"), ("c", "b")])
+        assert isomorphism(gr1, gr2) is False
+        gr3 = DiGraph("Path")
+        gr3.add_nodes_from(["x", "y", "z"])
+        gr3.add_edges_from([("z", "y"), ("y", "x")])
+        assert isomorphism(gr1, gr3) == {"a": "z", "b": "y", "c": "x"}
+        assert isomorphism(gr1, Graph("Other")) is False
+
+    def test_labels_and_weights(self):
+        gr1 = Graph("Square")
+        gr2 = Graph("Square")
+        for gr in (gr1, gr2):
+            gr.add_nodes_from(["0", "1", "2", "3"])
+        gr1.add_edges_from([("0", "1", 1, "a"), ("1", "2", 1, "b"), ("2", "3", 2, "a"), ("3", "0", 2, "b")])
+        gr2.add_edges_from([("0", "1", 2, "b"), ("1", "2", 1, "a"), ("2", "3", 1, "b"), ("3", "0", 2, "a")])
+        phi = isomorphism(gr1, gr2, match_labels=True, match_weights=True)
+        for u, v in gr1.edges():
+            assert gr1.get_edge_attributes((u, v)) == gr2.get_edge_attributes((phi[u], phi[v]))
+        gr2.set_edge_label(("1", "2"), "b")
+        gr2.set_edge_label(("2", "3"), "a")
+        assert isomorphism(gr1, gr2)
+        assert isomorphism(gr1, gr2, match_weights=True)
+        assert isomorphism(gr1, gr2, match_labels=True) is False
+        gr1.set_node_weight("0", 5)
+        assert isomorphism(gr1, gr2, match_weights=True) is False
+        assert isomorphism(gr1, gr2)
+
+    def test_long_path(self):
+        gr1 = Graph("Path")
+        gr2 = Graph("Path")
+        nodes = [str(i) for i in range(3000)]
+        for gr in (gr1, gr2):
+            gr.add_nodes_from(nodes)
+        gr1.add_edges_from((str(i), str(i + 1)) for i in range(2999))
+        gr2.add_edges_from((str(2999 - i), str(2998 - i)) for i in range(2999))
+        phi = isomorphism(gr1, gr2)
+        assert phi and all(gr2.has_edge((phi[u], phi[v])) for u, v in gr1.edges())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from time import monotonic
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.exceptions import NodeNotFoundError
+from pygraph.algorithms.paths import iter_paths
+
+
+class TestPaths(unittest.TestCase):
+    def setUp(self):
+        self.gr = Graph("TestGraph")
+        self.gr.add_nodes_from(["1", "2", "3", "4", "5"])
+        self.gr.add_edges_from([("1", "1"), ("1", "2"), ("1", "3"), ("1", "4"), ("1", "5"),
+                                ("2", "5"), ("3", "5"), ("4", "5"), ("2", "3")])
+
+    def test_all_paths(self):
+        paths = list(iter_paths(self.gr, "1", "5"))
+        assert len(paths) == 6
+        assert ["1", "5"] in paths and ["1", "2", "3", "5"] in paths and ["1", "3", "2", "5"] in paths
+        for path in paths:
+            assert path[0] == "1" and path[-1] == "5"
+            assert len(set(path)) == len(path)
+            assert all(self.gr.has_edge(edge) for edge in zip(path, path[1:]))
+
+    def test_shortest_first(self):
+        lengths = [len(path) for path in iter_paths(self.gr, "1", "5", shortest_first=True)]
+        assert lengths == sorted(lengths)
+        assert len(lengths) == 6
+
+    def test_max_depth(self):
+        paths = list(iter_paths(self.gr, "1", "5", max_depth=2))
+        assert sorted(paths) == [["1", "2", "5"], ["1", "3", "5"], ["1", "4", "5"], ["1", "5"]]
+        paths = list(iter_paths(self.gr, "1", "5", max_depth=2, shortest_first=True))
+        assert paths[0] == ["1", "5"] and len(paths) == 4
+        # Даже прямое ребро длиннее нулевого ограничения
+        assert list(iter_paths(self.gr, "1", "5", max_depth=0)) == []
+        assert list(iter_paths(self.gr, "1", "5", max_depth=0, shortest_first=True)) == []
+
+    def test_max_paths(self):
+        assert len(list(iter_paths(self.gr, "1", "5", max_paths=3))) == 3
+        assert list(iter_paths(self.gr, "1", "5", max_paths=1, shortest_first=True)) == [["1", "5"]]
+
+    def test_deadline(self):
+        gr = Graph("Complete")
+        gr.add_nodes_from([str(i) for i in range(12)])
+        gr.add_edges_from((str(i), str(j)) for i in range(12) for j in range(i + 1, 12))
+        assert list(iter_paths(gr, "0", "11", deadline=monotonic())) == []
+        paths = iter_paths(gr, "0", "11", deadline=monotonic() + 0.05)
+        assert sum(1 for _ in paths) < 9864101
+
+    def test_is_lazy(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from([str(i) for i in range(30)])
+        gr.add_edges_from((str(i), str(j)) for i in range(30) for j in range(i + 1, 30))
+        paths = iter_paths(gr, "0", "29")
+        assert next(paths) == [str(i) for i in range(30)]
+
+    def test_unreachable_and_missing_nodes(self):
+        gr = DiGraph("TestGraph")
+        gr.add_nodes_from(["1", "2"])
+        gr.add_edge(("2", "1"))
+        assert list(iter_paths(gr, "1", "2")) == []
+        with self.assertRaises(NodeNotFoundError):
+            iter_paths(gr, "1", "3")
@@ -1,7 +1,9 @@
+import io
 import unittest
 from pygraph.graph import Graph
 from pygraph.digraph import DiGraph
-from pygraph.readwrite import read, write
+from pygraph.exceptions import AdditionError, GraphError
+from pygraph.readwrite import read, read_from, write, write_to
 from tests.graph_generator import new_graph, new_digraph
 
 
@@ -79,6 +81,86 @@ class TestReadWrite(unittest.TestCase):
 
         assert gr1 == recovered_graph
 
+    def test_read_in_small_chunks(self):
+        gr = new_graph(25, 120)
+        dotstr = write(gr)
+        for chunk_size in (1, 3, 64):
+            assert read_from(io.StringIO(dotstr), chunk_size=chunk_size) == read(dotstr)
+        assert read_from(io.StringIO(dotstr), columnar=True).columnar
+
+    def test_read_common_syntax(self):
+        dotstr = """
+        /* комментарий */
+        strict digraph "Test" + "Graph" {
+            rankdir=LR;  // атрибут графа
+            node [shape=box, weight=2]
+            edge [color=red];
+            a -> b -> c [label="a \\"b\\"", weight=4];
+            "d e":port -> <x<b>y</b>> [style=dashed][penwidth=2]
+            a [label=first; weight=3]
+        }
+        """
+        gr = read_from(io.StringIO(dotstr), chunk_size=5)
+        assert gr.name == "TestGraph"
+        assert gr.weighted
+        assert set(gr.nodes()) == {"a", "b", "c", "d e", "x<b>y</b>"}
+        assert set(gr.edges()) == {("a", "b"), ("b", "c"), ("d e", "x<b>y</b>")}
+        assert gr.get_edge_label(("b", "c")) == 'a "b"'
+        assert gr.get_edge_weight(("a", "b")) == 4
+        assert gr.get_edge_attributes(("a", "b"))["color"] == "red"
+        assert gr.get_edge_attributes(("d e", "x<b>y</b>"))["penwidth"] == "2"
+        assert gr.get_node_attributes("c")["shape"] == "box"
+        assert gr.get_node_weight("c") == 2
+        assert gr.get_node_weight("a") == 3
+        assert gr.get_node_label("a") == "first"
+
+    def test_read_errors(self):
+        for dotstr in ("graph G { a -> b }", "graph G { a -- b", "graph G { a [label=\"x] }",
+                       "graph G { subgraph s { a } }", "graph G { a } graph H { b }",
+                       "graph G { a [weight=x] }", "graph G { a ! b }"):
+            with self.assertRaises(GraphError):
+                read(dotstr)
+        with self.assertRaisesRegex(GraphError, "->"):
+            read("graph G { a -- b -> c }")
+
+    def test_read_strict(self):
+        gr = read("strict graph G { a -- b [color=red]; b -- a [weight=3]; a -- a }")
+        assert len(gr.edges()) == 2
+        assert gr.get_edge_weight(("a", "b")) == 3
+        assert gr.get_edge_attributes(("a", "b"))["color"] == "red"
+        gr = read("strict digraph G { a -> b; b -> a; a -> b [label=x] }")
+        assert len(gr.edges()) == 2 and gr.get_edge_label(("a", "b")) == "x"
+        with self.assertRaises(AdditionError):
+            read("graph G { a -- b; b -- a }")
+
+    def test_write_to_file_object(self):
+        gr = new_graph(25, 120)
+        output = io.StringIO()
+        write_to(gr, output)
+        assert output.getvalue() == write(gr)
+        assert read(write(gr.freeze())) == gr
+        # Запись не удаляет вес у невзвешенного графа
+        assert "weight" in gr.get_node_attributes("0")
+        assert "weight" not in write(gr)
+
+    def test_write_names_with_dashes(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["a-b", "c", "a", "b-c"])
+        gr.add_edges_from([("a-b", "c"), ("a", "b-c")])
+        recovered = read(write(gr))
+        assert set(recovered.edges()) == set(gr.edges())
+
+    def test_write_backslashes(self):
+        gr = Graph("TestGraph")
+        gr.add_node("a\\", label="a\\")
+        gr.add_node('b\\"c', label="\\\\")
+        gr.add_edge(("a\\", 'b\\"c'), label='x\\"')
+        recovered = read(write(gr))
+        assert recovered == gr
+        assert recovered.get_node_label("a\\") == "a\\"
+        assert recovered.get_node_label('b\\"c') == "\\\\"
+        assert recovered.get_edge_label(("a\\", 'b\\"c')) == 'x\\"'
+
 
 if __name__ == "__main__":
     unittest.main()
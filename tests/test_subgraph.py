@@ -0,0 +1,94 @@
+import unittest
+from itertools import permutations
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.algorithms.check_subgraph import is_subgraph
+from pygraph.algorithms.isomorphism import iter_subgraph_isomorphisms, subgraph_isomorphism
+from tests.graph_generator import new_graph, new_digraph
+
+
+def brute_force_matches(graph, pattern, induced: bool) -> list:
+    matches = []
+    pattern_nodes = list(pattern.nodes())
+    for images in permutations(graph.nodes(), len(pattern_nodes)):
+        phi = dict(zip(pattern_nodes, images))
+        if induced:
+            ok = all(pattern.has_edge((u, v)) == graph.has_edge((phi[u], phi[v]))
+                     for u in pattern_nodes for v in pattern_nodes)
+        else:
+            ok = all(graph.has_edge((phi[u], phi[v])) for u, v in pattern.edges())
+        if ok:
+            matches.append(phi)
+    return matches
+
+
+class TestSubgraph(unittest.TestCase):
+    def test_triangle_in_square_with_diagonal(self):
+        gr = Graph("Square")
+        gr.add_nodes_from(["a", "b", "c", "d"])
+        gr.add_edges_from([("a", "b"), ("b", "c"), ("c", "d"), ("d", "a"), ("a", "c")])
+        triangle = Graph("Triangle")
+        triangle.add_nodes_from(["1", "2", "3"])
+        triangle.add_edges_from([("1", "2"), ("2", "3"), ("3", "1")])
+        # Два треугольника, у каждого 6 автоморфизмов
+        assert len(list(iter_subgraph_isomorphisms(gr, triangle))) == 12
+        found, subg = is_subgraph(gr, triangle)
+        assert found and subg.order() == 3 and len(subg.edges()) == 3
+        assert "a" in subg.nodes() and "c" in subg.nodes()
+
+    def test_induced_and_not_induced(self):
+        gr = Graph("Complete")
+        gr.add_nodes_from(["a", "b", "c", "d"])
+        gr.add_edges_from([(u, v) for u in "abcd" for v in "abcd" if u < v])
+        path = Graph("Path")
+        path.add_nodes_from(["1", "2", "3"])
+        path.add_edges_from([("1", "2"), ("2", "3")])
+        assert subgraph_isomorphism(gr, path) is False
+        assert is_subgraph(gr, path) == (False, None)
+        assert len(list(iter_subgraph_isomorphisms(gr, path, induced=False))) == 24
+
+    def test_directed_cycle(self):
+        gr = DiGraph("Cycle")
+        gr.add_nodes_from(["a", "b", "c", "d"])
+        gr.add_edges_from([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+        cycle = DiGraph("Triangle")
+        cycle.add_nodes_from(["1", "2", "3"])
+        cycle.add_edges_from([("1", "2"), ("2", "3"), ("3", "1")])
+        # Направление учитывается: три поворота цикла, без отражений
+        assert len(list(iter_subgraph_isomorphisms(gr, cycle))) == 3
+        found, subg = is_subgraph(gr, cycle)
+        assert found and isinstance(subg, DiGraph) and len(subg.edges()) == 3
+        cycle.del_edge(("3", "1"))
+        cycle.add_edge(("1", "3"))
+        assert subgraph_isomorphism(gr, cycle) is False
+
+    def test_labels(self):
+        gr = Graph("Labeled")
+        gr.add_nodes_from([("a", 1, "x"), ("b", 1, "y"), ("c", 1, "x")])
+        gr.add_edges_from([("a", "b"), ("b", "c")])
+        pattern = Graph("Pattern")
+        pattern.add_nodes_from([("1", 1, "x"), ("2", 1, "x")])
+        pattern.add_edge(("1", "2"))
+        assert subgraph_isomorphism(gr, pattern)
+        assert subgraph_isomorphism(gr, pattern, match_labels=True) is False
+        pattern.set_node_label("2", "y")
+        assert subgraph_isomorphism(gr, pattern, match_labels=True) == {"1": "a", "2": "b"}
+
+    def test_streaming(self):
+        gr = new_graph(300, 3000)
+        pattern = Graph("Edge")
+        pattern.add_nodes_from(["1", "2"])
+        pattern.add_edge(("1", "2"))
+        matches = iter_subgraph_isomorphisms(gr, pattern)
+        phi = next(matches)
+        assert gr.has_edge((phi["1"], phi["2"]))
+        assert next(matches) != phi
+
+    def test_random_graphs(self):
+        for _ in range(5):
+            for gr, pattern in ((new_graph(7, 10), new_graph(4, 3)), (new_digraph(6, 12), new_digraph(3, 3))):
+                for induced in (True, False):
+                    expected = brute_force_matches(gr, pattern, induced)
+                    found = list(iter_subgraph_isomorphisms(gr, pattern, induced))
+                    assert len(found) == len(expected)
+                    assert all(phi in expected for phi in found)
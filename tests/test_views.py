@@ -0,0 +1,66 @@
+import unittest
+
+from pygraph.graph import Graph
+from pygraph.digraph import DiGraph
+from pygraph.views import NodeView, NeighborView, EdgeView
+
+
+class TestViews(unittest.TestCase):
+    def test_node_view_is_live(self):
+        gr = Graph("TestGraph")
+        nodes = gr.nodes()
+        assert isinstance(nodes, NodeView)
+        assert len(nodes) == 0
+        gr.add_node("0")
+        gr.add_node("1")
+        assert len(nodes) == 2
+        assert "0" in nodes
+        assert list(nodes) == ["0", "1"]
+        gr.del_node("0")
+        assert "0" not in nodes
+        assert list(nodes) == ["1"]
+
+    def test_neighbor_view(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        neighbors = gr.neighbors("0")
+        reverse_neighbors = gr.reverse_neighbors("2")
+        assert isinstance(neighbors, NeighborView)
+        gr.add_edge(("0", "2"))
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("1", "2"))
+        assert list(neighbors) == ["2", "1"]
+        assert list(reverse_neighbors) == ["0", "1"]
+        assert "1" in neighbors and "0" not in neighbors
+        assert len(reverse_neighbors) == 2
+
+    def test_edge_view(self):
+        gr = DiGraph("TestDiGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        edges = gr.edges()
+        assert isinstance(edges, EdgeView)
+        gr.add_edge(("0", "1"))
+        gr.add_edge(("1", "2"))
+        assert len(edges) == 2
+        assert ("0", "1") in edges
+        assert ("1", "0") not in edges
+        assert ("0", "missing") not in edges
+        assert "0" not in edges
+        assert sorted(edges) == [("0", "1"), ("1", "2")]
+
+    def test_views_compare_as_sets(self):
+        gr = Graph("TestGraph")
+        gr.add_nodes_from(["0", "1", "2"])
+        gr.add_edge(("0", "1"))
+        gr2 = Graph("TestGraph")
+        gr2.add_nodes_from(["2", "1", "0"])
+        gr2.add_edge(("1", "0"))
+        assert gr.nodes() == gr2.nodes()
+        assert gr.edges() == gr2.edges()
+        assert gr.nodes() == {"0", "1", "2"}
+        assert gr.nodes() - {"0"} == {"1", "2"}
+        assert gr.neighbors("0") & {"1", "2"} == {"1"}
+
+
+if __name__ == "__main__":
+    unittest.main()